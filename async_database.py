@@ -0,0 +1,216 @@
+##############################
+# 프로그램명: 성적관리 프로그램 (MongoDB 비동기 버전)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - MongoGradeManager와 같은 기능(추가, 삭제, 검색, 정렬, 통계, 등수)을
+#     asyncio 기반 motor 드라이버로 제공
+#   - 하나의 이벤트 루프에서 수백 개의 동시 요청이 연결 풀을 공유
+#   - 연결 풀 크기, 타임아웃, 동시 실행 수 제한을 설정 가능
+#
+# 사용 예:
+#   async with AsyncMongoGradeManager(max_pool_size=50) as manager:
+#       await manager.add_student("2025001", "홍길동", 90, 85, 100)
+#       print(await manager.search_student("홍길동"))
+##############################
+
+import asyncio
+import logging
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError, OperationFailure
+
+from database import (DISPLAY_FIELDS, INDEXES, SORT_KEYS, SUMMARY_ID, Student,
+                      build_summary, summary_pipeline, summary_update)
+
+
+class AsyncMongoGradeManager:
+    def __init__(self, connection_string="mongodb://localhost:27017/", db_name="grade_management",
+                 max_pool_size=100, min_pool_size=0, timeout_ms=5000, max_concurrency=200,
+                 client=None):
+        """
+        비동기 MongoDB 연결 설정 (실제 연결과 인덱스 생성은 connect()에서 수행)
+        max_pool_size / min_pool_size: 드라이버 연결 풀 크기
+        timeout_ms: 서버 선택, 연결, 소켓 타임아웃 (밀리초)
+        max_concurrency: 동시에 실행할 수 있는 데이터베이스 작업 수
+        client: 미리 만든 클라이언트 (테스트용 대체 클라이언트 등), None이면 새로 생성
+        """
+        self.client = client or AsyncIOMotorClient(
+            connection_string,
+            maxPoolSize=max_pool_size,
+            minPoolSize=min_pool_size,
+            serverSelectionTimeoutMS=timeout_ms,
+            connectTimeoutMS=timeout_ms,
+            socketTimeoutMS=timeout_ms,
+        )
+        self.db = self.client[db_name]
+        self.collection = self.db.students
+        self.summary = self.db.statistics
+        self._limit = asyncio.Semaphore(max_concurrency)
+        # 세마포어는 동시 실행 수만 제한하므로, 등수를 바꾸는 쓰기(등수 계산 → 저장 → 다른 학생 등수 이동)와
+        # 전체 재계산은 이 잠금으로 한 번에 하나씩 실행 (await 사이에 다른 쓰기가 끼어들면 등수가 겹치거나 빠짐)
+        self._write_lock = asyncio.Lock()
+
+    async def connect(self):
+        """서버 연결 확인 및 인덱스 생성"""
+        try:
+            await self.db.command("ping")
+            for keys, options in INDEXES:
+                await self.collection.create_index(keys, **options)
+        except Exception as e:
+            logging.error(f"MongoDB connection failed: {e}")
+            raise
+        return self
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self.close_connection()
+
+    async def add_student(self, student_id, name, english, c_language, python):
+        """새 학생 추가 후 저장된 문서 반환 (이미 있는 학번이면 None)"""
+        student = Student(student_id, name, english, c_language, python)
+        async with self._write_lock, self._limit:
+            student.rank = await self.collection.count_documents({"total": {"$gt": student.total}}) + 1
+            try:
+                await self.collection.insert_one(student.to_dict())
+            except DuplicateKeyError:
+                return None
+            # 새 학생보다 총점이 낮은 학생만 등수가 밀림
+            await self.collection.update_many(
+                {"total": {"$lt": student.total}},
+                {"$inc": {"rank": 1}, "$currentDate": {"updated_at": True}}
+            )
+            result = await self.summary.update_one({"_id": SUMMARY_ID}, summary_update(student.to_dict(), 1))
+            if result.matched_count == 0:
+                # 요약 문서가 없으면 이 학생 한 명만 센 요약을 만들지 않고 전체를 다시 집계
+                await self._rebuild_summary()
+        return student.to_dict()
+
+    async def delete_student(self, student_id):
+        """학생 삭제 (삭제되면 True)"""
+        async with self._write_lock, self._limit:
+            student_data = await self.collection.find_one_and_delete({"student_id": student_id})
+            if student_data is None:
+                return False
+            await self.collection.update_many(
+                {"total": {"$lt": student_data["total"]}},
+                {"$inc": {"rank": -1}, "$currentDate": {"updated_at": True}}
+            )
+            await self._summary_after_delete(student_data)
+        return True
+
+    async def _summary_after_delete(self, student_data):
+        """삭제를 요약 문서에 반영 (최고/최저 총점이 빠지면 인덱스로 다시 찾음)"""
+        summary = await self.summary.find_one_and_update(
+            {"_id": SUMMARY_ID}, summary_update(student_data, -1),
+            return_document=ReturnDocument.AFTER
+        )
+        if summary is None:
+            return
+        if summary["count"] <= 0:
+            await self.summary.update_one({"_id": SUMMARY_ID}, {"$unset": {"min_total": "", "max_total": ""}})
+        elif student_data["total"] in (summary.get("min_total"), summary.get("max_total")):
+            lowest = await self.collection.find_one({}, {"total": 1}, sort=[("total", 1)])
+            highest = await self.collection.find_one({}, {"total": 1}, sort=[("total", -1)])
+            await self.summary.update_one(
+                {"_id": SUMMARY_ID},
+                {"$set": {"min_total": lowest["total"], "max_total": highest["total"]}}
+            )
+
+    async def search_student(self, key):
+        """학번 또는 이름이 일치하는 학생 문서 목록"""
+        async with self._limit:
+            cursor = self.collection.find({"$or": [{"student_id": key}, {"name": key}]}, DISPLAY_FIELDS)
+            return await cursor.to_list(length=None)
+
+    async def sort_students_by_total(self, limit=None):
+        """총점 내림차순 학생 목록 (limit 지정 시 상위 limit명)"""
+        async with self._limit:
+            cursor = self.collection.find({}, DISPLAY_FIELDS).sort(SORT_KEYS["total"])
+            if limit:
+                cursor = cursor.limit(limit)
+            return await cursor.to_list(length=None)
+
+    async def count_above_80(self):
+        """평균 80점 이상 학생 수 (요약 문서에서 조회)"""
+        summary = await self.get_statistics()
+        return summary["above"].get("80", 0)
+
+    async def get_statistics(self):
+        """통계 요약 문서 조회 (없으면 한 번 다시 만듦)"""
+        async with self._limit:
+            summary = await self.summary.find_one({"_id": SUMMARY_ID})
+        if summary is None:
+            summary = await self.rebuild_statistics()
+        return summary
+
+    async def rebuild_statistics(self):
+        """전체 컬렉션을 한 번 집계하여 요약 문서를 다시 만듦"""
+        async with self._write_lock, self._limit:
+            return await self._rebuild_summary()
+
+    async def _rebuild_summary(self):
+        rows = await self.collection.aggregate(summary_pipeline()).to_list(length=None)
+        summary = build_summary(rows)
+        await self.summary.replace_one({"_id": SUMMARY_ID}, summary, upsert=True)
+        return summary
+
+    async def calculate_ranks(self):
+        """전체 등수를 서버에서 계산하여 일괄 저장 (5.0 미만 서버는 bulk_write로 대체)"""
+        pipeline = [
+            {"$setWindowFields": {
+                "sortBy": {"total": -1},
+                "output": {"rank": {"$rank": {}}}
+            }},
+            {"$project": {"rank": 1, "updated_at": "$$NOW"}},
+            {"$merge": {
+                "into": self.collection.name,
+                "on": "_id",
+                "whenMatched": "merge",
+                "whenNotMatched": "discard"
+            }}
+        ]
+        async with self._write_lock, self._limit:
+            try:
+                await self.collection.aggregate(pipeline).to_list(length=None)
+            except OperationFailure:
+                await self._calculate_ranks_bulk()
+
+    async def _calculate_ranks_bulk(self):
+        requests = []
+        rank = 1
+        prev_total = None
+        i = 0
+        async for student_data in self.collection.find({}, {"total": 1, "rank": 1}).sort("total", -1):
+            if prev_total is None or student_data["total"] != prev_total:
+                rank = i + 1
+            if student_data.get("rank") != rank:
+                requests.append(UpdateOne(
+                    {"_id": student_data["_id"]},
+                    {"$set": {"rank": rank}, "$currentDate": {"updated_at": True}}
+                ))
+            prev_total = student_data["total"]
+            i += 1
+
+        if requests:
+            await self.collection.bulk_write(requests, ordered=False)
+
+    def close_connection(self):
+        """MongoDB 연결 종료"""
+        if self.client:
+            self.client.close()
+
+
+async def _demo():
+    """동시 조회 예시: 여러 검색을 하나의 이벤트 루프에서 동시에 실행"""
+    async with AsyncMongoGradeManager() as manager:
+        keys = [f"{i:07d}" for i in range(100)]
+        results = await asyncio.gather(*(manager.search_student(key) for key in keys))
+        print(f"동시 검색 {len(keys)}건 완료, 찾은 학생 수: {sum(len(r) for r in results)}명")
+        print(await manager.get_statistics())
+
+
+if __name__ == "__main__":
+    asyncio.run(_demo())
@@ -0,0 +1,249 @@
+##############################
+# 프로그램명: 성적관리 일괄 처리 프로그램 (명령줄 버전)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 표준입력 또는 파일의 명령(JSONL / CSV)을 묶음 단위로 실행
+#   - 명령: add(추가), delete(삭제), search(검색), stats(통계), export(내보내기)
+#     op가 없는 줄은 학생 레코드로 보고 add로 처리
+#   - 저장소는 storage.py의 공통 인터페이스로 메모리(GradeManager) 또는 MongoDB(MongoGradeManager) 선택
+#   - 쓰기는 모아 두었다가 읽기 전/묶음 끝에서 한 번에 반영
+#     (MongoDB는 많이 모였을 때만 일괄 저장 후 등수/통계 전체 재계산, 적으면 증분 갱신)
+#   - 결과는 JSONL 또는 CSV로 출력
+#
+# 사용 예:
+#   python batch_cli.py commands.jsonl --backend memory --data-dir grade_data
+#   cat students.csv | python batch_cli.py - --input-format csv --output-format csv
+##############################
+
+import argparse
+import csv
+import json
+import sys
+from contextlib import redirect_stdout
+from itertools import islice
+
+from storage import STUDENT_FIELDS, open_backend
+
+SCORE_FIELDS = ("english", "c_language", "python")
+STATS_FIELDS = ("count", "avg_total", "max_total", "min_total", "above_80")
+RESULT_FIELDS = ("op", "ok", "message") + STUDENT_FIELDS + STATS_FIELDS
+
+
+def student_fields(command):
+    """add 명령에서 (학번, 이름, 영어, C-언어, 파이썬) 추출 (잘못되면 ValueError)"""
+    student_id = str(command.get("student_id") or "").strip()
+    name = str(command.get("name") or "").strip()
+    if not student_id or not name:
+        raise ValueError("학번과 이름은 비어 있을 수 없습니다.")
+    try:
+        scores = [int(command[field]) for field in SCORE_FIELDS]
+    except KeyError as e:
+        raise ValueError(f"{e.args[0]} 점수가 없습니다.")
+    except (TypeError, ValueError):
+        raise ValueError("점수는 숫자여야 합니다.")
+    return [student_id, name] + scores
+
+
+def student_row(student_data):
+    """저장소가 돌려준 학생 딕셔너리를 결과 행으로"""
+    return {field: student_data.get(field) for field in STUDENT_FIELDS}
+
+
+class BatchSession:
+    """
+    저장소(storage.StorageBackend)에 명령을 실행
+    쓰기는 모아 두었다가 읽기 명령 전이나 묶음 끝에서 apply_writes로 한 번에 반영
+    (MongoDB는 모인 쓰기가 많을 때만 일괄 저장 후 등수/통계를 다시 계산하고, 적으면 증분 갱신)
+    """
+
+    FAILURES = {
+        "add": "이미 존재하는 학번입니다.",
+        "delete": "해당 학번의 학생을 찾을 수 없습니다.",
+    }
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.pending = []   # ((쓰기 종류, 인자), 결과 행)
+
+    def add(self, fields):
+        result = {"ok": True, "student_id": fields[0]}
+        self.pending.append((("add", tuple(fields)), result))
+        return [result]
+
+    def delete(self, student_id):
+        result = {"ok": True, "student_id": student_id}
+        self.pending.append((("delete", student_id), result))
+        return [result]
+
+    def search(self, key):
+        self.flush()
+        return [dict(student_row(data), ok=True) for data in self.backend.search(key)]
+
+    def stats(self):
+        self.flush()
+        summary = self.backend.statistics()
+        return {field: summary[field] for field in STATS_FIELDS if field in summary}
+
+    def export(self):
+        self.flush()
+        return (student_row(data) for data in self.backend.ranked())
+
+    def flush(self):
+        """모아 둔 쓰기를 순서대로 반영하고 반영하지 못한 항목의 결과 행을 고침"""
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+        applied = self.backend.apply_writes([write for write, _ in pending])
+        for ((kind, _), result), ok in zip(pending, applied):
+            if not ok:
+                result.update(ok=False, message=self.FAILURES[kind])
+
+    def close(self):
+        self.flush()
+        self.backend.close()
+
+
+def check_command(command):
+    """JSON 객체가 아니거나 op가 문자열이 아닌 명령은 그 줄의 오류로 보고할 invalid 명령으로 바꿈"""
+    if not isinstance(command, dict):
+        return {"op": "invalid", "message": f"명령은 JSON 객체여야 합니다: {json.dumps(command, ensure_ascii=False, default=str)[:60]}"}
+    op = command.get("op")
+    if op is not None and not isinstance(op, str):
+        return {"op": "invalid", "message": f"op는 문자열이어야 합니다: {json.dumps(op, ensure_ascii=False, default=str)[:60]}"}
+    return command
+
+
+def command_op(command):
+    return (command.get("op") or "add").strip().lower()
+
+
+def read_commands(stream, input_format):
+    """입력 스트림에서 명령 딕셔너리를 하나씩 생성"""
+    if input_format == "csv":
+        for row in csv.DictReader(stream):
+            yield row
+        return
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            command = json.loads(line)
+        except ValueError as e:
+            yield {"op": "invalid", "message": f"JSON 형식 오류: {e}"}
+        else:
+            yield check_command(command)
+
+
+class ResultWriter:
+    def __init__(self, stream, output_format):
+        self.stream = stream
+        self.csv = None
+        if output_format == "csv":
+            self.csv = csv.DictWriter(stream, fieldnames=RESULT_FIELDS, extrasaction="ignore")
+            self.csv.writeheader()
+
+    def write(self, row):
+        if self.csv:
+            self.csv.writerow(row)
+        else:
+            self.stream.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+
+
+def execute(session, command):
+    """명령 하나를 실행하고 결과 행 목록(또는 생성기) 반환"""
+    command = check_command(command)
+    op = command_op(command)
+    try:
+        if op == "add":
+            rows = session.add(student_fields(command))
+        elif op == "delete":
+            rows = session.delete(str(command.get("student_id", "")).strip())
+        elif op == "search":
+            rows = session.search(str(command.get("key", "")).strip())
+            if not rows:
+                rows = [{"ok": False, "message": "해당 조건의 학생을 찾을 수 없습니다."}]
+        elif op == "stats":
+            rows = [dict(session.stats(), ok=True)]
+        elif op == "export":
+            rows = (dict(row, ok=True) for row in session.export())
+        elif op == "invalid":
+            rows = [{"ok": False, "message": command.get("message")}]
+        else:
+            rows = [{"ok": False, "message": f"알 수 없는 명령입니다: {op}"}]
+    except ValueError as e:
+        rows = [{"ok": False, "message": str(e)}]
+    for row in rows:
+        row["op"] = op
+        yield row
+
+
+WRITE_OPS = ("add", "delete", "invalid")
+
+
+def run(session, commands, writer, batch_size=1000):
+    """
+    명령을 batch_size개씩 실행
+    - 쓰기 결과는 묶음 저장 후에 확정되므로 모아 두었다가 출력
+    - 읽기 명령을 만나면 그때까지의 쓰기를 먼저 저장한 뒤 결과를 바로 출력 (export는 스트리밍)
+    """
+    commands = iter(commands)
+    while True:
+        batch = list(islice(commands, batch_size))
+        if not batch:
+            break
+        buffered = []
+        for command in batch:
+            command = check_command(command)
+            op = command_op(command)
+            if op in WRITE_OPS:
+                buffered.extend(execute(session, command))
+                continue
+            session.flush()
+            for row in buffered:
+                writer.write(row)
+            buffered = []
+            for row in execute(session, command):
+                writer.write(row)
+        session.flush()
+        for row in buffered:
+            writer.write(row)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="성적관리 일괄 처리 (JSONL / CSV)")
+    parser.add_argument("input", nargs="?", default="-", help="명령 파일 (- 이면 표준입력)")
+    parser.add_argument("--input-format", choices=("jsonl", "csv"), default=None,
+                        help="입력 형식 (기본: 파일 확장자, 표준입력은 jsonl)")
+    parser.add_argument("--output", default="-", help="결과 파일 (- 이면 표준출력)")
+    parser.add_argument("--output-format", choices=("jsonl", "csv"), default="jsonl")
+    parser.add_argument("--backend", choices=("memory", "mongo"), default="memory")
+    parser.add_argument("--data-dir", default=None, help="메모리 저장소의 스냅샷/저널 폴더")
+    parser.add_argument("--connection", default="mongodb://localhost:27017/")
+    parser.add_argument("--db", default="grade_management")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    input_format = args.input_format or ("csv" if args.input.endswith(".csv") else "jsonl")
+    in_stream = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    out_stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+
+    # 저장소가 출력하는 안내/오류 문구는 결과와 섞이지 않도록 표준오류로 보냄
+    with redirect_stdout(sys.stderr):
+        if args.backend == "mongo":
+            backend = open_backend("mongo", connection_string=args.connection, db_name=args.db)
+        else:
+            backend = open_backend("memory", data_dir=args.data_dir)
+        session = BatchSession(backend)
+        try:
+            run(session, read_commands(in_stream, input_format),
+                ResultWriter(out_stream, args.output_format), args.batch_size)
+        finally:
+            session.close()
+            if in_stream is not sys.stdin:
+                in_stream.close()
+            if out_stream is not sys.stdout:
+                out_stream.close()
+
+if __name__ == "__main__":
+    main()
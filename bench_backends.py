@@ -0,0 +1,76 @@
+##############################
+# 프로그램명: 저장소별 성능 비교 (메모리 / SQLite / MongoDB)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 같은 학생 데이터로 추가(한 명씩 / 묶음), 검색, 등수 조회, 통계 작업 시간을 비교
+#   - MongoDB는 서버에 연결할 수 있을 때만 측정
+#
+# 사용 예:
+#   python bench_backends.py 100000
+##############################
+
+import os
+import random
+import sys
+import tempfile
+import time
+
+from storage import MemoryBackend, open_backend
+
+
+def make_records(count, seed=1):
+    rng = random.Random(seed)
+    return [(f"{i:08d}", f"학생{i % 5000}", rng.randint(0, 100), rng.randint(0, 100), rng.randint(0, 100))
+            for i in range(count)]
+
+
+def timed(label, function, operations):
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<22}{elapsed:>9.3f}초 {operations / elapsed:>14,.0f} 건/초")
+
+
+def run_workload(name, backend, records, lookups):
+    print(f"[{name}]")
+    single = records[:min(len(records), 10000)]
+    rest = records[len(single):]
+    timed("추가 (한 명씩)", lambda: [backend.add(*record) for record in single], len(single))
+    if rest:
+        timed("추가 (묶음)", lambda: backend.add_many(rest), len(rest))
+    timed("검색 (학번)", lambda: [backend.search(key) for key in lookups], len(lookups))
+    timed("등수 조회", lambda: [backend.rank_of(key) for key in lookups], len(lookups))
+    timed("상위 50명", lambda: [backend.top_students(50) for _ in range(100)], 100)
+    timed("통계", lambda: [backend.statistics() for _ in range(20)], 20)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    records = make_records(count)
+    lookups = [records[random.randrange(count)][0] for _ in range(2000)]
+    print(f"학생 수: {count:,}명")
+
+    run_workload("메모리 (GradeManager)", MemoryBackend(), records, lookups)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        backend = open_backend("sqlite", path=os.path.join(tmp_dir, "bench.db"))
+        run_workload("SQLite (WAL)", backend, records, lookups)
+        backend.close()
+
+    try:
+        backend = open_backend("mongo", db_name="grade_benchmark",
+                               connection_string="mongodb://localhost:27017/?serverSelectionTimeoutMS=2000")
+    except Exception as e:
+        print(f"[MongoDB] 연결할 수 없어 건너뜁니다: {e}")
+        return
+    backend.manager.collection.delete_many({})
+    backend.manager.summary.delete_many({})
+    try:
+        run_workload("MongoDB", backend, records, lookups)
+    finally:
+        backend.manager.client.drop_database("grade_benchmark")
+        backend.close()
+
+
+if __name__ == "__main__":
+    main()
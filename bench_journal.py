@@ -0,0 +1,52 @@
+##############################
+# 프로그램명: 저장 엔진(스냅샷 + 저널) 성능 측정
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - GradeManager + GradeStore로 N명 추가 시 초당 기록 수
+#   - 저널만 있을 때 / 스냅샷만 있을 때의 시작(복원) 시간
+#
+# 사용 예:
+#   python bench_journal.py 1000000
+##############################
+
+import random
+import sys
+import tempfile
+import time
+
+from journal import GradeStore
+from main import GradeManager, Student
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        # 자동 스냅샷 없이 저널에만 기록
+        manager = GradeManager(store=GradeStore(data_dir, snapshot_every=0))
+        start = time.perf_counter()
+        for i in range(count):
+            manager.insert(Student(f"{i:08d}", f"학생{i}", random.randint(0, 100),
+                                   random.randint(0, 100), random.randint(0, 100)))
+        manager.store.commit()
+        elapsed = time.perf_counter() - start
+        print(f"기록: {count:,}명 {elapsed:.2f}초 ({count / elapsed:,.0f}건/초, 그룹 커밋 {manager.store.group_size}건)")
+
+        manager.close()
+        start = time.perf_counter()
+        manager = GradeManager(store=GradeStore(data_dir, snapshot_every=0))
+        print(f"시작(저널 전체 재적용): {time.perf_counter() - start:.2f}초")
+
+        start = time.perf_counter()
+        manager.store.snapshot(manager)
+        print(f"스냅샷 저장: {time.perf_counter() - start:.2f}초")
+        manager.close()
+
+        start = time.perf_counter()
+        manager = GradeManager(store=GradeStore(data_dir, snapshot_every=0))
+        print(f"시작(스냅샷 mmap 읽기): {time.perf_counter() - start:.2f}초, 학생 수 {len(manager.students):,}명")
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+##############################
+# 프로그램명: N×N k목 규칙/컴퓨터 속도 측정
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 3×3(k=3), 7×7(k=4), 15×15(k=5) 판에서 측정
+#   - 무작위 대국: 수마다 둔 칸을 지나는 줄만 보는 증분 승리 판정과
+#     판 전체의 모든 줄을 다시 보는 방식의 초당 대국 수 비교 (같은 seed, 승자도 같아야 함)
+#   - 컴퓨터: 한 수 시간 제한 안에서 도달한 탐색 깊이, 초당 탐색 국면 수, 한 수 평균 시간
+#
+# 사용 예:
+#   python bench_kinarow.py --games 2000 --time-limit 1.0 --moves 6
+##############################
+
+import argparse
+import random
+import sys
+import time
+
+from kinarow import EMPTY, Board, KInARowAI, scan_winner
+
+CONFIGS = ((3, 3, 3), (7, 7, 4), (15, 15, 5))
+
+
+def random_games(board, games, seed, rescan):
+    """무작위 대국 games판, 승자 목록과 걸린 시간 반환"""
+    rng = random.Random(seed)
+    winners = []
+    start = time.perf_counter()
+    for _ in range(games):
+        while True:
+            board.play(rng.choice(board.empties))
+            winner = scan_winner(board) if rescan else board.winner
+            if winner != EMPTY or not board.empties:
+                break
+        winners.append(winner)
+        while board.history:
+            board.undo()
+    return winners, time.perf_counter() - start
+
+
+def search_moves(width, height, k, moves, time_limit):
+    """컴퓨터끼리 moves수 두며 수마다 탐색 결과 기록"""
+    board = Board(width, height, k)
+    ai = KInARowAI(time_limit=time_limit)
+    results = []
+    for _ in range(moves):
+        if board.is_over():
+            break
+        board.play(ai.choose_move(board))
+        results.append(ai.last)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="N×N k목 규칙/컴퓨터 속도 측정")
+    parser.add_argument("--games", type=int, default=2000, help="판 크기마다 무작위 대국 수")
+    parser.add_argument("--time-limit", type=float, default=1.0, help="컴퓨터 한 수 시간 제한 (초)")
+    parser.add_argument("--moves", type=int, default=6, help="판 크기마다 컴퓨터가 둘 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    print(f"{'판':<12}{'증분 판정':>14}{'전체 다시 보기':>16}{'배율':>8}"
+          f"{'깊이':>8}{'국면/초':>12}{'한 수':>10}")
+    for width, height, k in CONFIGS:
+        # 빈칸 목록 순서가 대국마다 바뀌므로 같은 수를 두도록 판을 따로 만듦
+        incremental, fast = random_games(Board(width, height, k), args.games, args.seed, rescan=False)
+        rescanned, slow = random_games(Board(width, height, k), args.games, args.seed, rescan=True)
+        if incremental != rescanned:
+            print(f"{width}×{height} k={k}: 두 판정 결과가 다릅니다!")
+            sys.exit(1)
+
+        searches = search_moves(width, height, k, args.moves, args.time_limit)
+        nodes = sum(result["nodes"] for result in searches)
+        seconds = sum(result["seconds"] for result in searches)
+        depth = sum(result["depth"] for result in searches) / len(searches)
+        print(f"{f'{width}×{height} k={k}':<12}{args.games / fast:>12,.0f}/s{args.games / slow:>14,.0f}/s"
+              f"{slow / fast:>7.1f}x{depth:>8.1f}{nodes / seconds if seconds else 0:>12,.0f}"
+              f"{seconds / len(searches) * 1000:>8.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
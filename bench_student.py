@@ -0,0 +1,148 @@
+##############################
+# 프로그램명: Student 메모리/생성 속도 비교
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 이전 방식(__dict__, 생성 시 총점/평균/학점 즉시 계산)과
+#     현재 방식(__slots__, 필요할 때 계산)의 학생 한 명당 메모리와 초당 처리 수 비교
+#   - 이전/현재를 같은 입력과 같은 작업으로 측정
+#     main.py Student는 이전 main.py Student와, database.py Student는 이전 database.py Student(생성/수정 시각 포함)와 비교
+#   - 작업: 생성만 / 생성 후 한 줄 출력 형식화(display, 총점/평균/학점을 모두 사용) / 문서에서 복원(from_dict) 후 display
+#     나중에 계산하는 비용까지 포함되도록 메모리는 display까지 마친 뒤의 크기로 측정
+#
+# 사용 예:
+#   python bench_student.py 200000
+##############################
+
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from main import Student
+
+
+class LegacyStudent:
+    """이전 main.py Student와 같은 방식 (비교용)"""
+    def __init__(self, student_id, name, english, c_language, python):
+        self.student_id = student_id
+        self.name = name
+        self.english = english
+        self.c_language = c_language
+        self.python = python
+        self.total = self.english + self.c_language + self.python
+        self.average = self.total / 3
+        self.grade = self.calculate_grade()
+        self.rank = 0
+
+    def calculate_grade(self):
+        avg = self.average
+        for cutoff, grade in ((90, "A"), (85, "B+"), (80, "B"), (75, "C+"), (70, "C"), (65, "D+"), (60, "D")):
+            if avg >= cutoff:
+                return grade
+        return "F"
+
+    def display(self):
+        return (f"{self.student_id:<15}{self.name:<10}{self.english:<8}"
+                f"{self.c_language:<8}{self.python:<8}{self.total:<8}"
+                f"{self.average:<8.2f}{self.grade:<6}{self.rank:<6}")
+
+
+class LegacyMongoStudent(LegacyStudent):
+    """이전 database.py Student와 같은 방식 (생성/수정 시각 포함, 비교용)"""
+    def __init__(self, student_id, name, english, c_language, python):
+        super().__init__(student_id, name, english, c_language, python)
+        self.created_at = datetime.now()
+        self.updated_at = datetime.now()
+
+    @classmethod
+    def from_dict(cls, data):
+        student = cls(data["student_id"], data["name"], data["english"], data["c_language"], data["python"])
+        student.rank = data.get("rank", 0)
+        student.created_at = data.get("created_at", datetime.now())
+        student.updated_at = data.get("updated_at", datetime.now())
+        return student
+
+
+def make_rows(count):
+    return [(f"{i:08d}", f"학생{i}", random.randint(0, 100), random.randint(0, 100), random.randint(0, 100))
+            for i in range(count)]
+
+
+def make_documents(rows):
+    """현재 database.Student.to_dict()와 같은 형태의 문서 (pymongo 없이 만듦)"""
+    now = datetime.now()
+    documents = []
+    for row in rows:
+        student = Student(*row)
+        documents.append({
+            "student_id": student.student_id, "name": student.name, "english": student.english,
+            "c_language": student.c_language, "python": student.python, "total": student.total,
+            "average": student.average, "grade": student.grade, "rank": 0, "version": 1,
+            "created_at": now, "updated_at": now,
+        })
+    return documents
+
+
+def measure(build, count):
+    """build()로 count개를 처리할 때의 (학생당 바이트, 초당 처리 수)"""
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    objects = build()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    used = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del objects
+
+    start = time.perf_counter()
+    objects = build()
+    elapsed = time.perf_counter() - start
+    return used / count, count / elapsed
+
+
+def workloads(student_class, rows, documents):
+    """이전/현재 클래스에 똑같이 적용할 작업 목록"""
+    def created():
+        return [student_class(*row) for row in rows]
+
+    def displayed(students):
+        for student in students:
+            student.display()
+        return students
+
+    jobs = [
+        ("생성", created),
+        ("생성 + display", lambda: displayed(created())),
+    ]
+    if documents is not None:
+        jobs.append(("from_dict + display",
+                     lambda: displayed([student_class.from_dict(data) for data in documents])))
+    return jobs
+
+
+def compare(title, legacy_class, current_class, rows, documents, count):
+    print(f"\n{title}")
+    print(f"{'작업':<22}{'이전 B/학생':>12}{'현재 B/학생':>12}{'이전 명/초':>14}{'현재 명/초':>14}{'속도 배율':>10}")
+    for (label, legacy), (_, current) in zip(workloads(legacy_class, rows, documents),
+                                             workloads(current_class, rows, documents)):
+        legacy_bytes, legacy_rate = measure(legacy, count)
+        current_bytes, current_rate = measure(current, count)
+        print(f"{label:<22}{legacy_bytes:>12.1f}{current_bytes:>12.1f}"
+              f"{legacy_rate:>14,.0f}{current_rate:>14,.0f}{current_rate / legacy_rate:>9.2f}x")
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    rows = make_rows(count)
+    print(f"학생 수: {count:,}명")
+    compare("main.py Student", LegacyStudent, Student, rows, None, count)
+    try:
+        import database
+    except ImportError:
+        print("\npymongo가 없어 database.Student 측정은 건너뜁니다.")
+        return
+    compare("database.py Student", LegacyMongoStudent, database.Student, rows, make_documents(rows), count)
+
+
+if __name__ == "__main__":
+    main()
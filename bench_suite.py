@@ -0,0 +1,349 @@
+##############################
+# 프로그램명: 성적관리 벤치마크 모음
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - synthetic_data.py로 만든 학생 데이터로 GradeManager(메모리)와 MongoGradeManager를
+#     인원 수(기본 1천 / 10만 / 100만 명)별로 측정
+#   - 측정 작업: 적재, 한 명 추가/삭제, 점수 수정(한 명 / 묶음), 등수 계산, 학생 검색, 등수 조회, 상위 50명, 통계, 결과 출력
+#   - 작업별 지연 시간 백분위(p50/p95/p99/최대), 초당 처리량, 최대 메모리 할당량 보고
+#   - 결과를 JSON으로 저장하고 이전 결과와 비교하여 느려진 작업 표시 (느려지면 종료 코드 1)
+#   - MongoDB: 연결 문자열을 주면 실제 서버, 기본은 mongomock(프로세스 안 대체 서버)
+#
+# 사용 예:
+#   python bench_suite.py --sizes 1000,100000,1000000 --save baseline.json
+#   python bench_suite.py --sizes 100000 --tie-pool 30 --compare baseline.json
+#   python bench_suite.py --managers mongo --mongo mongodb://localhost:27017/ --sizes 100000
+##############################
+
+import argparse
+import io
+import json
+import math
+import os
+import platform
+import resource
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from main import GradeManager, Student
+from storage import MemoryBackend, MongoBackend
+from synthetic_data import DISTRIBUTIONS, generate_students
+
+BENCH_DB = "grade_benchmark"
+# mongomock은 순수 파이썬이라 조회마다 컬렉션 전체를 훑음: 기본으로 이 인원/횟수까지만 측정
+MOCK_SIZE_LIMIT = 1000
+MOCK_LOOKUPS = 50
+
+
+def percentile(sorted_values, p):
+    """정렬된 값에서 p 백분위 (가장 가까운 순위 방식)"""
+    if not sorted_values:
+        return None
+    index = math.ceil(len(sorted_values) * p / 100) - 1
+    return sorted_values[max(0, index)]
+
+
+def peak_rss_mb():
+    """프로세스 최대 상주 메모리 (리눅스는 KB, macOS는 바이트 단위)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+class Operation:
+    """
+    측정할 작업 하나
+    - args가 있으면 인자마다 function(arg)를 한 번씩 호출 (호출마다 지연 시간 기록)
+    - args가 None이면 function()을 repeat번 호출
+    """
+
+    def __init__(self, name, function, args=None, repeat=3):
+        self.name = name
+        self.function = function
+        self.args = args
+        self.repeat = repeat
+
+    def run(self):
+        latencies = []
+        clock = time.perf_counter
+        if self.args is None:
+            for _ in range(self.repeat):
+                start = clock()
+                self.function()
+                latencies.append(clock() - start)
+        else:
+            function = self.function
+            for arg in self.args:
+                start = clock()
+                function(arg)
+                latencies.append(clock() - start)
+        return latencies
+
+    def traced_peak(self):
+        """한 번 더 실행하며 tracemalloc으로 최대 할당량(KB) 측정 (시간 측정과 분리)"""
+        tracemalloc.start()
+        try:
+            if self.args is None:
+                self.function()
+            else:
+                for arg in self.args:
+                    self.function(arg)
+            return round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        finally:
+            tracemalloc.stop()
+
+
+def summarize(latencies, operations=None):
+    latencies = sorted(latencies)
+    total = sum(latencies)
+    operations = operations or len(latencies)
+    to_ms = lambda value: round(value * 1000, 4)
+    return {
+        "count": operations,
+        "seconds": round(total, 4),
+        "throughput": round(operations / total, 1) if total else None,
+        "p50_ms": to_ms(percentile(latencies, 50)),
+        "p95_ms": to_ms(percentile(latencies, 95)),
+        "p99_ms": to_ms(percentile(latencies, 99)),
+        "max_ms": to_ms(latencies[-1]),
+    }
+
+
+def answer_input(function):
+    """대화형 메서드(search_student 등)가 input()으로 읽을 값을 표준입력 한 줄로 넣어 호출하는 함수"""
+    def call(value):
+        sys.stdin = io.StringIO(value + "\n")
+        function()
+    return call
+
+
+def rescore_batches(rescores, originals, repeat):
+    """묶음 수정 인자: 원래 점수와 새 점수를 번갈아 넣고 마지막은 원래 점수로 끝나 상태가 돌아옴"""
+    return [originals, rescores] * (repeat - 1) + [originals]
+
+
+def memory_operations(manager, extra, search_keys, ids, rescores, originals, repeat):
+    """
+    GradeManager 측정 작업 목록 (추가한 extra는 마지막 삭제 작업에서 모두 지우고,
+    점수 수정은 묶음 수정이 원래 점수로 되돌려 상태가 원래대로 돌아옴)
+    """
+    backend = MemoryBackend(manager)
+    return [
+        Operation("insert", lambda record: manager.insert(Student(*record)), extra),
+        Operation("update_scores", lambda update: manager.update_scores(*update), rescores),
+        Operation("update_scores_many", manager.update_scores_many, rescore_batches(rescores, originals, repeat)),
+        Operation("calculate_ranks", manager.calculate_ranks, repeat=repeat),
+        Operation("search_student", answer_input(manager.search_student), search_keys),
+        Operation("rank_of", manager.rank_of, ids),
+        Operation("top_students_50", lambda: manager.top_students(50), repeat=repeat * 10),
+        Operation("get_statistics", backend.statistics, repeat=repeat),
+        Operation("print_results", manager.print_results, repeat=repeat),
+        Operation("remove", manager.remove, [record[0] for record in extra]),
+    ]
+
+
+def mongo_operations(manager, extra, search_keys, ids, rescores, originals, repeat):
+    """MongoGradeManager 측정 작업 목록"""
+    from database import Student as MongoStudent
+
+    return [
+        Operation("insert", lambda record: manager.insert_student(MongoStudent(*record)), extra),
+        Operation("update_scores", lambda update: manager.update_scores(*update), rescores),
+        Operation("update_scores_many", manager.update_scores_many, rescore_batches(rescores, originals, repeat)),
+        Operation("calculate_ranks", manager.calculate_ranks, repeat=repeat),
+        Operation("search_student", answer_input(manager.search_student), search_keys),
+        Operation("rank_of", manager.rank_of, ids),
+        Operation("top_students_50", lambda: manager.top_students(50), repeat=repeat * 10),
+        Operation("get_statistics", manager.get_statistics, repeat=repeat),
+        Operation("print_results", manager.print_results, repeat=repeat),
+        Operation("remove", manager.remove_student, [record[0] for record in extra]),
+    ]
+
+
+def open_mongo(target):
+    """
+    target이 "mock"이면 mongomock 클라이언트, 아니면 연결 문자열로 실제 서버에 연결
+    반환: (MongoGradeManager, 백엔드 이름)
+    """
+    from database import MongoGradeManager
+
+    if target == "mock":
+        import mongomock
+
+        manager = MongoGradeManager(db_name=BENCH_DB, client=mongomock.MongoClient())
+        # mongomock은 $setWindowFields를 지원하지 않으므로 일괄 쓰기 방식으로 등수 계산
+        manager.calculate_ranks = manager._calculate_ranks_bulk
+        # mongomock은 unique 인덱스를 문서를 고칠 때마다 컬렉션 전체를 훑어 검사하므로(문서 수에 비례)
+        # 측정값이 대체 서버 비용으로 덮이지 않도록 학번 인덱스를 일반 인덱스로 바꿈 (측정 데이터의 학번은 모두 다름)
+        manager.collection.drop_index("student_id_1")
+        manager.collection.create_index("student_id", name="student_id_1")
+        return manager, "mongomock"
+    manager = MongoGradeManager(connection_string=target, db_name=BENCH_DB)
+    manager.collection.delete_many({})
+    manager.summary.delete_many({})
+    return manager, "mongod"
+
+
+def run_case(kind, size, lookups, args, log):
+    """한 관리자 / 한 인원 수에 대해 모든 작업을 측정하고 결과 행 목록 반환"""
+    records = list(generate_students(size, args.distribution, args.seed, args.tie_pool))
+    extra = list(generate_students(lookups, args.distribution, args.seed + 1, args.tie_pool, start=size))
+    step = max(1, size // lookups)
+    ids = [records[i][0] for i in range(0, size, step)][:lookups]
+    # 점수 수정: 조회 대상 학생에게 extra의 점수를 주고, 묶음 수정에서 원래 점수로 되돌림
+    originals = [records[i][:1] + records[i][2:] for i in range(0, size, step)][:lookups]
+    rescores = [(student_id,) + record[2:] for (student_id, *_), record in zip(originals, extra)]
+    # 검색어: 학번 80%, 이름 20% (이름은 동명이인이 있어 여러 건이 나올 수 있음)
+    search_keys = [records[i][1] if n % 5 == 4 else records[i][0]
+                   for n, i in enumerate(range(0, size, step))][:lookups]
+
+    backend_name = "memory"
+    rows = []
+    case = {"manager": kind, "size": size, "distribution": args.distribution, "tie_pool": args.tie_pool}
+    sink = open(os.devnull, "w", encoding="utf-8")
+    stdin = sys.stdin
+    manager = None
+    try:
+        # 관리자가 출력하는 화면 내용은 버림
+        with redirect_stdout(sink):
+            rss_before = peak_rss_mb()
+            start = time.perf_counter()
+            if kind == "memory":
+                manager = GradeManager()
+                manager.load_students(Student(*record) for record in records)
+                operations = memory_operations(manager, extra, search_keys, ids, rescores, originals, args.repeat)
+            else:
+                manager, backend_name = open_mongo(args.mongo)
+                MongoBackend(manager).add_many(records)
+                operations = mongo_operations(manager, extra, search_keys, ids, rescores, originals, args.repeat)
+            load = summarize([time.perf_counter() - start], size)
+            load.update(operation="load", peak_alloc_kb=None, rss_growth_mb=round(peak_rss_mb() - rss_before, 1))
+            rows.append(load)
+
+            timed = [(operation, operation.run()) for operation in operations]
+            peaks = {}
+            if args.memory:
+                # 두 번째 실행은 추가 → ... → 삭제 순서가 같아 상태가 다시 원래대로 돌아옴
+                for operation in operations:
+                    peaks[operation.name] = operation.traced_peak()
+
+        for operation, latencies in timed:
+            row = summarize(latencies)
+            row.update(operation=operation.name, peak_alloc_kb=peaks.get(operation.name), rss_growth_mb=None)
+            rows.append(row)
+    finally:
+        sys.stdin = stdin
+        if kind == "mongo" and manager is not None:
+            with redirect_stdout(sink):
+                manager.client.drop_database(BENCH_DB)
+                manager.close_connection()
+        sink.close()
+
+    for row in rows:
+        row.update(case, backend=backend_name)
+        log(row)
+    return rows
+
+
+def print_row(row):
+    throughput = f"{row['throughput']:>12,.{0 if row['throughput'] >= 100 else 1}f}/s" if row["throughput"] else f"{'-':>14}"
+    if row["peak_alloc_kb"] is not None:
+        peak = f"{row['peak_alloc_kb']:>10,.0f}KB"
+    elif row["rss_growth_mb"] is not None:
+        peak = f"  RSS +{row['rss_growth_mb']:,.0f}MB"
+    else:
+        peak = ""
+    print(f"  {row['operation']:<18}{row['count']:>9,} {throughput} "
+          f"p50 {row['p50_ms']:>10.3f}ms  p95 {row['p95_ms']:>10.3f}ms  p99 {row['p99_ms']:>10.3f}ms  "
+          f"max {row['max_ms']:>10.3f}ms {peak}")
+
+
+def row_key(row):
+    return (row["manager"], row["backend"], row["size"], row["distribution"], row["tie_pool"], row["operation"])
+
+
+def compare(results, baseline, threshold):
+    """
+    이전 결과와 비교하여 느려진 작업 목록 반환
+    적재는 처리량, 나머지는 p50 지연 시간 기준 (threshold=0.2면 20% 넘게 느려졌을 때)
+    """
+    previous = {row_key(row): row for row in baseline["results"]}
+    regressions = []
+    print(f"\n=== 이전 결과와 비교 ({baseline['meta']['timestamp']}) ===")
+    for row in results:
+        old = previous.get(row_key(row))
+        if old is None:
+            continue
+        if row["operation"] == "load":
+            ratio = old["throughput"] / row["throughput"]
+        else:
+            ratio = row["p50_ms"] / old["p50_ms"] if old["p50_ms"] else 1.0
+        slower = ratio > 1 + threshold
+        if slower:
+            regressions.append(row)
+        mark = "느려짐" if slower else ("빨라짐" if ratio < 1 - threshold else "")
+        print(f"  {row['manager']:<7}{row['size']:>10,}  {row['operation']:<18}{ratio:>7.2f}배  {mark}")
+    print(f"느려진 작업: {len(regressions)}개")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="성적관리 벤치마크 모음")
+    parser.add_argument("--sizes", default="1000,100000,1000000", help="쉼표로 구분한 학생 수")
+    parser.add_argument("--managers", default="memory,mongo", help="memory, mongo 중 쉼표로 선택")
+    parser.add_argument("--mongo", default="mock", help="mock(mongomock) 또는 MongoDB 연결 문자열")
+    parser.add_argument("--mongo-max-size", type=int, default=None,
+                        help=f"MongoDB 측정 최대 인원 (기본: mock이면 {MOCK_SIZE_LIMIT:,}, 서버면 제한 없음)")
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="normal")
+    parser.add_argument("--tie-pool", type=int, default=None, help="점수 조합 개수 (동점자 많은 데이터)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--lookups", type=int, default=1000, help="추가/삭제/검색/등수 조회 횟수")
+    parser.add_argument("--repeat", type=int, default=3, help="전체 대상 작업 반복 횟수")
+    parser.add_argument("--no-memory", dest="memory", action="store_false", help="tracemalloc 측정 생략")
+    parser.add_argument("--save", default=None, help="결과 JSON 파일")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--threshold", type=float, default=0.2, help="느려짐 판정 비율 (기본 0.2 = 20%%)")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    managers = [name.strip() for name in args.managers.split(",") if name.strip()]
+    mock = args.mongo == "mock"
+    mongo_max = args.mongo_max_size or (MOCK_SIZE_LIMIT if mock else None)
+
+    results = []
+    for kind in managers:
+        for size in sizes:
+            if kind == "mongo" and mongo_max and size > mongo_max:
+                print(f"\n[{kind} {size:,}명] 건너뜀 (--mongo-max-size {mongo_max:,})")
+                continue
+            print(f"\n[{kind} {size:,}명, 분포 {args.distribution}, 점수 조합 {args.tie_pool or '제한 없음'}]")
+            lookups = min(args.lookups, MOCK_LOOKUPS) if kind == "mongo" and mock else args.lookups
+            try:
+                results.extend(run_case(kind, size, lookups, args, print_row))
+            except ImportError as e:
+                print(f"  건너뜀: {e}")
+                break
+
+    meta = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "peak_rss_mb": peak_rss_mb(),
+        "args": vars(args),
+    }
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"meta": meta, "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.save}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+##############################
+# 프로그램명: 틱택토 규칙 처리 속도 비교
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 이전 방식(9칸 문자열 리스트 + 8줄 문자열 비교)과 비트보드 GameState로
+#     무작위 대국을 같은 seed로 진행하여 초당 대국 수 비교
+#   - 같은 seed면 두 방식이 같은 수를 두므로 승/무/패 집계가 같아야 함 (결과도 함께 확인)
+#   - 완벽한 수 컴퓨터(tictactoe_ai.py)의 첫 수까지 걸리는 시간:
+#     빈 표에서 탐색(cold) / 전체 풀기 / 표 파일 불러오기(warm) / 풀어 둔 표 조회만 할 때
+#
+# 사용 예:
+#   python bench_tictactoe.py 200000
+##############################
+
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+
+from tictactoe_ai import PerfectPlayer
+from tictactoe_engine import GameState
+
+LEGACY_WIN_CASES = [
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),
+    (0, 4, 8), (2, 4, 6)
+]
+
+
+def legacy_game(rng):
+    """이전 틱택톡 게임.py와 같은 방식으로 한 판 진행 (비교용)"""
+    board = [" " for _ in range(9)]
+    player = "X"
+    while True:
+        empty_positions = [i for i in range(9) if board[i] == " "]
+        board[rng.choice(empty_positions)] = player
+        if any(board[a] == board[b] == board[c] == player for a, b, c in LEGACY_WIN_CASES):
+            return player
+        if " " not in board:
+            return "draw"
+        player = "O" if player == "X" else "X"
+
+
+def engine_game(rng):
+    state = GameState()
+    while True:
+        state.play(rng.choice(list(state.legal_moves())))
+        winner = state.winner()
+        if winner is not None:
+            return winner
+        if state.is_full():
+            return "draw"
+
+
+def engine_undo_game(rng, state):
+    """상태 하나를 재사용: 한 판이 끝나면 처음까지 무르기"""
+    while True:
+        state.play(rng.choice(list(state.legal_moves())))
+        winner = state.winner()
+        if winner is not None or state.is_full():
+            while state.history:
+                state.undo()
+            return winner or "draw"
+
+
+def measure(label, play, games, seed):
+    rng = random.Random(seed)
+    results = Counter()
+    start = time.perf_counter()
+    for _ in range(games):
+        results[play(rng)] += 1
+    elapsed = time.perf_counter() - start
+    print(f"{label:<22}{games / elapsed:>12,.0f} 판/초   "
+          f"X {results['X']:,} / O {results['O']:,} / 무승부 {results['draw']:,}")
+    return results
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def measure_first_move():
+    """완벽한 수 컴퓨터의 첫 수까지 걸리는 시간 (밀리초)"""
+    player = PerfectPlayer()
+    _, cold = timed(lambda: player.best_move(GameState()))
+    print(f"빈 표에서 첫 수 (cold)     {cold:10.2f}ms  탐색 국면 {player.nodes:,}")
+
+    solver = PerfectPlayer()
+    positions, solve = timed(solver.solve)
+    print(f"전체 풀기                  {solve:10.2f}ms  대표 국면 {positions:,}")
+
+    path = os.path.join(tempfile.mkdtemp(), "tictactoe_table.bin")
+    solver.save(path)
+    loaded, load = timed(lambda: PerfectPlayer.load(path))
+    _, first = timed(lambda: loaded.best_move(GameState()))
+    print(f"표 파일 불러오기 + 첫 수 (warm) {load + first:7.2f}ms  "
+          f"(불러오기 {load:.2f}ms, 파일 {os.path.getsize(path):,}바이트, 탐색 국면 {loaded.nodes})")
+    os.remove(path)
+
+    # 풀어 둔 표로 무작위 국면마다 한 수씩 (모두 표 조회)
+    rng = random.Random(0)
+    states = []
+    for _ in range(2000):
+        state = GameState()
+        for _ in range(rng.randrange(8)):
+            if state.is_over():
+                break
+            state.play(rng.choice(list(state.legal_moves())))
+        if not state.is_over():
+            states.append(state)
+    _, lookups = timed(lambda: [loaded.best_move(state) for state in states])
+    print(f"표 조회로 한 수             {lookups / len(states) * 1000:10.2f}µs  "
+          f"({len(states):,}국면 평균, 추가 탐색 국면 {loaded.nodes})")
+
+
+def main():
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    seed = 0
+    print(f"무작위 대국 {games:,}판")
+    legacy = measure("리스트 (이전)", legacy_game, games, seed)
+    engine = measure("비트보드", engine_game, games, seed)
+    state = GameState()
+    reused = measure("비트보드 (무르기 재사용)", lambda rng: engine_undo_game(rng, state), games, seed)
+    if not legacy == engine == reused:
+        print("결과가 서로 다릅니다!")
+        sys.exit(1)
+
+    print("\n완벽한 수 컴퓨터")
+    measure_first_move()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+##############################
+# 프로그램명: 성적 대량 등록 프로그램 (MongoDB 연동 버전)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - CSV / JSONL 파일의 학생 성적을 한 줄씩 읽어 묶음(batch) 단위로 MongoDB에 저장
+#   - 학번 unique 인덱스로 중복을 걸러내고, 등수와 통계는 마지막에 한 번만 계산
+#   - 잘못된 행은 중단하지 않고 오류 파일(JSONL)에 기록
+#
+# 사용 예:
+#   python bulk_import.py students.csv --batch-size 5000 --errors errors.jsonl
+##############################
+
+import argparse
+import csv
+import json
+import time
+from itertools import islice
+
+from pymongo import InsertOne, UpdateOne
+from pymongo.errors import BulkWriteError
+
+from database import MongoGradeManager, Student
+
+SCORE_FIELDS = ("english", "c_language", "python")
+DUPLICATE_KEY_ERROR = 11000
+
+
+def read_records(path):
+    """파일 형식(.csv / .jsonl)에 따라 (행 번호, 레코드) 를 하나씩 생성"""
+    if path.endswith(".csv"):
+        with open(path, newline="", encoding="utf-8") as f:
+            # 머리글이 1행이므로 데이터는 2행부터
+            for line_no, record in enumerate(csv.DictReader(f), start=2):
+                yield line_no, record
+    else:
+        with open(path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield line_no, json.loads(line)
+                except ValueError as e:
+                    yield line_no, e
+
+
+def build_document(record):
+    """레코드를 검증하고 Student.to_dict() 형태의 문서로 변환 (잘못되면 ValueError)"""
+    if isinstance(record, Exception):
+        raise ValueError(f"JSON 형식 오류: {record}")
+    if not isinstance(record, dict):
+        raise ValueError(f"학생 레코드는 JSON 객체여야 합니다: {type(record).__name__}")
+
+    student_id = str(record.get("student_id") or "").strip()
+    name = str(record.get("name") or "").strip()
+    if not student_id:
+        raise ValueError("학번이 비어 있습니다.")
+    if not name:
+        raise ValueError("이름이 비어 있습니다.")
+
+    scores = []
+    for field in SCORE_FIELDS:
+        try:
+            scores.append(int(record[field]))
+        except KeyError:
+            raise ValueError(f"{field} 점수가 없습니다.")
+        except (TypeError, ValueError):
+            raise ValueError(f"{field} 점수는 숫자여야 합니다: {record[field]!r}")
+
+    return Student(student_id, name, *scores).to_dict()
+
+
+def chunked(iterable, size):
+    """iterable을 size개씩 잘라 리스트로 생성"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _write_request(document, upsert):
+    if not upsert:
+        return InsertOne(document)
+    # 이미 있는 학번은 점수만 갱신하고 생성 시각은 유지, 버전은 1 올림 (새 학생은 1부터)
+    created_at = document.pop("created_at")
+    document.pop("version")
+    return UpdateOne(
+        {"student_id": document["student_id"]},
+        {"$set": document, "$setOnInsert": {"created_at": created_at}, "$inc": {"version": 1}},
+        upsert=True
+    )
+
+
+def import_students(manager, path, batch_size=1000, upsert=False, error_path=None):
+    """
+    파일의 학생 정보를 묶음 단위로 저장하고 결과 요약을 반환
+    manager: MongoGradeManager
+    upsert: True이면 이미 있는 학번은 덮어쓰고, False이면 중복으로 기록
+    error_path: 실패한 행을 기록할 JSONL 파일 (None이면 기록하지 않음)
+    """
+    summary = {"read": 0, "written": 0, "failed": 0}
+    error_file = open(error_path, "w", encoding="utf-8") if error_path else None
+
+    def record_error(line_no, message, record=None):
+        summary["failed"] += 1
+        if error_file:
+            if isinstance(record, Exception):
+                record = None
+            error_file.write(json.dumps({"line": line_no, "error": message, "record": record},
+                                        ensure_ascii=False, default=str) + "\n")
+
+    start = time.perf_counter()
+    try:
+        for chunk in chunked(read_records(path), batch_size):
+            requests = []
+            line_numbers = []
+            for line_no, record in chunk:
+                summary["read"] += 1
+                try:
+                    document = build_document(record)
+                except ValueError as e:
+                    record_error(line_no, str(e), record)
+                    continue
+                requests.append(_write_request(document, upsert))
+                line_numbers.append((line_no, record))
+
+            if not requests:
+                continue
+
+            # 순서 없는(unordered) 일괄 쓰기: 한 행이 실패해도 나머지는 계속 저장
+            try:
+                manager.collection.bulk_write(requests, ordered=False)
+                summary["written"] += len(requests)
+            except BulkWriteError as e:
+                write_errors = e.details.get("writeErrors", [])
+                summary["written"] += len(requests) - len(write_errors)
+                for error in write_errors:
+                    line_no, record = line_numbers[error["index"]]
+                    if error.get("code") == DUPLICATE_KEY_ERROR:
+                        record_error(line_no, "이미 존재하는 학번입니다.", record)
+                    else:
+                        record_error(line_no, error.get("errmsg", "알 수 없는 오류"), record)
+    finally:
+        if error_file:
+            error_file.close()
+
+    # 등수와 통계 요약은 모든 행을 저장한 뒤 한 번만 계산
+    manager.calculate_ranks()
+    manager.rebuild_statistics()
+
+    elapsed = time.perf_counter() - start
+    summary["seconds"] = elapsed
+    summary["rows_per_sec"] = summary["read"] / elapsed if elapsed > 0 else 0.0
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="학생 성적 대량 등록 (CSV / JSONL)")
+    parser.add_argument("path", help="입력 파일 (.csv 또는 .jsonl)")
+    parser.add_argument("--connection", default="mongodb://localhost:27017/", help="MongoDB 연결 문자열")
+    parser.add_argument("--db", default="grade_management", help="데이터베이스 이름")
+    parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 저장할 행 수")
+    parser.add_argument("--upsert", action="store_true", help="이미 있는 학번은 덮어쓰기")
+    parser.add_argument("--errors", default=None, help="실패한 행을 기록할 JSONL 파일")
+    args = parser.parse_args()
+
+    manager = MongoGradeManager(connection_string=args.connection, db_name=args.db)
+    try:
+        summary = import_students(manager, args.path, batch_size=args.batch_size,
+                                  upsert=args.upsert, error_path=args.errors)
+        print(f"읽은 행: {summary['read']}, 저장: {summary['written']}, 실패: {summary['failed']}")
+        print(f"소요 시간: {summary['seconds']:.2f}초 ({summary['rows_per_sec']:.0f}행/초)")
+    finally:
+        manager.close_connection()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+##############################
+# 프로그램명: 조회 결과 캐시 (MongoGradeManager 읽기 캐시)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - LRU + TTL 방식의 프로세스 내부 캐시
+#   - 학생 추가/삭제/등수 계산 시 영향을 받는 항목만 골라서 무효화
+#   - 적중(hit)/실패(miss)/제거(eviction) 횟수를 기록하여 캐시 크기 조정에 활용
+#   - MongoDB change stream을 구독하면 다른 프로세스의 변경도 반영 가능
+##############################
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+
+
+class ReadCache:
+    def __init__(self, max_size=1024, ttl=60.0):
+        """
+        max_size: 보관할 최대 항목 수 (넘으면 가장 오래 안 쓴 항목부터 제거)
+        ttl: 항목 유효 시간(초), None이면 만료 없음
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._items = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+        # 무효화할 때마다 1 증가: 읽는 도중 무효화가 있었으면 읽은 값을 저장하지 않음
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+        self.stale_loads = 0     # 읽는 도중 무효화되어 저장하지 않은 횟수
+
+    def get(self, key):
+        """(찾음 여부, 값) 반환"""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return False, None
+            expires_at, value = item
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._items[key]
+                self.expirations += 1
+                self.misses += 1
+                return False, None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return True, value
+
+    def set(self, key, value, generation=None):
+        """generation: 읽기 시작할 때의 세대, 그 뒤 무효화가 있었으면 저장하지 않음 (저장하면 True)"""
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self.stale_loads += 1
+                return False
+            self._items[key] = (expires_at, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def get_or_load(self, key, loader):
+        """
+        캐시에 있으면 바로 반환, 없으면 loader()로 읽어서 저장 후 반환
+        loader()가 도는 사이 쓰기가 캐시를 무효화했으면 읽은 값이 이미 낡았을 수 있으므로 반환만 하고 저장하지 않음
+        """
+        found, value = self.get(key)
+        if found:
+            return value
+        with self._lock:
+            generation = self._generation
+        value = loader()
+        self.set(key, value, generation)
+        return value
+
+    def invalidate_where(self, predicate):
+        """predicate(key, value)가 참인 항목만 제거"""
+        with self._lock:
+            self._generation += 1
+            stale = [key for key, (_, value) in self._items.items() if predicate(key, value)]
+            for key in stale:
+                del self._items[key]
+            self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self.invalidations += len(self._items)
+            self._items.clear()
+
+    def stats(self):
+        """캐시 사용 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._items),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "stale_loads": self.stale_loads,
+            }
+
+
+# 이 필드만 바뀐 수정은 등수 이동뿐이므로 그 학생이 들어 있는 항목만 무효화하면 됨
+RANK_FIELDS = {"rank", "updated_at"}
+
+
+def _invalidate_student(cache, student_id):
+    """그 학생이 들어 있는 목록 항목만 제거 (통계는 등수와 무관하므로 그대로 둠)"""
+    return cache.invalidate_where(lambda key, value: key[0] != "stats" and any(
+        student_data["student_id"] == student_id for student_data in value))
+
+
+def apply_change(manager, change):
+    """
+    change stream 이벤트 하나를 캐시에 반영 (학생 단위로 영향을 받는 항목만 무효화)
+    - 추가: 새 학생이 들어가거나 등수가 바뀌는 항목
+    - 등수만 바뀐 수정(다른 학생 추가/삭제/수정에 따른 등수 이동): 그 학생이 들어 있는 항목
+    - 점수/이름 수정: 수정 전후 위치에 해당하는 항목과 통계
+    - 삭제 등 문서 내용을 알 수 없는 변경: 캐시 전체 비우기
+    """
+    operation = change["operationType"]
+    student_data = change.get("fullDocument")
+    if operation == "insert":
+        manager.invalidate_cache(student_data, added=True)
+    elif operation == "update" and student_data is not None:
+        if set(change["updateDescription"]["updatedFields"]) <= RANK_FIELDS:
+            _invalidate_student(manager.cache, student_data["student_id"])
+        else:
+            manager.invalidate_cache(student_data, added=True)
+    else:
+        manager.cache.clear()
+
+
+def watch_changes(manager, stop_event=None):
+    """
+    MongoDB change stream을 구독하여 다른 프로세스의 변경을 캐시에 반영하는 스레드 시작
+    (replica set 또는 sharded cluster에서만 동작, 반영 방식은 apply_change 참고)
+    캐시 없이 만든 manager면 ValueError
+    """
+    if manager.cache is None:
+        raise ValueError("캐시를 사용하지 않는 관리자입니다. cache를 넘겨 MongoGradeManager를 만드세요.")
+    stop_event = stop_event or threading.Event()
+
+    def run():
+        try:
+            # 수정 이벤트도 학번으로 무효화할 수 있도록 수정 후 문서를 함께 받음
+            with manager.collection.watch(full_document="updateLookup") as stream:
+                while not stop_event.is_set():
+                    change = stream.try_next()
+                    if change is not None:
+                        apply_change(manager, change)
+        except Exception as e:
+            # 변경 감시가 끊기면 캐시를 믿을 수 없으므로 비움
+            logging.error(f"Change stream stopped: {e}")
+            manager.cache.clear()
+
+    thread = threading.Thread(target=run, name="grade-cache-watcher", daemon=True)
+    thread.start()
+    return stop_event
@@ -0,0 +1,133 @@
+##############################
+# 프로그램명: 열(column) 단위 학생 성적 저장소 (NumPy)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 과목 점수, 총점, 평균, 학점 코드, 등수를 각각 NumPy 배열로 보관
+#   - 총점/평균/학점/등수 계산과 80점 이상 학생 수 등 조건 집계를 한 번에(벡터 연산) 처리
+#   - Student 객체(main.py, database.py) 및 MongoDB 문서와 서로 변환
+##############################
+
+from datetime import datetime
+
+import numpy as np
+
+# 학점 경계 (평균이 경계 이상이면 다음 학점): F < 60 <= D < 65 <= D+ ... 90 <= A
+GRADE_CUTOFFS = np.array([60, 65, 70, 75, 80, 85, 90])
+GRADE_LABELS = np.array(["F", "D", "D+", "C", "C+", "B", "B+", "A"], dtype=object)
+
+SUBJECTS = ("english", "c_language", "python")
+
+# students = [].py 의 딕셔너리 키
+KOREAN_FIELDS = {
+    "student_id": "학번", "name": "이름",
+    "english": "영어", "c_language": "C-언어", "python": "파이썬",
+}
+
+
+def grade_codes(average):
+    """평균 배열 → 학점 코드 배열 (0=F ... 7=A)"""
+    return np.searchsorted(GRADE_CUTOFFS, average, side="right").astype(np.int8)
+
+
+def competition_ranks(total):
+    """총점 배열 → 등수 배열 (총점이 더 높은 학생 수 + 1, 동점자는 같은 등수)"""
+    ascending = np.sort(total)
+    return len(total) - np.searchsorted(ascending, total, side="right") + 1
+
+
+class StudentColumns:
+    def __init__(self, student_id, name, english, c_language, python):
+        self.student_id = np.asarray(student_id, dtype=object)
+        self.name = np.asarray(name, dtype=object)
+        self.english = np.asarray(english, dtype=np.int64)
+        self.c_language = np.asarray(c_language, dtype=np.int64)
+        self.python = np.asarray(python, dtype=np.int64)
+        self.compute()
+
+    def __len__(self):
+        return len(self.student_id)
+
+    def compute(self):
+        """총점, 평균, 학점 코드, 등수를 모든 학생에 대해 한 번에 계산"""
+        self.total = self.english + self.c_language + self.python
+        self.average = self.total / 3
+        self.grade_code = grade_codes(self.average)
+        self.rank = competition_ranks(self.total)
+
+    @property
+    def grade(self):
+        """학점 문자열 배열"""
+        return GRADE_LABELS[self.grade_code]
+
+    def count_above(self, threshold=80):
+        """평균이 threshold 이상인 학생 수"""
+        return int(np.count_nonzero(self.average >= threshold))
+
+    def select(self, mask):
+        """불리언 마스크 또는 인덱스 배열로 고른 학생만 담은 새 저장소"""
+        return StudentColumns(self.student_id[mask], self.name[mask], self.english[mask],
+                              self.c_language[mask], self.python[mask])
+
+    def order_by_total(self):
+        """총점 내림차순 인덱스 (동점자는 원래 순서 유지)"""
+        return np.argsort(-self.total, kind="stable")
+
+    @classmethod
+    def from_students(cls, students):
+        """Student 객체 목록(main.py / database.py 모두 가능)에서 생성"""
+        students = list(students)
+        return cls(
+            [s.student_id for s in students],
+            [s.name for s in students],
+            [s.english for s in students],
+            [s.c_language for s in students],
+            [s.python for s in students],
+        )
+
+    @classmethod
+    def from_documents(cls, documents, fields=None):
+        """
+        딕셔너리 목록(MongoDB 문서 등)에서 생성
+        fields: 키 이름 매핑 (students = [].py 데이터는 KOREAN_FIELDS 사용)
+        """
+        keys = fields or {field: field for field in ("student_id", "name") + SUBJECTS}
+        columns = {field: [] for field in keys}
+        for document in documents:
+            for field, key in keys.items():
+                columns[field].append(document[key])
+        return cls(**columns)
+
+    def to_students(self, student_class):
+        """Student 객체 목록으로 변환 (student_class: main.Student 또는 database.Student)"""
+        students = []
+        for i in range(len(self)):
+            student = student_class(self.student_id[i], self.name[i], int(self.english[i]),
+                                    int(self.c_language[i]), int(self.python[i]))
+            student.rank = int(self.rank[i])
+            students.append(student)
+        return students
+
+    def to_documents(self, now=None):
+        """
+        Student.to_dict()와 같은 형태의 MongoDB 문서 목록으로 변환
+        버전 확인 변경(expected_version)이 조건으로 쓰는 version은 0(아직 고친 적 없음)으로 시작
+        """
+        now = now or datetime.now()
+        grades = self.grade
+        return [
+            {
+                "student_id": self.student_id[i],
+                "name": self.name[i],
+                "english": int(self.english[i]),
+                "c_language": int(self.c_language[i]),
+                "python": int(self.python[i]),
+                "total": int(self.total[i]),
+                "average": float(self.average[i]),
+                "grade": grades[i],
+                "rank": int(self.rank[i]),
+                "version": 0,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(len(self))
+        ]
@@ -9,23 +9,217 @@
 #   - MongoDB 데이터베이스 연동
 ##############################
 
-from pymongo import MongoClient
+from pymongo import MongoClient, ReturnDocument, UpdateMany, UpdateOne
+from pymongo.errors import DuplicateKeyError, OperationFailure
 from datetime import datetime
 import logging
+import math
+import os
+import re
+import threading
+from collections import Counter
+
+from metrics import Metrics, instrumented
+from sorting import external_sort, parse_keys
+
+# 목록 출력에 필요한 필드만 조회 (created_at/updated_at 등은 제외)
+DISPLAY_FIELDS = {
+    "_id": 0, "student_id": 1, "name": 1, "english": 1, "c_language": 1,
+    "python": 1, "total": 1, "average": 1, "grade": 1, "rank": 1
+}
+
+# 정렬 기준별 정렬 키 (학번을 마지막 키로 두어 순서를 유일하게 고정)
+SORT_KEYS = {
+    "rank": [("rank", 1), ("student_id", 1)],
+    "total": [("total", -1), ("student_id", 1)],
+}
+
+# 총점 오름차순: 복합 인덱스는 모든 키의 방향을 뒤집어야 거꾸로 훑을 수 있으므로 학번도 내림차순
+TOTAL_ASCENDING = [("total", 1), ("student_id", -1)]
+
+DEFAULT_BATCH_SIZE = 500
+
+# 이름 대소문자 무시 검색용 collation (strength 2: 대소문자 차이 무시)
+NAME_COLLATION = {"locale": "ko", "strength": 2}
+
+# 컬렉션에 유지할 인덱스 목록: (키, create_index 옵션)
+INDEXES = [
+    ([("student_id", 1)], {"name": "student_id_1", "unique": True}),
+    ([("name", 1)], {"name": "name_1"}),
+    ([("name", 1)], {"name": "name_ci", "collation": NAME_COLLATION}),
+    ([("total", -1), ("student_id", 1)], {"name": "total_-1_student_id_1"}),
+    ([("rank", 1), ("student_id", 1)], {"name": "rank_1_student_id_1"}),
+    ([("average", -1)], {"name": "average_-1"}),
+]
+
+def format_row(student_data):
+    """학생 문서를 Student 객체로 변환하지 않고 한 줄로 출력 형식화"""
+    return (f"{student_data['student_id']:<15}{student_data['name']:<10}{student_data['english']:<8}"
+            f"{student_data['c_language']:<8}{student_data['python']:<8}{student_data['total']:<8}"
+            f"{student_data['average']:<8.2f}{student_data['grade']:<6}{student_data['rank']:<6}")
+
+def _after_key_query(sort, after):
+    """keyset 페이지 조건: 정렬 순서상 after 키 다음에 오는 문서만 조회"""
+    (field, direction), _ = sort
+    value, student_id = after
+    op = "$gt" if direction == 1 else "$lt"
+    return {"$or": [
+        {field: {op: value}},
+        {field: value, "student_id": {"$gt": student_id}}
+    ]}
+
+# 통계 요약 문서 (statistics 컬렉션에 한 개만 유지)
+SUMMARY_ID = "students"
+SUBJECTS = ("english", "c_language", "python")
+THRESHOLDS = (60, 70, 80, 90)
+
+def summary_update(student_data, sign):
+    """학생 한 명 추가(sign=1) 또는 삭제(sign=-1)를 요약 문서에 반영하는 갱신 내용"""
+    inc = {"count": sign, "sum_total": sign * student_data["total"]}
+    for subject in SUBJECTS:
+        inc[f"sum_{subject}"] = sign * student_data[subject]
+    for threshold in THRESHOLDS:
+        if student_data["average"] >= threshold:
+            inc[f"above.{threshold}"] = sign
+    inc[f"grades.{student_data['grade']}"] = sign
+
+    update = {"$inc": inc, "$currentDate": {"updated_at": True}}
+    if sign > 0:
+        update["$min"] = {"min_total": student_data["total"]}
+        update["$max"] = {"max_total": student_data["total"]}
+    return update
+
+def summary_change(changes):
+    """
+    점수 수정 목록 [(수정 전 문서, 수정 후 문서), ...]을 요약 문서에 반영하는 갱신 내용
+    전후 증감을 합치고 0인 항목은 뺌 (최고/최저 총점이 수정 전 값이었는지는 호출한 쪽에서 확인)
+    """
+    inc = Counter()
+    totals = []
+    for before, after in changes:
+        inc.update(summary_update(after, 1)["$inc"])
+        inc.subtract(summary_update(before, 1)["$inc"])
+        totals.append(after["total"])
+    update = {"$currentDate": {"updated_at": True}}
+    changed = {key: value for key, value in inc.items() if value}
+    if changed:
+        update["$inc"] = changed
+    if totals:
+        update["$min"] = {"min_total": min(totals)}
+        update["$max"] = {"max_total": max(totals)}
+    return update
+
+def summary_pipeline():
+    """학점별로 묶어 요약 문서를 다시 만들기 위한 집계 파이프라인"""
+    group = {
+        "_id": "$grade",
+        "count": {"$sum": 1},
+        "sum_total": {"$sum": "$total"},
+        "min_total": {"$min": "$total"},
+        "max_total": {"$max": "$total"},
+    }
+    for subject in SUBJECTS:
+        group[f"sum_{subject}"] = {"$sum": f"${subject}"}
+    for threshold in THRESHOLDS:
+        group[f"above_{threshold}"] = {"$sum": {"$cond": [{"$gte": ["$average", threshold]}, 1, 0]}}
+    return [{"$group": group}]
+
+def build_summary(grade_rows):
+    """학점별 집계 결과를 합쳐 요약 문서 생성"""
+    summary = {"_id": SUMMARY_ID, "count": 0, "sum_total": 0, "above": {}, "grades": {}}
+    for subject in SUBJECTS:
+        summary[f"sum_{subject}"] = 0
+    for threshold in THRESHOLDS:
+        summary["above"][str(threshold)] = 0
+
+    for row in grade_rows:
+        summary["count"] += row["count"]
+        summary["sum_total"] += row["sum_total"]
+        for subject in SUBJECTS:
+            summary[f"sum_{subject}"] += row[f"sum_{subject}"]
+        for threshold in THRESHOLDS:
+            summary["above"][str(threshold)] += row[f"above_{threshold}"]
+        summary["grades"][row["_id"]] = row["count"]
+        if "min_total" not in summary or row["min_total"] < summary["min_total"]:
+            summary["min_total"] = row["min_total"]
+        if "max_total" not in summary or row["max_total"] > summary["max_total"]:
+            summary["max_total"] = row["max_total"]
+
+    summary["updated_at"] = datetime.now()
+    return summary
+
+def _plan_stages(plan):
+    """실행 계획 트리를 따라가며 stage 이름을 모두 수집"""
+    stages = []
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            stages.append(plan["stage"])
+        for value in plan.values():
+            if isinstance(value, (dict, list)):
+                stages.extend(_plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(_plan_stages(item))
+    return stages
+
+class VersionConflictError(Exception):
+    """다른 곳에서 먼저 수정되어 기대한 버전과 저장된 버전이 다를 때"""
+
 
 class Student:
+    # __dict__ 없이 고정된 칸만 사용하여 학생 한 명당 메모리를 줄임
+    __slots__ = ("student_id", "name", "english", "c_language", "python", "rank",
+                 "version", "created_at", "updated_at", "_total", "_grade")
+
     def __init__(self, student_id, name, english, c_language, python):
         self.student_id = student_id
         self.name = name
         self.english = english
         self.c_language = c_language
         self.python = python
-        self.total = self.english + self.c_language + self.python
-        self.average = self.total / 3
-        self.grade = self.calculate_grade()
         self.rank = 0
-        self.created_at = datetime.now()
-        self.updated_at = datetime.now()
+        self.version = 1    # 이름/점수를 바꿀 때마다 1 증가 (등수 변경은 제외)
+        now = datetime.now()
+        self.created_at = now
+        self.updated_at = now
+        # 총점/학점은 처음 사용할 때 계산하여 저장
+        self._total = None
+        self._grade = None
+
+    @property
+    def total(self):
+        if self._total is None:
+            self._total = self.english + self.c_language + self.python
+        return self._total
+
+    @property
+    def average(self):
+        return self.total / 3
+
+    @property
+    def grade(self):
+        if self._grade is None:
+            self._grade = self.calculate_grade()
+        return self._grade
+
+    def set_scores(self, english, c_language, python):
+        """점수를 바꾸고 저장해 둔 총점/학점을 비워 다음 사용 때 다시 계산"""
+        self.english = english
+        self.c_language = c_language
+        self.python = python
+        self._total = None
+        self._grade = None
+
+    def score_fields(self):
+        """점수 수정 때 함께 바뀌는 필드 (세 과목, 총점, 평균, 학점)"""
+        return {
+            "english": self.english,
+            "c_language": self.c_language,
+            "python": self.python,
+            "total": self.total,
+            "average": self.average,
+            "grade": self.grade
+        }
 
     def calculate_grade(self):
         avg = self.average
@@ -58,23 +252,31 @@ class Student:
             "average": self.average,
             "grade": self.grade,
             "rank": self.rank,
+            "version": self.version,
             "created_at": self.created_at,
             "updated_at": self.updated_at
         }
 
     @classmethod
     def from_dict(cls, data):
-        """MongoDB에서 조회한 딕셔너리를 학생 객체로 변환"""
-        student = cls(
-            data["student_id"],
-            data["name"],
-            data["english"],
-            data["c_language"],
-            data["python"]
-        )
+        """MongoDB에서 조회한 딕셔너리를 학생 객체로 변환 (저장된 총점/학점은 다시 계산하지 않음)"""
+        student = cls.__new__(cls)
+        student.student_id = data["student_id"]
+        student.name = data["name"]
+        student.english = data["english"]
+        student.c_language = data["c_language"]
+        student.python = data["python"]
         student.rank = data.get("rank", 0)
-        student.created_at = data.get("created_at", datetime.now())
-        student.updated_at = data.get("updated_at", datetime.now())
+        student.version = data.get("version", 0)
+        student._total = data.get("total")
+        student._grade = data.get("grade")
+        if "created_at" in data and "updated_at" in data:
+            student.created_at = data["created_at"]
+            student.updated_at = data["updated_at"]
+        else:
+            now = datetime.now()
+            student.created_at = data.get("created_at", now)
+            student.updated_at = data.get("updated_at", now)
         return student
 
     def display(self):
@@ -83,19 +285,39 @@ class Student:
                 f"{self.average:<8.2f}{self.grade:<6}{self.rank:<6}")
 
 class MongoGradeManager:
-    def __init__(self, connection_string="mongodb://localhost:27017/", db_name="grade_management"):
+    def __init__(self, connection_string="mongodb://localhost:27017/", db_name="grade_management", cache=None,
+                 client=None, metrics=None, transactions=False):
         """
         MongoDB 연결 초기화
         connection_string: MongoDB 연결 문자열
         db_name: 사용할 데이터베이스 이름
+        cache: 조회 결과 캐시 (cache.ReadCache), None이면 캐시 사용 안 함
+        client: 이미 만든 클라이언트 (벤치마크의 mongomock 등), None이면 connection_string으로 연결
+        metrics: 작업 측정 (metrics.Metrics), None이면 측정 안 함
+                 서버 왕복/문서 수는 여기서 만드는 클라이언트에만 연결됨 (client를 넘기면 시간/횟수만 측정)
+        transactions: True면 쓰기와 등수/통계 갱신을 서버 트랜잭션으로 묶음 (복제 세트 필요)
+                      여러 프로세스가 동시에 추가/삭제/점수 수정을 해도 등수와 통계가 어긋나지 않음
+                      단, 전체 등수 재계산(calculate_ranks)은 트랜잭션 밖에서 실행되므로
+                      같은 프로세스의 쓰기와만 겹치지 않음 (다른 프로세스가 쓰는 동안에는 실행하지 말 것)
         """
+        self.cache = cache
+        self.metrics = metrics
+        self.transactions = transactions
+        # 같은 프로세스 안의 스레드들이 등수를 바꾸는 쓰기를 한 번에 하나씩 하도록 함
+        self._write_lock = threading.RLock()
         try:
-            self.client = MongoClient(connection_string)
+            if client is not None:
+                self.client = client
+            elif metrics is not None:
+                self.client = MongoClient(connection_string, event_listeners=[metrics.listener])
+            else:
+                self.client = MongoClient(connection_string)
             self.db = self.client[db_name]
             self.collection = self.db.students
+            self.summary = self.db.statistics
             
-            # 학번에 인덱스 생성 (중복 방지 및 검색 성능 향상)
-            self.collection.create_index("student_id", unique=True)
+            # 학번(중복 방지), 이름 검색, 총점/등수 정렬, 평균 조건용 인덱스 생성
+            self.ensure_indexes()
             
             print(f"MongoDB 연결 성공: {db_name}")
             
@@ -104,16 +326,32 @@ class MongoGradeManager:
             logging.error(f"MongoDB connection failed: {e}")
             raise
 
+    def _report_error(self, action, e):
+        """잡은 예외를 화면에 알리고 로그와 작업 측정(오류 수)에 남김"""
+        print(f"{action} 중 오류 발생: {e}")
+        logging.error(f"{action} failed: {e}")
+        if self.metrics is not None and self.metrics.enabled:
+            self.metrics.mark_error()
+
+    def _atomic(self, work):
+        """
+        work(session)을 한 단위로 실행
+        트랜잭션을 쓰면 충돌 시 서버가 알려 주고 with_transaction이 처음부터 다시 실행함
+        (이 함수를 거치는 쓰기와 통계 재집계는 모두 통계 요약 문서를 고치므로 서로 충돌로 감지됨)
+        calculate_ranks는 $merge를 트랜잭션 안에서 쓸 수 없어 여기를 거치지 않으므로
+        다른 프로세스의 쓰기와는 보호되지 않고 같은 프로세스 안에서만 _write_lock으로 보호됨
+        """
+        with self._write_lock:
+            if not self.transactions:
+                return work(None)
+            with self.client.start_session() as session:
+                return session.with_transaction(work)
+
+    @instrumented
     def add_student(self):
-        """새 학생 추가"""
+        """새 학생 추가 (학번 중복은 저장할 때 unique 인덱스로 한 번에 확인)"""
         try:
             student_id = input("학번: ")
-            
-            # 중복 학번 확인
-            if self.collection.find_one({"student_id": student_id}):
-                print("이미 존재하는 학번입니다.")
-                return
-            
             name = input("이름: ")
             english = int(input("영어 점수: "))
             c_language = int(input("C-언어 점수: "))
@@ -121,20 +359,198 @@ class MongoGradeManager:
             
             student = Student(student_id, name, english, c_language, python)
             
-            # MongoDB에 저장
-            result = self.collection.insert_one(student.to_dict())
-            
-            if result.inserted_id:
+            if self.insert_student(student):
                 print(f"학생 {name}({student_id})이 성공적으로 추가되었습니다.")
-                self.calculate_ranks()
             else:
-                print("학생 추가에 실패했습니다.")
+                print("이미 존재하는 학번입니다.")
                 
         except ValueError:
             print("점수는 숫자로 입력해주세요.")
         except Exception as e:
-            print(f"학생 추가 중 오류 발생: {e}")
+            self._report_error("학생 추가", e)
+
+    @instrumented
+    def insert_student(self, student):
+        """
+        학생 한 명 저장 (이미 있는 학번이면 False)
+        학번 조건 upsert($setOnInsert) 한 번으로 중복 확인과 저장을 원자적으로 처리
+        새 학생은 최종 등수와 함께 저장하고, 나머지는 등수가 바뀌는 학생만 갱신
+        """
+        def work(session):
+            student.rank = self._rank_of_total(student.total, session)
+            student_data = student.to_dict()
+            fields = {key: value for key, value in student_data.items() if key != "student_id"}
+            result = self.collection.update_one(
+                {"student_id": student.student_id}, {"$setOnInsert": fields}, upsert=True, session=session
+            )
+            if result.upserted_id is None:
+                return None
+            self._rank_after_insert(student.total, session)
+            self._summary_after_insert(student_data, session)
+            return student_data
+
+        try:
+            student_data = self._atomic(work)
+        except DuplicateKeyError:
+            # 같은 학번을 동시에 upsert하다 서버가 재시도하지 못한 경우
+            return False
+        if student_data is None:
+            return False
+        self.invalidate_cache(student_data, added=True)
+        return True
+
+    @instrumented
+    def remove_student(self, student_id):
+        """학번으로 학생 삭제 후 삭제된 문서 반환 (없으면 None)"""
+        def work(session):
+            student_data = self.collection.find_one_and_delete({"student_id": student_id}, session=session)
+            if student_data is not None:
+                self._rank_after_delete(student_data["total"], session)  # 등수 증분 갱신
+                self._summary_after_delete(student_data, session)
+            return student_data
+
+        student_data = self._atomic(work)
+        if student_data is not None:
+            self.invalidate_cache(student_data, added=False)
+        return student_data
+
+    @instrumented
+    def update_student(self, student_id, name, expected_version=None):
+        """
+        학생 이름 변경 후 변경된 문서 반환 (없으면 None)
+        expected_version: 읽을 때의 version, 그 사이 다른 곳에서 먼저 고쳤으면 VersionConflictError
+                          (None이면 버전 확인 없이 변경)
+        조건 확인과 변경을 find_one_and_update 한 번으로 처리
+        """
+        query = {"student_id": student_id}
+        if expected_version is not None:
+            # version이 없는 예전 문서는 0으로 봄
+            query["version"] = {"$in": [0, None]} if expected_version == 0 else expected_version
+        before = self.collection.find_one_and_update(
+            query,
+            {"$set": {"name": name, "updated_at": datetime.now()}, "$inc": {"version": 1}},
+            projection={"_id": 0},
+            return_document=ReturnDocument.BEFORE
+        )
+        if before is None:
+            if expected_version is not None and self.collection.count_documents({"student_id": student_id}, limit=1):
+                raise VersionConflictError(f"{student_id}: version {expected_version} is out of date")
+            return None
+        after = dict(before, name=name, version=before.get("version", 0) + 1)
+        # 이전 이름 검색 결과와 새 이름 검색 결과가 모두 바뀜
+        self.invalidate_cache(before, added=False)
+        self.invalidate_cache(after, added=True)
+        return after
+
+    @instrumented
+    def update_scores(self, student_id, english, c_language, python, expected_version=None):
+        """
+        학생 점수 수정 후 수정된 문서 반환 (없으면 None)
+        expected_version: update_student와 같음 (맞지 않으면 VersionConflictError)
+        전체 재계산 없이 그 학생의 총점/평균/학점과 등수, 그리고 수정 전후 총점 사이에 있는
+        학생의 등수만 1씩 옮기고 요약 문서에는 전후 차이만 더함 (학생 수와 무관한 서버 왕복 4~5번)
+        """
+        fields = Student(student_id, "", english, c_language, python).score_fields()
+        new_total = fields["total"]
+        query = {"student_id": student_id}
+        if expected_version is not None:
+            query["version"] = {"$in": [0, None]} if expected_version == 0 else expected_version
+
+        def work(session):
+            # 다른 학생 중 새 총점보다 높은 학생 수로 최종 등수를 미리 정해 함께 저장
+            rank = self.collection.count_documents(
+                {"total": {"$gt": new_total}, "student_id": {"$ne": student_id}}, session=session
+            ) + 1
+            before = self.collection.find_one_and_update(
+                query,
+                {"$set": dict(fields, rank=rank, updated_at=datetime.now()), "$inc": {"version": 1}},
+                projection={"_id": 0},
+                return_document=ReturnDocument.BEFORE,
+                session=session
+            )
+            if before is None:
+                return None
+            after = dict(before, rank=rank, version=before.get("version", 0) + 1, **fields)
+            self._rank_after_update(student_id, before["total"], new_total, session)
+            self._summary_after_update([(before, after)], session)
+            return before, after
+
+        result = self._atomic(work)
+        if result is None:
+            if expected_version is not None and self.collection.count_documents({"student_id": student_id}, limit=1):
+                raise VersionConflictError(f"{student_id}: version {expected_version} is out of date")
+            return None
+        before, after = result
+        self.invalidate_cache(before, added=False)
+        self.invalidate_cache(after, added=True)
+        return after
+
+    @instrumented
+    def update_scores_many(self, updates):
+        """
+        [(학번, 영어, C-언어, 파이썬), ...] 을 한 번에 수정하고 반영된 항목 수 반환 (없는 학번은 건너뜀)
+        같은 학번이 여러 번 있으면 마지막 점수만 저장 (차례로 수정한 것과 결과가 같음)
+        수정 학생 조회 1번 + 새 총점 종류마다 등수 계산 1번 + bulk_write 1번 + 요약 문서 1번
+        다른 학생의 등수 변화는 수정 전후 총점 경계로 나눈 구간마다 UpdateMany 하나로 묶음
+        """
+        updates = list(updates)
+        final = {}
+        for student_id, english, c_language, python in updates:
+            final[student_id] = Student(student_id, "", english, c_language, python).score_fields()
+        if not final:
+            return 0
+        ids = list(final)
+
+        def work(session):
+            befores = {d["student_id"]: d for d in self.collection.find(
+                {"student_id": {"$in": ids}}, {"_id": 0}, session=session
+            )}
+            if not befores:
+                return []
+            old_totals = [d["total"] for d in befores.values()]
+            new_totals = [final[student_id]["total"] for student_id in befores]
+            others = {"student_id": {"$nin": list(befores)}}
 
+            # 수정 학생의 등수 = 총점이 더 높은 (다른 학생 수 + 수정 학생 수) + 1
+            # 다른 학생 수는 total 인덱스 개수에서 아직 이전 총점으로 저장된 수정 학생을 빼서 구함
+            ranks = {}
+            for total in set(new_totals):
+                higher = self.collection.count_documents({"total": {"$gt": total}}, session=session)
+                higher -= sum(1 for t in old_totals if t > total)
+                ranks[total] = higher + sum(1 for t in new_totals if t > total) + 1
+
+            now = datetime.now()
+            requests = []
+            changes = []
+            for student_id, before in befores.items():
+                fields = dict(final[student_id], rank=ranks[final[student_id]["total"]])
+                requests.append(UpdateOne({"student_id": student_id},
+                                          {"$set": dict(fields, updated_at=now), "$inc": {"version": 1}}))
+                changes.append((before, dict(before, version=before.get("version", 0) + 1, **fields)))
+
+            # 총점 t인 다른 학생의 등수 변화 = (새 총점 > t인 수정 학생 수) - (이전 총점 > t인 수정 학생 수)
+            # 경계값 사이 구간에서는 일정하므로 구간마다 한 번씩만 갱신
+            bounds = sorted(set(old_totals) | set(new_totals))
+            for low, high in zip(bounds, bounds[1:]):
+                shift = sum(1 for t in new_totals if t > low) - sum(1 for t in old_totals if t > low)
+                if shift:
+                    requests.append(UpdateMany(
+                        dict(others, total={"$gte": low, "$lt": high}),
+                        {"$inc": {"rank": shift}, "$set": {"updated_at": now}}
+                    ))
+            self.collection.bulk_write(requests, ordered=True, session=session)
+            self._summary_after_update(changes, session)
+            return changes
+
+        changes = self._atomic(work)
+        if not changes:
+            return 0
+        if self.cache is not None:
+            self.cache.clear()
+        updated = {before["student_id"] for before, _ in changes}
+        return sum(1 for update in updates if update[0] in updated)
+
+    @instrumented
     def input_students(self, count=5):
         """여러 학생 입력"""
         print(f"{count}명의 학생 정보를 입력하세요.")
@@ -142,175 +558,546 @@ class MongoGradeManager:
             print(f"\n{i+1}번째 학생:")
             self.add_student()
 
+    @instrumented
     def calculate_ranks(self):
-        """등수 계산 및 업데이트"""
+        """등수 계산 및 업데이트 (서버에서 한 번에 계산하여 일괄 저장)"""
         try:
-            # 총점 기준으로 정렬하여 조회
-            students_data = list(self.collection.find().sort("total", -1))
-            
-            rank = 1
-            prev_total = None
-            
-            for i, student_data in enumerate(students_data):
-                if prev_total is not None and student_data["total"] == prev_total:
-                    current_rank = rank
-                else:
-                    rank = i + 1
-                    current_rank = rank
-                
-                # 등수 업데이트
-                self.collection.update_one(
-                    {"_id": student_data["_id"]},
-                    {"$set": {"rank": current_rank, "updated_at": datetime.now()}}
-                )
-                
-                prev_total = student_data["total"]
-                
+            # 같은 프로세스의 추가/삭제가 재계산 도중에 끼어들지 않도록 쓰기 잠금 안에서 계산
+            # ($merge는 트랜잭션 안에서 쓸 수 없으므로 다른 프로세스의 쓰기와는 겹칠 수 있음)
+            with self._write_lock:
+                # 총점 내림차순으로 동점자는 같은 등수, 다음 등수는 건너뜀 (1, 2, 2, 4 ...)
+                pipeline = [
+                    {"$setWindowFields": {
+                        "sortBy": {"total": -1},
+                        "output": {"rank": {"$rank": {}}}
+                    }},
+                    {"$project": {"rank": 1, "updated_at": "$$NOW"}},
+                    {"$merge": {
+                        "into": self.collection.name,
+                        "on": "_id",
+                        "whenMatched": "merge",
+                        "whenNotMatched": "discard"
+                    }}
+                ]
+                try:
+                    self.collection.aggregate(pipeline)
+                except OperationFailure:
+                    # $setWindowFields를 지원하지 않는 서버(5.0 미만)는 일괄 쓰기로 대체
+                    self._calculate_ranks_bulk()
+                finally:
+                    # 등수가 모두 바뀔 수 있으므로 학생 목록 캐시는 전부 비움
+                    if self.cache is not None:
+                        self.cache.clear()
+
         except Exception as e:
-            print(f"등수 계산 중 오류 발생: {e}")
+            self._report_error("등수 계산", e)
 
-    def print_results(self):
-        """모든 학생 정보 출력"""
-        try:
-            students_data = list(self.collection.find().sort("rank", 1))
-            
-            if not students_data:
-                print("\n학생 정보가 없습니다.")
-                return
+    def _calculate_ranks_bulk(self):
+        """총점과 _id만 조회한 뒤 등수가 바뀐 문서만 한 번의 bulk_write로 저장"""
+        cursor = self.collection.find({}, {"total": 1, "rank": 1}).sort("total", -1)
+
+        requests = []
+        now = datetime.now()
+        rank = 1
+        prev_total = None
+
+        for i, student_data in enumerate(cursor):
+            if prev_total is None or student_data["total"] != prev_total:
+                rank = i + 1
+            if student_data.get("rank") != rank:
+                # 읽은 뒤 총점이 바뀐 문서에는 이 등수를 쓰지 않음 (다음 재계산에서 맞춰짐)
+                requests.append(UpdateOne(
+                    {"_id": student_data["_id"], "total": student_data["total"]},
+                    {"$set": {"rank": rank, "updated_at": now}}
+                ))
+            prev_total = student_data["total"]
+
+        if requests:
+            self.collection.bulk_write(requests, ordered=False)
+
+    def _rank_of_total(self, total, session=None):
+        """주어진 총점의 등수 = 총점이 더 높은 학생 수 + 1"""
+        return self.collection.count_documents({"total": {"$gt": total}}, session=session) + 1
 
-            print("\n" + " 성적관리 프로그램 ".center(80, "="))
+    def _rank_after_insert(self, total, session=None):
+        """학생 한 명 추가 후 새 학생보다 총점이 낮은 학생의 등수만 1씩 밀어냄"""
+        self.collection.update_many(
+            {"total": {"$lt": total}},
+            {"$inc": {"rank": 1}, "$set": {"updated_at": datetime.now()}},
+            session=session
+        )
+
+    def _rank_after_delete(self, total, session=None):
+        """학생 한 명 삭제 후 삭제된 학생보다 총점이 낮은 학생의 등수만 1씩 당김"""
+        self.collection.update_many(
+            {"total": {"$lt": total}},
+            {"$inc": {"rank": -1}, "$set": {"updated_at": datetime.now()}},
+            session=session
+        )
+
+    def _rank_after_update(self, student_id, old_total, new_total, session=None):
+        """
+        학생 한 명의 총점이 바뀐 뒤 두 총점 사이에 있는 다른 학생의 등수만 1씩 옮김
+        - 올랐으면 [이전, 새) 구간의 학생이 한 칸 밀림
+        - 내렸으면 [새, 이전) 구간의 학생이 한 칸 당겨짐
+        """
+        if new_total == old_total:
+            return
+        low, high, shift = (old_total, new_total, 1) if new_total > old_total else (new_total, old_total, -1)
+        self.collection.update_many(
+            {"total": {"$gte": low, "$lt": high}, "student_id": {"$ne": student_id}},
+            {"$inc": {"rank": shift}, "$set": {"updated_at": datetime.now()}},
+            session=session
+        )
+
+    def iter_students(self, sort_field="rank", batch_size=DEFAULT_BATCH_SIZE):
+        """출력에 필요한 필드만 가져오면서 커서를 batch_size 단위로 순회"""
+        cursor = (self.collection.find({}, DISPLAY_FIELDS)
+                  .sort(SORT_KEYS[sort_field])
+                  .batch_size(batch_size))
+        for student_data in cursor:
+            yield student_data
+
+    @instrumented
+    def fetch_page(self, sort_field="rank", page_size=50, after=None):
+        """
+        키 기반(keyset) 페이지 조회
+        after: 이전 페이지가 반환한 다음 키 (첫 페이지는 None)
+        반환값: (학생 문서 리스트, 다음 페이지 키 또는 None)
+        """
+        sort = SORT_KEYS[sort_field]
+        query = _after_key_query(sort, after) if after else {}
+        students_data = list(self.collection.find(query, DISPLAY_FIELDS).sort(sort).limit(page_size))
+
+        next_key = None
+        if len(students_data) == page_size:
+            last = students_data[-1]
+            next_key = (last[sort[0][0]], last["student_id"])
+        return students_data, next_key
+
+    def iter_sorted(self, keys, tie_break="student_id", external=False, run_size=100000):
+        """
+        여러 기준으로 정렬된 학생 문서를 하나씩 생성 (내보내기용)
+        external=False: MongoDB에서 정렬 (필요하면 서버 디스크 사용)
+        external=True: 커서를 그대로 읽으며 클라이언트에서 외부 정렬 (임시 파일 사용)
+        """
+        parsed = parse_keys(keys, tie_break)
+        if external:
+            cursor = self.collection.find({}, {"_id": 0}).batch_size(DEFAULT_BATCH_SIZE)
+            return external_sort(cursor, keys, tie_break, run_size=run_size)
+
+        sort = [(field, -1 if descending else 1) for field, descending in parsed]
+        if tie_break == "stable":
+            # 서버 정렬은 동점 순서가 정해져 있지 않으므로 입력(_id) 순서로 고정
+            sort.append(("_id", 1))
+        cursor = self.collection.find({}, {"_id": 0}).sort(sort).allow_disk_use(True)
+        return iter(cursor.batch_size(DEFAULT_BATCH_SIZE))
+
+    def _print_table(self, title, sort_field, page_size=None, batch_size=DEFAULT_BATCH_SIZE):
+        """
+        학생 표 출력 (Student 객체로 변환하지 않고 문서를 바로 출력)
+        page_size를 지정하면 한 페이지씩 출력하고 Enter 입력을 기다림
+        반환값: 출력한 학생 수
+        """
+        count = 0
+        header_printed = False
+
+        def print_header():
+            print(title)
             print("=" * 100)
             print(f"{'학번':<15}{'이름':<10}{'영어':<8}{'C-언어':<8}{'파이썬':<8}{'총점':<8}{'평균':<8}{'학점':<6}{'등수':<6}")
             print("=" * 100)
 
+        if page_size is None:
+            for student_data in self.iter_students(sort_field, batch_size):
+                if not header_printed:
+                    print_header()
+                    header_printed = True
+                print(format_row(student_data))
+                count += 1
+            return count
+
+        after = None
+        while True:
+            students_data, after = self.fetch_page(sort_field, page_size, after)
+            if students_data and not header_printed:
+                print_header()
+                header_printed = True
             for student_data in students_data:
-                student = Student.from_dict(student_data)
-                print(student.display())
-                
+                print(format_row(student_data))
+            count += len(students_data)
+            if after is None:
+                return count
+            if input("-- 다음 페이지: Enter, 그만 보기: q --").strip().lower() == "q":
+                return count
+
+    @instrumented
+    def print_results(self, page_size=None):
+        """모든 학생 정보 출력 (등수순, 커서 스트리밍)"""
+        try:
+            count = self._print_table("\n" + " 성적관리 프로그램 ".center(80, "="), "rank", page_size)
+
+            if not count:
+                print("\n학생 정보가 없습니다.")
+                return
+
             print("=" * 100)
-            print(f"총 학생 수: {len(students_data)}명")
+            print(f"출력한 학생 수: {count}명")
             
         except Exception as e:
-            print(f"학생 정보 출력 중 오류 발생: {e}")
+            self._report_error("학생 정보 출력", e)
 
+    @instrumented
     def delete_student(self):
         """학생 삭제"""
         try:
             student_id = input("삭제할 학생의 학번 입력: ")
             
-            # 삭제할 학생 정보 먼저 조회
-            student_data = self.collection.find_one({"student_id": student_id})
+            student_data = self.remove_student(student_id)
             
             if student_data:
-                result = self.collection.delete_one({"student_id": student_id})
-                if result.deleted_count > 0:
-                    print(f"\n학번 {student_id} 학생({student_data['name']})이 삭제되었습니다.")
-                    self.calculate_ranks()  # 등수 재계산
-                else:
-                    print("삭제에 실패했습니다.")
+                print(f"\n학번 {student_id} 학생({student_data['name']})이 삭제되었습니다.")
             else:
                 print("해당 학번의 학생을 찾을 수 없습니다.")
                 
         except Exception as e:
-            print(f"학생 삭제 중 오류 발생: {e}")
+            self._report_error("학생 삭제", e)
+
+    @instrumented
+    def edit_scores(self):
+        """학번으로 학생을 찾아 세 과목 점수 수정"""
+        try:
+            student_id = input("수정할 학생의 학번 입력: ").strip()
+            english = int(input("영어 점수: "))
+            c_language = int(input("C-언어 점수: "))
+            python = int(input("파이썬 점수: "))
+
+            student_data = self.update_scores(student_id, english, c_language, python)
+            if student_data is None:
+                print("해당 학번의 학생을 찾을 수 없습니다.")
+            else:
+                print(f"학번 {student_id} 학생의 성적이 수정되었습니다. "
+                      f"(총점: {student_data['total']}, 학점: {student_data['grade']}, 등수: {student_data['rank']})")
+
+        except ValueError:
+            print("점수는 숫자로 입력해주세요.")
+        except Exception as e:
+            self._report_error("성적 수정", e)
+
+    def ensure_indexes(self):
+        """INDEXES에 선언된 인덱스를 모두 생성 (이미 있으면 그대로 둠)"""
+        for keys, options in INDEXES:
+            self.collection.create_index(keys, **options)
+
+    def verify_indexes(self):
+        """선언된 인덱스 중 컬렉션에 없는 인덱스 이름 목록을 반환"""
+        existing = self.collection.index_information()
+        missing = [options["name"] for _, options in INDEXES if options["name"] not in existing]
+        if missing:
+            logging.warning(f"Missing indexes on {self.collection.name}: {missing}")
+        return missing
+
+    def _cached(self, key, loader):
+        """캐시가 있으면 캐시를 거쳐 조회 (반환값은 읽기 전용으로 사용)"""
+        if self.cache is None:
+            return loader()
+        return self.cache.get_or_load(key, loader)
+
+    def invalidate_cache(self, student_data, added):
+        """
+        학생 한 명이 추가(added=True) 또는 삭제되었을 때 영향을 받는 캐시 항목만 제거
+        - 통계는 항상 제거
+        - 그 학생이 들어 있거나, 총점이 더 낮아 등수가 바뀌는 학생이 들어 있는 목록
+        - 추가인 경우 새 학생이 결과에 새로 들어가게 되는 검색/상위 N명 목록
+        """
+        if self.cache is None:
+            return
+        student_id = student_data["student_id"]
+        name = student_data["name"]
+        total = student_data["total"]
+
+        def affected(key, value):
+            kind = key[0]
+            if kind == "stats":
+                return True
+            if any(d["student_id"] == student_id or d["total"] < total for d in value):
+                return True
+            if not added:
+                return False
+            if kind == "search":
+                return key[1] in (student_id, name)
+            if kind == "prefix":
+                _, prefix, case_insensitive, _ = key
+                if case_insensitive:
+                    return name.casefold().startswith(prefix.casefold())
+                return name.startswith(prefix)
+            if kind == "top":
+                return len(value) < key[1] or total >= value[-1]["total"]
+            return True
+
+        self.cache.invalidate_where(affected)
+
+    @instrumented
+    def find_students(self, key):
+        """학번 또는 이름이 정확히 일치하는 학생 문서 목록 (두 조건 모두 인덱스 사용)"""
+        query = {"$or": [{"student_id": key}, {"name": key}]}
+        return self._cached(("search", key), lambda: list(self.collection.find(query, {"_id": 0})))
+
+    @instrumented
+    def top_students(self, n):
+        """총점 상위 n명 (total 인덱스 순서로 n건만 읽음)"""
+        if n <= 0:
+            # limit(0)은 제한 없음이므로 전체를 읽어 캐시에 넣지 않도록 여기서 끝냄
+            return []
+        return self._cached(("top", n), lambda: list(
+            self.collection.find({}, DISPLAY_FIELDS).sort(SORT_KEYS["total"]).limit(n)
+        ))
 
+    @instrumented
+    def rank_of(self, student_id):
+        """학생의 등수 = 총점이 더 높은 학생 수 + 1 (total 인덱스로 셈, 없으면 None)"""
+        student_data = self.collection.find_one({"student_id": student_id}, {"_id": 0, "total": 1})
+        if student_data is None:
+            return None
+        return self._rank_of_total(student_data["total"])
+
+    @instrumented
+    def percentile_total(self, p):
+        """
+        하위 p% 지점의 총점 (nearest-rank 방식)
+        학생 수는 통계 요약에서 읽고, total 인덱스만 훑어서(문서를 읽지 않음) k번째 값을 찾음
+        """
+        n = self.fetch_statistics()["count"]
+        if n == 0:
+            return None
+        k = max(1, math.ceil(p / 100 * n))
+        student_data = self.collection.find_one(
+            {}, {"_id": 0, "total": 1}, sort=TOTAL_ASCENDING, skip=k - 1
+        )
+        return student_data["total"] if student_data else None
+
+    @instrumented
+    def students_at_percentile(self, p):
+        """하위 p% 지점 총점을 가진 학생 문서 목록"""
+        total = self.percentile_total(p)
+        if total is None:
+            return []
+        return list(self.collection.find({"total": total}, DISPLAY_FIELDS))
+
+    @instrumented
+    def search_by_name(self, prefix, case_insensitive=False, limit=None):
+        """
+        이름 앞부분(prefix)으로 학생 검색
+        - 대소문자 구분: ^로 시작하는 정규식 → name 인덱스 범위 검색
+        - 대소문자 무시: 대소문자 무시 collation 인덱스에서 범위 검색
+        """
+        return self._cached(("prefix", prefix, case_insensitive, limit),
+                            lambda: self._search_by_name(prefix, case_insensitive, limit))
+
+    def _search_by_name(self, prefix, case_insensitive, limit):
+        if case_insensitive:
+            # U+FFFF는 collation에서 가장 큰 문자이므로 prefix로 시작하는 모든 이름이 범위에 포함됨
+            cursor = self.collection.find(
+                {"name": {"$gte": prefix, "$lt": prefix + "\uffff"}}, {"_id": 0}
+            ).collation(NAME_COLLATION)
+        else:
+            cursor = self.collection.find({"name": {"$regex": "^" + re.escape(prefix)}}, {"_id": 0})
+
+        cursor = cursor.sort("name", 1)
+        if limit:
+            cursor = cursor.limit(limit)
+        return list(cursor)
+
+    def explain_query(self, query, sort=None, collation=None):
+        """쿼리 실행 계획(winningPlan)에 나타나는 단계(stage) 이름 목록을 반환"""
+        cursor = self.collection.find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        if collation:
+            cursor = cursor.collation(collation)
+        plan = cursor.explain()["queryPlanner"]["winningPlan"]
+        return _plan_stages(plan)
+
+    def check_query_plan(self, query, sort=None, collation=None):
+        """인덱스를 쓰지 못하고 전체 스캔(COLLSCAN)하거나 메모리에서 정렬(SORT)하면 경고 후 False 반환"""
+        stages = self.explain_query(query, sort, collation)
+        if "COLLSCAN" in stages or "SORT" in stages:
+            logging.warning(f"Unindexed plan for query={query} sort={sort}: {stages}")
+            print(f"경고: 인덱스를 사용하지 않는 쿼리입니다 ({query}, 정렬: {sort})")
+            return False
+        return True
+
+    def check_query_plans(self):
+        """자주 쓰는 쿼리 형태가 모두 인덱스를 사용하는지 확인"""
+        shapes = {
+            "학번/이름 검색": ({"$or": [{"student_id": ""}, {"name": ""}]}, None, None),
+            "이름 앞부분 검색": ({"name": {"$regex": "^a"}}, None, None),
+            "이름 검색(대소문자 무시)": ({"name": {"$gte": "a", "$lt": "a\uffff"}}, None, NAME_COLLATION),
+            "80점 이상": ({"average": {"$gte": 80}}, [("average", -1)], None),
+            "총점순 정렬": ({}, SORT_KEYS["total"], None),
+            "등수순 정렬": ({}, SORT_KEYS["rank"], None),
+            "백분위 총점": ({}, TOTAL_ASCENDING, None),
+        }
+        return {name: self.check_query_plan(*shape) for name, shape in shapes.items()}
+
+    @instrumented
     def search_student(self):
         """학생 검색 (학번 또는 이름으로)"""
         try:
             key = input("검색할 학번 또는 이름 입력: ")
             
-            # 학번 또는 이름으로 검색
-            query = {"$or": [{"student_id": key}, {"name": key}]}
-            students_data = list(self.collection.find(query))
+            # 학번 또는 이름으로 검색, 없으면 대소문자 무시 이름 앞부분 검색
+            students_data = self.find_students(key)
+            if not students_data and key:
+                students_data = self.search_by_name(key, case_insensitive=True, limit=20)
             
             if students_data:
                 print(f"\n검색 결과: {len(students_data)}명")
                 print("=" * 80)
                 for student_data in students_data:
-                    student = Student.from_dict(student_data)
-                    print(f"학번: {student.student_id}, 이름: {student.name}, "
-                          f"총점: {student.total}, 평균: {student.average:.2f}, "
-                          f"학점: {student.grade}, 등수: {student.rank}")
+                    print(f"학번: {student_data['student_id']}, 이름: {student_data['name']}, "
+                          f"총점: {student_data['total']}, 평균: {student_data['average']:.2f}, "
+                          f"학점: {student_data['grade']}, 등수: {student_data['rank']}")
                 print("=" * 80)
             else:
                 print("해당 조건의 학생을 찾을 수 없습니다.")
                 
         except Exception as e:
-            print(f"학생 검색 중 오류 발생: {e}")
+            self._report_error("학생 검색", e)
 
-    def sort_students_by_total(self):
-        """총점 기준 정렬 후 출력"""
+    @instrumented
+    def sort_students_by_total(self, page_size=None):
+        """총점 기준 정렬 후 출력 (커서 스트리밍)"""
         try:
-            students_data = list(self.collection.find().sort("total", -1))
-            
-            if not students_data:
-                print("\n학생 정보가 없습니다.")
-                return
-                
-            print("\n총점 기준 정렬 결과:")
-            print("=" * 100)
-            print(f"{'학번':<15}{'이름':<10}{'영어':<8}{'C-언어':<8}{'파이썬':<8}{'총점':<8}{'평균':<8}{'학점':<6}{'등수':<6}")
-            print("=" * 100)
+            count = self._print_table("\n총점 기준 정렬 결과:", "total", page_size)
 
-            for student_data in students_data:
-                student = Student.from_dict(student_data)
-                print(student.display())
+            if not count:
+                print("\n학생 정보가 없습니다.")
                 
         except Exception as e:
-            print(f"정렬 중 오류 발생: {e}")
+            self._report_error("정렬", e)
+
+    def _summary_after_insert(self, student_data, session=None):
+        """
+        학생 추가를 요약 문서에 원자적으로 반영 ($inc/$min/$max 한 번)
+        요약 문서가 없으면(이전 버전에서 올렸거나 지워진 경우) 이 학생 한 명만 센 요약을 만들지 않고 전체를 다시 집계
+        """
+        result = self.summary.update_one({"_id": SUMMARY_ID}, summary_update(student_data, 1), session=session)
+        if result.matched_count == 0:
+            self._rebuild_summary(session)
+
+    def _summary_after_delete(self, student_data, session=None):
+        """학생 삭제를 요약 문서에 반영 (최고/최저 총점이 빠지면 인덱스로 다시 찾음)"""
+        summary = self.summary.find_one_and_update(
+            {"_id": SUMMARY_ID}, summary_update(student_data, -1),
+            return_document=ReturnDocument.AFTER, session=session
+        )
+        if summary is None:
+            return
+
+        if summary["count"] <= 0:
+            self.summary.update_one({"_id": SUMMARY_ID}, {"$unset": {"min_total": "", "max_total": ""}},
+                                    session=session)
+        elif student_data["total"] in (summary.get("min_total"), summary.get("max_total")):
+            self._refresh_total_range(session)
+
+    def _summary_after_update(self, changes, session=None):
+        """점수 수정 목록을 요약 문서에 반영 (수정 전 총점이 최고/최저였으면 인덱스로 다시 찾음)"""
+        summary = self.summary.find_one_and_update(
+            {"_id": SUMMARY_ID}, summary_change(changes),
+            return_document=ReturnDocument.AFTER, session=session
+        )
+        if summary is None:
+            return
+        ends = (summary.get("min_total"), summary.get("max_total"))
+        if any(before["total"] != after["total"] and before["total"] in ends for before, after in changes):
+            self._refresh_total_range(session)
+
+    def _refresh_total_range(self, session=None):
+        """total 인덱스 양 끝에서 한 건씩만 읽어 요약 문서의 최고/최저 총점을 다시 맞춤"""
+        lowest = self.collection.find_one({}, {"total": 1}, sort=[("total", 1)], session=session)
+        highest = self.collection.find_one({}, {"total": 1}, sort=[("total", -1)], session=session)
+        self.summary.update_one(
+            {"_id": SUMMARY_ID},
+            {"$set": {"min_total": lowest["total"], "max_total": highest["total"]}},
+            session=session
+        )
+
+    @instrumented
+    def rebuild_statistics(self):
+        """전체 컬렉션을 한 번 집계하여 요약 문서를 다시 만듦 (불일치 복구용)"""
+        # 집계와 교체 사이에 추가/삭제가 끼어들어 그 반영분이 사라지지 않도록 함
+        # (트랜잭션을 쓰면 다른 프로세스의 쓰기와도 요약 문서에서 충돌로 감지됨)
+        summary = self._atomic(self._rebuild_summary)
+        if self.cache is not None:
+            self.cache.invalidate_where(lambda key, value: key[0] == "stats")
+        return summary
+
+    def _rebuild_summary(self, session=None):
+        summary = build_summary(self.collection.aggregate(summary_pipeline(), session=session))
+        self.summary.replace_one({"_id": SUMMARY_ID}, summary, upsert=True, session=session)
+        return summary
 
+    @instrumented
+    def fetch_statistics(self):
+        """요약 문서를 읽어 반환 (없으면 한 번 다시 만듦)"""
+        summary = self._cached(("stats",), lambda: self.summary.find_one({"_id": SUMMARY_ID}))
+        if summary is None:
+            summary = self.rebuild_statistics()
+        return summary
+
+    @instrumented
     def count_above_80(self):
         """80점 이상 학생 수 조회"""
         try:
-            count = self.collection.count_documents({"average": {"$gte": 80}})
+            count = self.fetch_statistics()["above"].get("80", 0)
             print(f"\n80점 이상 학생 수: {count}명")
             
-            # 80점 이상 학생들의 상세 정보도 출력
+            # 80점 이상 학생들의 상세 정보도 출력 (average 인덱스 순서로 스트리밍)
             if count > 0:
-                students_data = list(self.collection.find({"average": {"$gte": 80}}).sort("average", -1))
+                cursor = self.collection.find(
+                    {"average": {"$gte": 80}}, {"_id": 0, "student_id": 1, "name": 1, "average": 1}
+                ).sort("average", -1)
                 print("\n80점 이상 학생 명단:")
                 print("-" * 60)
-                for student_data in students_data:
+                for student_data in cursor:
                     print(f"{student_data['name']}({student_data['student_id']}): {student_data['average']:.2f}점")
                     
         except Exception as e:
-            print(f"통계 조회 중 오류 발생: {e}")
+            self._report_error("통계 조회", e)
 
+    @instrumented
     def get_statistics(self):
-        """전체 통계 정보"""
+        """전체 통계 정보 (요약 문서 한 건 조회)"""
         try:
-            pipeline = [
-                {
-                    "$group": {
-                        "_id": None,
-                        "total_students": {"$sum": 1},
-                        "avg_english": {"$avg": "$english"},
-                        "avg_c_language": {"$avg": "$c_language"},
-                        "avg_python": {"$avg": "$python"},
-                        "avg_total": {"$avg": "$total"},
-                        "max_total": {"$max": "$total"},
-                        "min_total": {"$min": "$total"}
-                    }
-                }
-            ]
-            
-            result = list(self.collection.aggregate(pipeline))
+            stats = self.fetch_statistics()
+            count = stats["count"]
             
-            if result:
-                stats = result[0]
+            if count > 0:
                 print("\n=== 전체 통계 ===")
-                print(f"총 학생 수: {stats['total_students']}명")
-                print(f"영어 과목 평균: {stats['avg_english']:.2f}점")
-                print(f"C-언어 과목 평균: {stats['avg_c_language']:.2f}점")
-                print(f"파이썬 과목 평균: {stats['avg_python']:.2f}점")
-                print(f"전체 평균: {stats['avg_total']:.2f}점")
+                print(f"총 학생 수: {count}명")
+                print(f"영어 과목 평균: {stats['sum_english'] / count:.2f}점")
+                print(f"C-언어 과목 평균: {stats['sum_c_language'] / count:.2f}점")
+                print(f"파이썬 과목 평균: {stats['sum_python'] / count:.2f}점")
+                print(f"전체 평균: {stats['sum_total'] / count:.2f}점")
                 print(f"최고 총점: {stats['max_total']}점")
                 print(f"최저 총점: {stats['min_total']}점")
+                grades = ", ".join(f"{grade}: {n}명" for grade, n in sorted(stats["grades"].items()) if n)
+                print(f"학점 분포: {grades}")
             else:
                 print("\n통계 정보가 없습니다.")
                 
         except Exception as e:
-            print(f"통계 조회 중 오류 발생: {e}")
+            self._report_error("통계 조회", e)
+
+    @instrumented
+    def repair_statistics(self):
+        """통계 요약 문서 재계산"""
+        try:
+            summary = self.rebuild_statistics()
+            print(f"\n통계를 다시 계산했습니다. (학생 수: {summary['count']}명)")
+        except Exception as e:
+            self._report_error("통계 재계산", e)
 
     def close_connection(self):
         """MongoDB 연결 종료"""
@@ -320,10 +1107,15 @@ class MongoGradeManager:
 
 def main():
     try:
+        # GRADE_METRICS_FILE을 지정하면 작업 측정을 켜고 종료할 때 Prometheus 텍스트 파일로 저장
+        metrics_file = os.environ.get("GRADE_METRICS_FILE")
+        metrics = Metrics() if metrics_file else None
+
         # MongoDB 연결 (필요시 연결 문자열 수정)
         manager = MongoGradeManager(
             connection_string="mongodb://localhost:27017/",
-            db_name="grade_management"
+            db_name="grade_management",
+            metrics=metrics
         )
         
         while True:
@@ -338,6 +1130,8 @@ def main():
             print("6. 총점 기준 정렬")
             print("7. 80점 이상 학생 수 출력")
             print("8. 전체 통계")
+            print("9. 통계 재계산")
+            print("10. 학생 성적 수정")
             print("0. 종료")
             print("="*50)
             
@@ -346,6 +1140,8 @@ def main():
             if choice == "0":
                 print("프로그램을 종료합니다.")
                 manager.close_connection()
+                if metrics is not None:
+                    metrics.write_prometheus(metrics_file)
                 break
             elif choice == "1":
                 manager.input_students()
@@ -363,8 +1159,12 @@ def main():
                 manager.count_above_80()
             elif choice == "8":
                 manager.get_statistics()
+            elif choice == "9":
+                manager.repair_statistics()
+            elif choice == "10":
+                manager.edit_scores()
             else:
-                print("잘못된 입력입니다. 0~8 중에서 선택하세요.")
+                print("잘못된 입력입니다. 0~10 중에서 선택하세요.")
                 
     except Exception as e:
         print(f"프로그램 실행 중 오류 발생: {e}")
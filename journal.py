@@ -0,0 +1,230 @@
+##############################
+# 프로그램명: 성적 데이터 저장 엔진 (스냅샷 + 저널)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - GradeManager(main.py)의 추가/삭제/점수 수정을 추가 전용(append-only) 저널 파일에 기록
+#   - 여러 건을 모아 한 번에 fsync 하는 그룹 커밋(group commit)
+#   - 주기적으로 전체 학생을 압축된 바이너리 스냅샷으로 저장하고 저널을 새로 시작
+#   - 시작 시 최신 스냅샷을 mmap으로 읽고 그 이후의 저널만 다시 적용
+#
+# 파일 구성 (data_dir 아래):
+#   snapshot.bin        헤더(매직, 버전, 세대, 학생 수) + 학생 레코드
+#   journal-<세대>.log  레코드: 길이(4) + CRC32(4) + [종류(1) + 내용]
+##############################
+
+import mmap
+import os
+import struct
+import threading
+import time
+import zlib
+
+SNAPSHOT_MAGIC = b"GRSN"
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct("<4sHIQ")   # 매직, 버전, 세대, 학생 수
+RECORD_HEADER = struct.Struct("<II")        # 내용 길이, CRC32
+SCORES = struct.Struct("<iii")              # 영어, C-언어, 파이썬
+STRING_LEN = struct.Struct("<H")
+
+OP_ADD = 1
+OP_DELETE = 2
+OP_UPDATE = 3     # 점수 수정: 학번 + 세 과목 점수
+
+
+def _pack_string(text):
+    data = text.encode("utf-8")
+    return STRING_LEN.pack(len(data)) + data
+
+
+def _unpack_string(buffer, offset):
+    (length,) = STRING_LEN.unpack_from(buffer, offset)
+    offset += STRING_LEN.size
+    return str(buffer[offset:offset + length], "utf-8"), offset + length
+
+
+def _pack_student(student):
+    return (_pack_string(student.student_id) + _pack_string(student.name)
+            + SCORES.pack(student.english, student.c_language, student.python))
+
+
+def _unpack_student(buffer, offset):
+    """(학번, 이름, 영어, C-언어, 파이썬), 다음 위치"""
+    student_id, offset = _unpack_string(buffer, offset)
+    name, offset = _unpack_string(buffer, offset)
+    scores = SCORES.unpack_from(buffer, offset)
+    return (student_id, name) + scores, offset + SCORES.size
+
+
+class GradeStore:
+    def __init__(self, data_dir, group_size=256, group_interval=0.05, snapshot_every=100000):
+        """
+        data_dir: 스냅샷과 저널을 저장할 폴더
+        group_size: 이만큼 쌓이면 저널을 fsync (그룹 커밋)
+        group_interval: 마지막 커밋 후 이 시간(초)이 지나도 fsync
+            (뒤이은 기록이 없어도 이 시간 뒤에 타이머가 남은 기록을 fsync)
+        snapshot_every: 저널에 이만큼 쌓이면 스냅샷을 새로 만듦 (0이면 자동 스냅샷 안 함)
+        """
+        self.data_dir = data_dir
+        self.group_size = group_size
+        self.group_interval = group_interval
+        self.snapshot_every = snapshot_every
+        self.generation = 0
+        self._pending = []
+        self._last_commit = time.monotonic()
+        self._journal_records = 0
+        self._journal = None
+        self._timer = None
+        self._lock = threading.RLock()   # 타이머 스레드의 커밋과 기록이 겹치지 않도록
+        os.makedirs(data_dir, exist_ok=True)
+
+    @property
+    def snapshot_path(self):
+        return os.path.join(self.data_dir, "snapshot.bin")
+
+    def journal_path(self, generation):
+        return os.path.join(self.data_dir, f"journal-{generation}.log")
+
+    def load(self, manager, student_class):
+        """스냅샷과 저널 꼬리를 manager에 적용하고 새 기록을 받을 준비 (적용한 저널 건수 반환)"""
+        if os.path.exists(self.snapshot_path):
+            self.generation = self._load_snapshot(manager, student_class)
+
+        replayed = 0
+        path = self.journal_path(self.generation)
+        if os.path.exists(path):
+            replayed, valid_end = self._replay_journal(manager, student_class, path)
+            # 마지막에 덜 쓰인 레코드가 있으면 잘라냄
+            if valid_end < os.path.getsize(path):
+                with open(path, "r+b") as f:
+                    f.truncate(valid_end)
+
+        self._journal_records = replayed
+        self._journal = open(path, "ab")
+        return replayed
+
+    def _load_snapshot(self, manager, student_class):
+        with open(self.snapshot_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < SNAPSHOT_HEADER.size:
+                raise ValueError("스냅샷 파일이 손상되었습니다.")
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                magic, version, generation, count = SNAPSHOT_HEADER.unpack_from(buffer, 0)
+                if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                    raise ValueError("스냅샷 파일 형식이 올바르지 않습니다.")
+                offset = SNAPSHOT_HEADER.size
+                students = []
+                for _ in range(count):
+                    fields, offset = _unpack_student(buffer, offset)
+                    students.append(student_class(*fields))
+        manager.load_students(students)
+        return generation
+
+    def _replay_journal(self, manager, student_class, path):
+        """(적용한 레코드 수, 마지막 정상 레코드 끝 위치)"""
+        replayed = 0
+        offset = 0
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return 0, 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                while offset + RECORD_HEADER.size <= size:
+                    length, crc = RECORD_HEADER.unpack_from(buffer, offset)
+                    # 0으로 채워진 꼬리는 CRC도 맞으므로(crc32(b"") == 0) 길이로 걸러냄
+                    if length == 0:
+                        break
+                    start = offset + RECORD_HEADER.size
+                    payload = buffer[start:start + length]
+                    if len(payload) < length or zlib.crc32(payload) != crc:
+                        break
+                    if payload[0] == OP_ADD:
+                        fields, _ = _unpack_student(payload, 1)
+                        manager.insert(student_class(*fields))
+                    elif payload[0] == OP_DELETE:
+                        student_id, _ = _unpack_string(payload, 1)
+                        manager.remove(student_id)
+                    elif payload[0] == OP_UPDATE:
+                        student_id, position = _unpack_string(payload, 1)
+                        manager.update_scores(student_id, *SCORES.unpack_from(payload, position))
+                    replayed += 1
+                    offset = start + length
+        return replayed, offset
+
+    def _append(self, payload):
+        record = RECORD_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        with self._lock:
+            self._pending.append(record)
+            self._journal_records += 1
+            if (len(self._pending) >= self.group_size
+                    or time.monotonic() - self._last_commit >= self.group_interval):
+                self.commit()
+            elif self._timer is None:
+                # 다음 기록이 오지 않아도 group_interval 안에 저장되도록 예약
+                self._timer = threading.Timer(self.group_interval, self.commit)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def log_add(self, student):
+        self._append(bytes([OP_ADD]) + _pack_student(student))
+
+    def log_delete(self, student_id):
+        self._append(bytes([OP_DELETE]) + _pack_string(student_id))
+
+    def log_update(self, student):
+        self._append(bytes([OP_UPDATE]) + _pack_string(student.student_id)
+                     + SCORES.pack(student.english, student.c_language, student.python))
+
+    def commit(self):
+        """쌓인 저널 레코드를 한 번에 쓰고 fsync"""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._pending and self._journal is not None:
+                self._journal.write(b"".join(self._pending))
+                self._journal.flush()
+                os.fsync(self._journal.fileno())
+                self._pending.clear()
+            self._last_commit = time.monotonic()
+
+    def should_snapshot(self):
+        return self.snapshot_every and self._journal_records >= self.snapshot_every
+
+    def snapshot(self, manager):
+        """
+        전체 학생을 새 세대의 스냅샷으로 저장하고 저널을 새로 시작
+        (임시 파일에 쓰고 rename 하므로 도중에 중단되어도 이전 스냅샷이 남음)
+        """
+        with self._lock:
+            self._snapshot(manager)
+
+    def _snapshot(self, manager):
+        self.commit()
+        generation = self.generation + 1
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, generation, len(manager.students)))
+            chunk = []
+            for student in manager.students.values():
+                chunk.append(_pack_student(student))
+                if len(chunk) >= 4096:
+                    f.write(b"".join(chunk))
+                    chunk.clear()
+            f.write(b"".join(chunk))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.snapshot_path)
+
+        old_path = self.journal_path(self.generation)
+        self._journal.close()
+        self.generation = generation
+        self._journal = open(self.journal_path(generation), "ab")
+        self._journal_records = 0
+        if os.path.exists(old_path):
+            os.remove(old_path)
+
+    def close(self):
+        with self._lock:
+            if self._journal:
+                self.commit()
+                self._journal.close()
+                self._journal = None
@@ -0,0 +1,330 @@
+##############################
+# 프로그램명: N×N k목 게임 규칙과 컴퓨터 (틱택토 일반화)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 가로 width, 세로 height 판에서 가로/세로/대각선으로 k개를 먼저 이으면 승리
+#     (3×3 k=3이 틱택토, 15×15 k=5가 오목)
+#   - 길이 k인 모든 줄(칸 k개 묶음)을 미리 만들고 칸마다 지나가는 줄 번호를 저장
+#     수를 둘 때 그 칸을 지나는 줄의 돌 개수만 1씩 바꾸며 k개가 되면 승리 (판 전체를 다시 보지 않음)
+#   - 같은 줄 개수로 평가 점수도 증분 계산 (상대 돌이 없는 줄에 내 돌이 많을수록 높음)
+#   - 빈칸 목록은 위치 색인과 함께 보관하여 추가/제거 O(1), 주변 돌 수를 세어 후보 수를 좁힘
+#   - 조브리스트(Zobrist) 해시로 국면 키를 수마다 XOR 한 번에 갱신
+#   - 컴퓨터: 시간 제한 안에서 반복 깊이 증가(iterative deepening) 알파-베타 탐색,
+#     변환 표의 최선 수 → 이기는/막는 정도 순서로 수를 정렬하여 가지치기
+#
+# 사용 예:
+#   board = Board(15, 15, 5)
+#   ai = KInARowAI(time_limit=1.0)
+#   board.play(ai.choose_move(board))
+##############################
+
+import random
+import time
+
+EMPTY, X, O = 0, 1, 2
+SYMBOLS = {EMPTY: ".", X: "X", O: "O"}
+DIRECTIONS = ((0, 1), (1, 0), (1, 1), (1, -1))    # 가로, 세로, 대각선 두 방향 (행, 열)
+NEIGHBOR_RADIUS = 2                                 # 후보 수: 이미 놓인 돌에서 이 거리 안의 빈칸
+
+
+class Board:
+    """
+    N×N k목 판 상태
+    - 칸 번호 = 행 * width + 열, X가 먼저 두고 번갈아 둠
+    - play/undo로 한 수씩 두고 되돌림 (승자, 평가 점수, 해시가 함께 바뀜)
+    """
+
+    def __init__(self, width=3, height=3, k=3, seed=0):
+        if k > max(width, height):
+            raise ValueError(f"{width}×{height} 판에서는 {k}개를 이을 수 없습니다.")
+        self.width = width
+        self.height = height
+        self.k = k
+        self.size = width * height
+        self.windows = self._make_windows()
+        cell_windows = [[] for _ in range(self.size)]
+        for w, window in enumerate(self.windows):
+            for cell in window:
+                cell_windows[cell].append(w)
+        self.cell_windows = [tuple(ws) for ws in cell_windows]
+        self.neighbors = [self._make_neighbors(cell) for cell in range(self.size)]
+        # 줄 하나에 한쪽 돌만 c개 있을 때의 점수 (k개는 승리이므로 아주 크게)
+        self.weights = [0] + [4 ** c for c in range(1, k)] + [10 ** 9]
+
+        rng = random.Random(seed)
+        self.zobrist = [(0, rng.getrandbits(64), rng.getrandbits(64)) for _ in range(self.size)]
+
+        self.cells = [EMPTY] * self.size
+        self.counts = (None, [0] * len(self.windows), [0] * len(self.windows))    # counts[X], counts[O]
+        self.empties = list(range(self.size))
+        self.empty_index = list(range(self.size))
+        self.near = [0] * self.size      # 주변 NEIGHBOR_RADIUS 안의 돌 수
+        self.history = []
+        self.winner = EMPTY
+        self.score = 0                    # X 기준 평가 점수
+        self.hash = 0
+
+    def _make_windows(self):
+        """길이 k인 모든 줄 (칸 번호 튜플)"""
+        windows = []
+        for row in range(self.height):
+            for col in range(self.width):
+                for dr, dc in DIRECTIONS:
+                    end_row = row + dr * (self.k - 1)
+                    end_col = col + dc * (self.k - 1)
+                    if 0 <= end_row < self.height and 0 <= end_col < self.width:
+                        windows.append(tuple((row + dr * i) * self.width + col + dc * i for i in range(self.k)))
+        return windows
+
+    def _make_neighbors(self, cell):
+        row, col = divmod(cell, self.width)
+        r = NEIGHBOR_RADIUS
+        return tuple(nr * self.width + nc
+                     for nr in range(max(0, row - r), min(self.height, row + r + 1))
+                     for nc in range(max(0, col - r), min(self.width, col + r + 1))
+                     if (nr, nc) != (row, col))
+
+    @property
+    def player(self):
+        """이번에 둘 차례 (X 또는 O)"""
+        return O if len(self.history) & 1 else X
+
+    def is_full(self):
+        return not self.empties
+
+    def is_over(self):
+        return self.winner != EMPTY or not self.empties
+
+    def _contribution(self, w):
+        """줄 w의 평가 점수 (X 기준, 양쪽 돌이 모두 있으면 0)"""
+        x = self.counts[X][w]
+        o = self.counts[O][w]
+        if o == 0:
+            return self.weights[x]
+        if x == 0:
+            return -self.weights[o]
+        return 0
+
+    def play(self, cell):
+        """차례인 쪽이 cell에 둠 (이미 끝났거나 빈칸이 아니면 ValueError)"""
+        if self.winner != EMPTY or not 0 <= cell < self.size or self.cells[cell] != EMPTY:
+            raise ValueError(f"둘 수 없는 칸입니다: {cell}")
+        player = self.player
+        self.cells[cell] = player
+        self.history.append(cell)
+        self.hash ^= self.zobrist[cell][player]
+
+        # 빈칸 목록에서 제거 (마지막 칸과 자리를 바꿔 O(1))
+        index = self.empty_index[cell]
+        last = self.empties.pop()
+        if last != cell:
+            self.empties[index] = last
+            self.empty_index[last] = index
+        for neighbor in self.neighbors[cell]:
+            self.near[neighbor] += 1
+
+        # 이 칸을 지나는 줄만 다시 셈
+        counts = self.counts[player]
+        delta = 0
+        for w in self.cell_windows[cell]:
+            before = self._contribution(w)
+            counts[w] += 1
+            if counts[w] == self.k:
+                self.winner = player
+            delta += self._contribution(w) - before
+        self.score += delta
+        return self
+
+    def undo(self):
+        """마지막 수를 되돌리고 그 칸 반환"""
+        cell = self.history.pop()
+        player = self.cells[cell]
+        counts = self.counts[player]
+        delta = 0
+        for w in self.cell_windows[cell]:
+            before = self._contribution(w)
+            counts[w] -= 1
+            delta += self._contribution(w) - before
+        self.score += delta
+        self.winner = EMPTY     # 끝난 판에는 더 둘 수 없으므로 되돌리기 전에는 승자가 없었음
+
+        for neighbor in self.neighbors[cell]:
+            self.near[neighbor] -= 1
+        self.empty_index[cell] = len(self.empties)
+        self.empties.append(cell)
+        self.hash ^= self.zobrist[cell][player]
+        self.cells[cell] = EMPTY
+        return cell
+
+    def candidates(self):
+        """살펴볼 수: 놓인 돌 근처의 빈칸 (첫 수는 가운데)"""
+        if not self.history:
+            return [(self.height // 2) * self.width + self.width // 2]
+        near = self.near
+        return [cell for cell in self.empties if near[cell]]
+
+    def move_value(self, cell):
+        """수 정렬용 점수: 그 칸에 두면 내 줄이 얼마나 늘고 상대 줄을 얼마나 막는지"""
+        me = self.player
+        mine = self.counts[me]
+        theirs = self.counts[O if me == X else X]
+        weights = self.weights
+        value = 0
+        for w in self.cell_windows[cell]:
+            m = mine[w]
+            t = theirs[w]
+            if t == 0:
+                value += weights[m + 1] - weights[m]
+            elif m == 0:
+                value += weights[t]
+        return value
+
+    def rows(self):
+        """화면 출력용 줄 목록"""
+        return [" ".join(SYMBOLS[self.cells[row * self.width + col]] for col in range(self.width))
+                for row in range(self.height)]
+
+
+def scan_winner(board):
+    """판 전체의 모든 줄을 다시 보는 승자 판정 (증분 판정과 비교용)"""
+    for window in board.windows:
+        first = board.cells[window[0]]
+        if first != EMPTY and all(board.cells[cell] == first for cell in window):
+            return first
+    return EMPTY
+
+
+class SearchTimeout(Exception):
+    pass
+
+
+class KInARowAI:
+    """
+    반복 깊이 증가 알파-베타 탐색 컴퓨터
+    time_limit: 한 수에 쓸 최대 시간 (초), max_depth: 최대 깊이 (None이면 빈칸 수까지)
+    last: 마지막 choose_move의 {depth, nodes, score, seconds}
+    """
+    WIN = 10 ** 12
+    MATE = WIN - 10 ** 6        # 이보다 큰 점수는 "몇 수 뒤 승리" (수 차이를 뺀 값)
+    EXACT, LOWER, UPPER = 0, 1, 2
+
+    def __init__(self, time_limit=1.0, max_depth=None):
+        self.time_limit = time_limit
+        self.max_depth = max_depth
+        self.table = {}         # 조브리스트 해시: (깊이, 점수, 종류, 최선 수)
+        self.last = {}
+
+    def choose_move(self, board):
+        if board.is_over():
+            return None
+        start = time.perf_counter()
+        self.deadline = start + self.time_limit
+        self.nodes = 0
+        if len(self.table) > 1000000:
+            self.table.clear()
+
+        root_moves = len(board.history)
+        moves = self._ordered_moves(board, None)
+        best_move, best_score, depth_done = moves[0], None, 0
+        max_depth = min(self.max_depth or len(board.empties), len(board.empties))
+        for depth in range(1, max_depth + 1):
+            try:
+                score, move = self._root(board, moves, depth)
+            except SearchTimeout:
+                # 탐색 도중 둔 수를 처음 국면까지 되돌림 (이번 깊이의 결과는 버림)
+                while len(board.history) > root_moves:
+                    board.undo()
+                break
+            best_move, best_score, depth_done = move, score, depth
+            # 다음 깊이에서는 방금 찾은 최선 수부터 살펴봄
+            moves.remove(move)
+            moves.insert(0, move)
+            if abs(score) > self.MATE:
+                break   # 이기거나 지는 수순을 찾았으면 더 깊이 볼 필요 없음
+        self.last = {"depth": depth_done, "nodes": self.nodes, "score": best_score,
+                     "seconds": time.perf_counter() - start}
+        return best_move
+
+    def _root(self, board, moves, depth):
+        alpha = -self.WIN - 1
+        best_move = moves[0]
+        for move in moves:
+            board.play(move)
+            score = -self._negamax(board, depth - 1, -self.WIN - 1, -alpha, 1)
+            board.undo()
+            if score > alpha:
+                alpha = score
+                best_move = move
+        return alpha, best_move
+
+    def _ordered_moves(self, board, first):
+        moves = sorted(board.candidates(), key=board.move_value, reverse=True)
+        if first is not None and first in moves:
+            moves.remove(first)
+            moves.insert(0, first)
+        return moves
+
+    def _negamax(self, board, depth, alpha, beta, ply):
+        self.nodes += 1
+        if self.nodes & 15 == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout
+        if board.winner != EMPTY:
+            return -(self.WIN - ply)        # 바로 전 수로 상대가 이김 (늦게 질수록 나음)
+        if not board.empties:
+            return 0
+        if depth == 0:
+            return board.score if board.player == X else -board.score
+
+        original_alpha = alpha
+        entry = self.table.get(board.hash)
+        tt_move = None
+        if entry is not None:
+            entry_depth, value, kind, tt_move = entry
+            value = self._from_table(value, ply)
+            if entry_depth >= depth:
+                if kind == self.EXACT:
+                    return value
+                if kind == self.LOWER:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                if alpha >= beta:
+                    return value
+
+        best = -self.WIN - 1
+        best_move = None
+        for move in self._ordered_moves(board, tt_move):
+            board.play(move)
+            score = -self._negamax(board, depth - 1, -beta, -alpha, ply + 1)
+            board.undo()
+            if score > best:
+                best = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best <= original_alpha:
+            kind = self.UPPER
+        elif best >= beta:
+            kind = self.LOWER
+        else:
+            kind = self.EXACT
+        self.table[board.hash] = (depth, self._to_table(best, ply), kind, best_move)
+        return best
+
+    def _to_table(self, value, ply):
+        """승패 점수는 루트가 아니라 이 국면에서 센 수 차이로 바꾸어 저장 (다른 깊이에서 만나도 맞도록)"""
+        if value > self.MATE:
+            return value + ply
+        if value < -self.MATE:
+            return value - ply
+        return value
+
+    def _from_table(self, value, ply):
+        if value > self.MATE:
+            return value - ply
+        if value < -self.MATE:
+            return value + ply
+        return value
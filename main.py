@@ -8,17 +8,51 @@
 #   - 삽입, 삭제, 검색, 정렬, 통계 기능 포함
 ##############################
 
+import heapq
+import math
+
+from journal import GradeStore
+from rank_index import RankIndex
+from sorting import parallel_sort, sort_records
+
 class Student:
+    # __dict__ 없이 고정된 칸만 사용하여 학생 한 명당 메모리를 줄임
+    __slots__ = ("student_id", "name", "english", "c_language", "python", "rank", "_total", "_grade")
+
     def __init__(self, student_id, name, english, c_language, python):
         self.student_id = student_id
         self.name = name
         self.english = english
         self.c_language = c_language
         self.python = python
-        self.total = self.english + self.c_language + self.python
-        self.average = self.total / 3
-        self.grade = self.calculate_grade()
         self.rank = 0
+        # 총점/학점은 처음 사용할 때 계산하여 저장
+        self._total = None
+        self._grade = None
+
+    @property
+    def total(self):
+        if self._total is None:
+            self._total = self.english + self.c_language + self.python
+        return self._total
+
+    @property
+    def average(self):
+        return self.total / 3
+
+    @property
+    def grade(self):
+        if self._grade is None:
+            self._grade = self.calculate_grade()
+        return self._grade
+
+    def set_scores(self, english, c_language, python):
+        """점수를 바꾸고 저장해 둔 총점/학점을 비워 다음 사용 때 다시 계산"""
+        self.english = english
+        self.c_language = c_language
+        self.python = python
+        self._total = None
+        self._grade = None
 
     def calculate_grade(self):
         avg = self.average
@@ -45,110 +79,282 @@ class Student:
                 f"{self.average:<8.2f}{self.grade:<6}{self.rank:<6}")
 
 class GradeManager:
-    def __init__(self):
-        self.students = []
+    def __init__(self, store=None):
+        """store: 저장 엔진 (journal.GradeStore), None이면 메모리에만 보관"""
+        self.students = {}   # 학번 -> 학생 (입력 순서 유지)
+        self.by_name = {}    # 이름 -> {학번: 학생} (동명이인 허용)
+        self.by_total = {}   # 총점 -> {학번: 학생}
+        self.ranks = RankIndex()  # 총점 순위 색인
+        self.store = None
+        if store is not None:
+            # 복원하는 동안에는 저널에 다시 기록하지 않음
+            store.load(self, Student)
+            self.store = store
+
+    def insert(self, student):
+        """학생 추가 (이미 있는 학번이면 False)"""
+        if student.student_id in self.students:
+            return False
+        self.students[student.student_id] = student
+        self.by_name.setdefault(student.name, {})[student.student_id] = student
+        self.by_total.setdefault(student.total, {})[student.student_id] = student
+        self.ranks.add(student.total)
+        if self.store is not None:
+            self.store.log_add(student)
+            self._maybe_snapshot()
+        return True
+
+    def load_students(self, students):
+        """저장된 학생을 한꺼번에 적재 (저널에 기록하지 않고 순위 색인은 한 번에 만듦)"""
+        for student in students:
+            if student.student_id in self.students:
+                continue
+            self.students[student.student_id] = student
+            self.by_name.setdefault(student.name, {})[student.student_id] = student
+            self.by_total.setdefault(student.total, {})[student.student_id] = student
+        self.ranks = RankIndex(student.total for student in self.students.values())
+
+    def remove(self, student_id):
+        """학번으로 학생 삭제 후 삭제된 학생 반환 (없으면 None)"""
+        student = self.students.pop(student_id, None)
+        if student is None:
+            return None
+        _discard(self.by_name, student.name, student_id)
+        _discard(self.by_total, student.total, student_id)
+        self.ranks.remove(student.total)
+        if self.store is not None:
+            self.store.log_delete(student_id)
+            self._maybe_snapshot()
+        return student
+
+    def update_scores(self, student_id, english, c_language, python):
+        """
+        학생 점수 수정 후 학생 반환 (없으면 None)
+        그 학생의 총점/평균/학점만 다시 계산하고, 총점이 바뀌면 총점 색인과 순위 색인에서만 옮김
+        (다른 학생의 등수는 순위 색인에서 조회할 때 반영되므로 고칠 필요 없음)
+        """
+        student = self.students.get(student_id)
+        if student is None:
+            return None
+        old_total = student.total
+        student.set_scores(english, c_language, python)
+        if student.total != old_total:
+            _discard(self.by_total, old_total, student_id)
+            self.by_total.setdefault(student.total, {})[student_id] = student
+            self.ranks.remove(old_total)
+            self.ranks.add(student.total)
+        if self.store is not None:
+            self.store.log_update(student)
+            self._maybe_snapshot()
+        return student
+
+    def update_scores_many(self, updates):
+        """[(학번, 영어, C-언어, 파이썬), ...] 을 차례로 반영하고 수정된 학생 수 반환"""
+        return sum(1 for update in updates if self.update_scores(*update) is not None)
+
+    def _maybe_snapshot(self):
+        if self.store.should_snapshot():
+            self.store.snapshot(self)
+
+    def close(self):
+        """저널에 남은 기록을 저장하고 파일을 닫음"""
+        if self.store is not None:
+            self.store.close()
+
+    def find(self, key):
+        """학번 또는 이름이 일치하는 학생 목록"""
+        found = list(self.by_name.get(key, {}).values())
+        student = self.students.get(key)
+        if student is not None and student not in found:
+            found.insert(0, student)
+        return found
+
+    def rank_of(self, student_id):
+        """학생의 현재 등수 (없으면 None)"""
+        student = self.students.get(student_id)
+        if student is None:
+            return None
+        return self.ranks.rank_of(student.total)
+
+    def students_at_rank(self, k):
+        """등수가 k인 학생 목록 (동점자로 건너뛴 등수면 빈 리스트)"""
+        if not 1 <= k <= len(self.ranks):
+            return []
+        total = self.ranks.kth_largest(k)
+        if self.ranks.rank_of(total) != k:
+            return []
+        return list(self.by_total[total].values())
+
+    def top_students(self, k):
+        """총점 상위 k명 (서로 다른 총점 중 상위 k개만 힙으로 고름, 전체 정렬 없음)"""
+        result = []
+        for total in heapq.nlargest(k, self.by_total):
+            for student in self.by_total[total].values():
+                if len(result) == k:
+                    return result
+                result.append(student)
+        return result
+
+    def percentile_total(self, p):
+        """
+        하위 p% 지점의 총점 (nearest-rank 방식, 예: p=90 → 상위 10% 경계)
+        순위 색인에서 k번째 값만 찾으므로 O(log n)
+        """
+        n = len(self.ranks)
+        if n == 0:
+            return None
+        k = max(1, math.ceil(p / 100 * n))
+        return self.ranks.kth_largest(n - k + 1)
+
+    def students_at_percentile(self, p):
+        """하위 p% 지점 총점을 가진 학생 목록"""
+        total = self.percentile_total(p)
+        if total is None:
+            return []
+        return list(self.by_total[total].values())
 
     def add_student(self):
         student_id = input("학번: ")
+        if student_id in self.students:
+            print("이미 존재하는 학번입니다.")
+            return
         name = input("이름: ")
         english = int(input("영어 점수: "))
         c_language = int(input("C-언어 점수: "))
         python = int(input("파이썬 점수: "))
-        self.students.append(Student(student_id, name, english, c_language, python))
-        self.calculate_ranks()
+        self.insert(Student(student_id, name, english, c_language, python))
 
     def input_students(self, count=5):
         for _ in range(count):
             self.add_student()
 
     def calculate_ranks(self):
-        sorted_students = sorted(self.students, key=lambda s: s.total, reverse=True)
-        rank = 1
-        prev_total = None
-        for i, student in enumerate(sorted_students):
-            if prev_total is not None and student.total == prev_total:
+        """모든 학생의 rank 속성을 순위 색인 기준으로 갱신 (동점 총점은 한 번만 조회)"""
+        for total, group in self.by_total.items():
+            rank = self.ranks.rank_of(total)
+            for student in group.values():
                 student.rank = rank
-            else:
-                rank = i + 1
-                student.rank = rank
-            prev_total = student.total
 
     def print_results(self):
         if not self.students:
             print("\n학생 정보가 없습니다.")
             return
 
+        self.calculate_ranks()
         print("\n" + " 성적관리 프로그램 ".center(80, "="))
         print("=" * 100)
         print(f"{'학번':<15}{'이름':<10}{'영어':<8}{'C-언어':<8}{'파이썬':<8}{'총점':<8}{'평균':<8}{'학점':<6}{'등수':<6}")
         print("=" * 100)
 
-        for student in self.students:
+        for student in self.students.values():
             print(student.display())
 
+    def edit_scores(self):
+        student_id = input("수정할 학생의 학번 입력: ")
+        if student_id not in self.students:
+            print("해당 학번의 학생을 찾을 수 없습니다.")
+            return
+        english = int(input("영어 점수: "))
+        c_language = int(input("C-언어 점수: "))
+        python = int(input("파이썬 점수: "))
+        student = self.update_scores(student_id, english, c_language, python)
+        print(f"\n학번 {student_id} 학생의 성적이 수정되었습니다. "
+              f"(총점: {student.total}, 학점: {student.grade}, 등수: {self.ranks.rank_of(student.total)})")
+
     def delete_student(self):
         student_id = input("삭제할 학생의 학번 입력: ")
-        original_len = len(self.students)
-        self.students = [s for s in self.students if s.student_id != student_id]
-        if len(self.students) < original_len:
+        if self.remove(student_id) is not None:
             print(f"\n학번 {student_id} 학생이 삭제되었습니다.")
-            self.calculate_ranks()
         else:
             print("해당 학번의 학생을 찾을 수 없습니다.")
 
     def search_student(self):
         key = input("검색할 학번 또는 이름 입력: ")
-        found = False
-        for student in self.students:
-            if student.student_id == key or student.name == key:
-                print("\n검색 결과:")
-                print("=" * 60)
-                print(f"학번: {student.student_id}, 이름: {student.name}, 총점: {student.total}, 평균: {student.average:.2f}, 학점: {student.grade}, 등수: {student.rank}")
-                found = True
+        found = self.find(key)
+        for student in found:
+            student.rank = self.ranks.rank_of(student.total)
+            print("\n검색 결과:")
+            print("=" * 60)
+            print(f"학번: {student.student_id}, 이름: {student.name}, 총점: {student.total}, 평균: {student.average:.2f}, 학점: {student.grade}, 등수: {student.rank}")
         if not found:
             print("해당 학생을 찾을 수 없습니다.")
 
     def sort_students_by_total(self):
-        self.students.sort(key=lambda s: s.total, reverse=True)
+        # 서로 다른 총점만 정렬하고, 같은 총점 안에서는 입력 순서를 유지
+        self.students = {
+            student.student_id: student
+            for total in sorted(self.by_total, reverse=True)
+            for student in self.by_total[total].values()
+        }
         print("\n총점 기준 정렬 완료.")
 
+    def sort_students(self, keys, tie_break="stable", parallel=False):
+        """
+        여러 기준으로 정렬 (예: ("-total", "-python", "name"))
+        parallel=True이면 프로세스 풀에서 나누어 정렬한 뒤 병합
+        """
+        if parallel:
+            # 작업자가 돌려준 것은 복사본이므로 색인과 같은 원래 객체로 바꿔 놓음
+            ordered = [self.students[student.student_id]
+                       for student in parallel_sort(self.students.values(), keys, tie_break)]
+        else:
+            ordered = sort_records(self.students.values(), keys, tie_break)
+        self.students = {student.student_id: student for student in ordered}
+        return ordered
+
     def count_above_80(self):
-        count = sum(1 for s in self.students if s.average >= 80)
+        # 평균 80점 이상 = 총점 240점 이상, 서로 다른 총점 단위로 셈
+        count = sum(len(group) for total, group in self.by_total.items() if total / 3 >= 80)
         print(f"\n80점 이상 학생 수: {count}명")
 
+def _discard(index, key, student_id):
+    """색인에서 학생을 빼고, 비게 된 키는 삭제"""
+    group = index[key]
+    del group[student_id]
+    if not group:
+        del index[key]
+
 def main():
-    manager = GradeManager()
-    while True:
-        print("\n메뉴")
-        print("1. 학생 입력")
-        print("2. 학생 출력")
-        print("3. 학생 추가")
-        print("4. 학생 삭제")
-        print("5. 학생 검색")
-        print("6. 총점 기준 정렬")
-        print("7. 80점 이상 학생 수 출력")
-        print("0. 종료")
-        choice = input("선택: ")
-
-        if choice == "0":
-            print("프로그램을 종료합니다.")
-            break
-        elif choice == "1":
-            manager.input_students()
-        elif choice == "2":
-            manager.print_results()
-        elif choice == "3":
-            manager.add_student()
-        elif choice == "4":
-            manager.delete_student()
-        elif choice == "5":
-            manager.search_student()
-        elif choice == "6":
-            manager.sort_students_by_total()
-        elif choice == "7":
-            manager.count_above_80()
-        else:
-            print("잘못된 입력입니다. 다시 선택하세요.")
+    # 종료 후에도 학생 정보가 남도록 grade_data 폴더에 저장
+    manager = GradeManager(store=GradeStore("grade_data"))
+    # Ctrl-C나 오류로 끝나도 그룹 커밋에 남은 기록을 저장하도록 항상 close
+    try:
+        while True:
+            print("\n메뉴")
+            print("1. 학생 입력")
+            print("2. 학생 출력")
+            print("3. 학생 추가")
+            print("4. 학생 삭제")
+            print("5. 학생 검색")
+            print("6. 총점 기준 정렬")
+            print("7. 80점 이상 학생 수 출력")
+            print("8. 학생 성적 수정")
+            print("0. 종료")
+            choice = input("선택: ")
+
+            if choice == "0":
+                print("프로그램을 종료합니다.")
+                break
+            elif choice == "1":
+                manager.input_students()
+            elif choice == "2":
+                manager.print_results()
+            elif choice == "3":
+                manager.add_student()
+            elif choice == "4":
+                manager.delete_student()
+            elif choice == "5":
+                manager.search_student()
+            elif choice == "6":
+                manager.sort_students_by_total()
+            elif choice == "7":
+                manager.count_above_80()
+            elif choice == "8":
+                manager.edit_scores()
+            else:
+                print("잘못된 입력입니다. 다시 선택하세요.")
+    finally:
+        manager.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,324 @@
+##############################
+# 프로그램명: 성적관리 작업 측정 (MongoDB 연동 버전용)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - MongoGradeManager 작업(등수 계산, 검색, 통계 등)별 호출 수, 오류 수, 소요 시간 분포 집계
+#   - pymongo 명령 모니터링으로 작업 한 번에 서버 왕복 횟수, 돌려받은/기록한 문서 수 집계
+#   - 기준 시간을 넘는 느린 작업은 명령 내역과 함께 로그로 남김
+#   - Prometheus 텍스트 파일 또는 JSON(HTTP)으로 내보내기
+#   - 측정을 끄면(metrics=None 또는 enabled=False) 메서드 호출마다 속성 확인 한 번만 추가됨
+#
+# 사용 예:
+#   metrics = Metrics(slow_ms=200, thresholds={"calculate_ranks": 2000})
+#   manager = MongoGradeManager(metrics=metrics)
+#   metrics.write_prometheus("/var/lib/node_exporter/grade.prom")
+#   metrics.serve(9108)   # http://localhost:9108/metrics , /metrics.json
+##############################
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from pymongo import monitoring
+
+# 소요 시간 분포 구간 (초)
+BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+
+logger = logging.getLogger("grade.metrics")
+
+
+class _Frame:
+    """진행 중인 작업 한 번의 서버 명령 집계"""
+    __slots__ = ("name", "round_trips", "returned", "written", "failed", "error", "commands")
+
+    def __init__(self, name):
+        self.name = name
+        self.round_trips = 0
+        self.returned = 0
+        self.written = 0
+        self.failed = 0
+        self.error = False
+        self.commands = Counter()
+
+
+class _OperationStats:
+    __slots__ = ("calls", "errors", "slow", "seconds", "max_seconds", "buckets",
+                 "round_trips", "returned", "written")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.slow = 0
+        self.seconds = 0.0
+        self.max_seconds = 0.0
+        self.buckets = [0] * len(BUCKETS)
+        self.round_trips = 0
+        self.returned = 0
+        self.written = 0
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "slow": self.slow,
+            "seconds": round(self.seconds, 6),
+            "avg_ms": round(self.seconds / self.calls * 1000, 3) if self.calls else None,
+            "max_ms": round(self.max_seconds * 1000, 3),
+            "round_trips": self.round_trips,
+            "documents_returned": self.returned,
+            "documents_written": self.written,
+        }
+
+
+def _reply_counts(command_name, reply):
+    """명령 응답에서 (돌려받은 문서 수, 기록한 문서 수)"""
+    cursor = reply.get("cursor")
+    if cursor is not None:
+        return len(cursor.get("firstBatch") or cursor.get("nextBatch") or ()), 0
+    if command_name in ("insert", "delete"):
+        return 0, reply.get("n", 0)
+    if command_name == "update":
+        return 0, reply.get("nModified", 0) + len(reply.get("upserted", ()))
+    if command_name == "findAndModify":
+        return (1 if reply.get("value") is not None else 0), reply.get("lastErrorObject", {}).get("n", 0)
+    if command_name == "count":
+        return 1, 0
+    return 0, 0
+
+
+class _CommandListener(monitoring.CommandListener):
+    """pymongo 명령 이벤트를 진행 중인 작업(같은 스레드)에 더함"""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def started(self, event):
+        if not self.metrics.enabled:
+            return
+        stack = self.metrics._local.stack
+        for frame in stack:
+            frame.round_trips += 1
+            frame.commands[event.command_name] += 1
+
+    def succeeded(self, event):
+        metrics = self.metrics
+        if not metrics.enabled:
+            return
+        with metrics._lock:
+            metrics.commands[event.command_name] += 1
+            metrics.command_seconds[event.command_name] += event.duration_micros / 1e6
+        stack = metrics._local.stack
+        if stack:
+            returned, written = _reply_counts(event.command_name, event.reply)
+            for frame in stack:
+                frame.returned += returned
+                frame.written += written
+
+    def failed(self, event):
+        metrics = self.metrics
+        if not metrics.enabled:
+            return
+        with metrics._lock:
+            metrics.commands[event.command_name] += 1
+            metrics.command_failures[event.command_name] += 1
+            metrics.command_seconds[event.command_name] += event.duration_micros / 1e6
+        for frame in metrics._local.stack:
+            frame.failed += 1
+
+
+class _Local(threading.local):
+    def __init__(self):
+        self.stack = []
+
+
+class Metrics:
+    def __init__(self, enabled=True, slow_ms=500.0, thresholds=None):
+        """
+        enabled: False면 집계하지 않음 (실행 중에 바꿀 수 있음)
+        slow_ms: 느린 작업으로 기록할 기본 기준 (밀리초)
+        thresholds: 작업별 기준 {"calculate_ranks": 2000, ...}
+        """
+        self.enabled = enabled
+        self.slow_ms = slow_ms
+        self.thresholds = dict(thresholds or {})
+        self.operations = {}
+        self.commands = Counter()
+        self.command_failures = Counter()
+        self.command_seconds = Counter()
+        self.listener = _CommandListener(self)
+        self._local = _Local()
+        self._lock = threading.Lock()
+        self._server = None
+
+    def measure(self, name, function, *args, **kwargs):
+        """function 호출 한 번을 name 작업으로 측정"""
+        stack = self._local.stack
+        frame = _Frame(name)
+        stack.append(frame)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except BaseException:
+            frame.error = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            self._record(frame, elapsed)
+
+    def mark_error(self):
+        """작업 안에서 잡아서 출력만 한 예외도 오류로 셈"""
+        for frame in self._local.stack:
+            frame.error = True
+
+    def _record(self, frame, elapsed):
+        slow = elapsed * 1000 >= self.thresholds.get(frame.name, self.slow_ms)
+        with self._lock:
+            stats = self.operations.get(frame.name)
+            if stats is None:
+                stats = self.operations[frame.name] = _OperationStats()
+            stats.calls += 1
+            stats.seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            for i, bound in enumerate(BUCKETS):
+                if elapsed <= bound:
+                    stats.buckets[i] += 1
+                    break
+            stats.round_trips += frame.round_trips
+            stats.returned += frame.returned
+            stats.written += frame.written
+            if frame.error:
+                stats.errors += 1
+            if slow:
+                stats.slow += 1
+        if slow:
+            commands = ", ".join(f"{name}×{n}" for name, n in frame.commands.most_common())
+            logger.warning(f"Slow operation {frame.name}: {elapsed * 1000:.1f}ms, "
+                           f"round_trips={frame.round_trips}, returned={frame.returned}, "
+                           f"written={frame.written}, failed_commands={frame.failed}, commands=[{commands}]")
+
+    def reset(self):
+        with self._lock:
+            self.operations.clear()
+            self.commands.clear()
+            self.command_failures.clear()
+            self.command_seconds.clear()
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "operations": {name: stats.to_dict() for name, stats in sorted(self.operations.items())},
+                "commands": {
+                    name: {"calls": n, "failures": self.command_failures[name],
+                           "seconds": round(self.command_seconds[name], 6)}
+                    for name, n in sorted(self.commands.items())
+                },
+            }
+
+    def to_json(self):
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self):
+        """Prometheus 텍스트 형식"""
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{value_}"' for key, value_ in labels)
+                lines.append(f"{name}{{{label_text}}} {value}")
+
+        with self._lock:
+            operations = sorted(self.operations.items())
+            metric("grade_operation_calls_total", "counter", "Operation calls",
+                   [((("operation", name),), s.calls) for name, s in operations])
+            metric("grade_operation_errors_total", "counter", "Operations that raised or reported an error",
+                   [((("operation", name),), s.errors) for name, s in operations])
+            metric("grade_operation_slow_total", "counter", "Operations slower than the threshold",
+                   [((("operation", name),), s.slow) for name, s in operations])
+            metric("grade_operation_round_trips_total", "counter", "MongoDB commands sent by operations",
+                   [((("operation", name),), s.round_trips) for name, s in operations])
+            metric("grade_operation_documents_returned_total", "counter", "Documents returned to operations",
+                   [((("operation", name),), s.returned) for name, s in operations])
+            metric("grade_operation_documents_written_total", "counter", "Documents written by operations",
+                   [((("operation", name),), s.written) for name, s in operations])
+
+            lines.append("# HELP grade_operation_seconds Operation latency")
+            lines.append("# TYPE grade_operation_seconds histogram")
+            for name, s in operations:
+                cumulative = 0
+                for bound, n in zip(BUCKETS, s.buckets):
+                    cumulative += n
+                    lines.append(f'grade_operation_seconds_bucket{{operation="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'grade_operation_seconds_bucket{{operation="{name}",le="+Inf"}} {s.calls}')
+                lines.append(f'grade_operation_seconds_sum{{operation="{name}"}} {s.seconds:.6f}')
+                lines.append(f'grade_operation_seconds_count{{operation="{name}"}} {s.calls}')
+
+            commands = sorted(self.commands.items())
+            metric("grade_mongo_commands_total", "counter", "MongoDB commands",
+                   [((("command", name),), n) for name, n in commands])
+            metric("grade_mongo_command_failures_total", "counter", "Failed MongoDB commands",
+                   [((("command", name),), self.command_failures[name]) for name, _ in commands])
+            metric("grade_mongo_command_seconds_total", "counter", "Time spent in MongoDB commands",
+                   [((("command", name),), f"{self.command_seconds[name]:.6f}") for name, _ in commands])
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """node_exporter textfile 수집기용 파일로 저장 (임시 파일에 쓴 뒤 교체하여 반쯤 쓴 파일을 읽지 않게 함)"""
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+    def serve(self, port=9108, host="127.0.0.1"):
+        """/metrics(Prometheus 텍스트)와 /metrics.json을 응답하는 HTTP 서버를 백그라운드 스레드로 시작"""
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/metrics":
+                    body, content_type = metrics.to_prometheus(), "text/plain; version=0.0.4"
+                elif self.path == "/metrics.json":
+                    body, content_type = metrics.to_json(), "application/json"
+                else:
+                    self.send_error(404)
+                    return
+                data = body.encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self._server
+
+    def stop_server(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+def instrumented(method):
+    """MongoGradeManager 메서드 장식자: self.metrics가 켜져 있을 때만 작업으로 측정"""
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        metrics = self.metrics
+        if metrics is None or not metrics.enabled:
+            return method(self, *args, **kwargs)
+        return metrics.measure(name, method, self, *args, **kwargs)
+
+    return wrapper
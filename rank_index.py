@@ -0,0 +1,128 @@
+##############################
+# 프로그램명: 총점 순위 색인 (순서 통계 자료구조)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 학생들의 총점을 정렬된 상태로 보관하는 다중집합(multiset)
+#   - 정렬된 버킷 목록 + 버킷 크기에 대한 펜윅 트리(Fenwick tree)로
+#     추가/삭제/등수 조회/k번째 총점 조회를 O(log n)에 처리
+#   - 등수는 기존 프로그램과 같이 "총점이 더 높은 학생 수 + 1" (동점자는 같은 등수)
+##############################
+
+from bisect import bisect_left, bisect_right, insort
+
+
+class RankIndex:
+    LOAD = 512  # 버킷 하나의 기본 크기 (2배를 넘으면 나눔)
+
+    def __init__(self, totals=()):
+        values = sorted(totals)
+        self._buckets = [values[i:i + self.LOAD] for i in range(0, len(values), self.LOAD)]
+        self._maxes = [bucket[-1] for bucket in self._buckets]
+        self._len = len(values)
+        self._build_tree()
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        """총점 오름차순으로 순회"""
+        for bucket in self._buckets:
+            yield from bucket
+
+    def _build_tree(self):
+        """버킷 크기의 펜윅 트리를 O(버킷 수)로 다시 만듦"""
+        tree = [len(bucket) for bucket in self._buckets]
+        for i in range(len(tree)):
+            parent = i | (i + 1)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self._tree = tree
+
+    def _tree_add(self, i, delta):
+        tree = self._tree
+        while i < len(tree):
+            tree[i] += delta
+            i |= i + 1
+
+    def _prefix(self, i):
+        """버킷 0 ~ i-1 에 들어 있는 값의 개수"""
+        count = 0
+        while i > 0:
+            count += self._tree[i - 1]
+            i &= i - 1
+        return count
+
+    def _locate(self, index):
+        """오름차순 index(0부터)번째 값이 들어 있는 (버킷 번호, 버킷 내 위치)"""
+        tree = self._tree
+        pos = 0
+        step = 1 << len(tree).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt <= len(tree) and tree[nxt - 1] <= index:
+                index -= tree[nxt - 1]
+                pos = nxt
+            step >>= 1
+        return pos, index
+
+    def add(self, total):
+        if not self._buckets:
+            self._buckets.append([total])
+            self._maxes.append(total)
+            self._len = 1
+            self._build_tree()
+            return
+
+        i = bisect_left(self._maxes, total)
+        if i == len(self._maxes):
+            i -= 1
+        bucket = self._buckets[i]
+        insort(bucket, total)
+        self._maxes[i] = bucket[-1]
+        self._len += 1
+
+        if len(bucket) > 2 * self.LOAD:
+            self._buckets[i:i + 1] = [bucket[:self.LOAD], bucket[self.LOAD:]]
+            self._maxes[i:i + 1] = [bucket[self.LOAD - 1], bucket[-1]]
+            self._build_tree()
+        else:
+            self._tree_add(i, 1)
+
+    def remove(self, total):
+        """총점 하나를 제거 (없으면 ValueError)"""
+        i = bisect_left(self._maxes, total)
+        if i == len(self._maxes):
+            raise ValueError(f"{total} is not in RankIndex")
+        bucket = self._buckets[i]
+        j = bisect_left(bucket, total)
+        if bucket[j] != total:
+            raise ValueError(f"{total} is not in RankIndex")
+
+        del bucket[j]
+        self._len -= 1
+        if bucket:
+            self._maxes[i] = bucket[-1]
+            self._tree_add(i, -1)
+        else:
+            del self._buckets[i]
+            del self._maxes[i]
+            self._build_tree()
+
+    def count_greater(self, total):
+        """총점이 total보다 높은 값의 개수"""
+        i = bisect_right(self._maxes, total)
+        if i == len(self._maxes):
+            return 0
+        count_le = self._prefix(i) + bisect_right(self._buckets[i], total)
+        return self._len - count_le
+
+    def rank_of(self, total):
+        """해당 총점의 등수 (동점자는 같은 등수)"""
+        return self.count_greater(total) + 1
+
+    def kth_largest(self, k):
+        """k번째(1부터)로 높은 총점"""
+        if not 1 <= k <= self._len:
+            raise IndexError("rank out of range")
+        i, j = self._locate(self._len - k)
+        return self._buckets[i][j]
@@ -0,0 +1,151 @@
+##############################
+# 프로그램명: 학생 정렬 엔진
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 여러 기준(예: 총점 내림차순 → 파이썬 내림차순 → 이름 오름차순)으로 안정 정렬
+#   - 동점 처리 방식 선택: 입력 순서 유지 / 학번순 / 이름순
+#   - 메모리보다 큰 데이터: 정렬된 묶음(run)을 임시 파일로 내보낸 뒤 k-way 병합 (외부 정렬)
+#   - 병렬 정렬: 묶음을 프로세스 풀에서 정렬한 뒤 k-way 병합
+#
+# 정렬 기준 표기: "total"은 오름차순, "-total"은 내림차순
+#   예) ("-total", "-python", "name")
+##############################
+
+import heapq
+import os
+import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import total_ordering
+from itertools import islice
+
+# 동점 처리 방식: 정렬 기준 뒤에 덧붙일 기준
+TIE_BREAKS = {
+    "stable": (),                      # 입력 순서 유지
+    "student_id": ("student_id",),     # 학번 오름차순
+    "name": ("name", "student_id"),    # 이름 오름차순, 같으면 학번
+}
+
+
+@total_ordering
+class _Descending:
+    """문자열 등 부호를 뒤집을 수 없는 값을 내림차순으로 비교하기 위한 감싸개"""
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __lt__(self, other):
+        return self.value > other.value
+
+
+def parse_keys(keys, tie_break="stable"):
+    """정렬 기준 표기를 [(필드, 내림차순 여부), ...] 로 변환"""
+    if tie_break not in TIE_BREAKS:
+        raise ValueError(f"알 수 없는 동점 처리 방식입니다: {tie_break}")
+    if isinstance(keys, str):
+        keys = [key.strip() for key in keys.split(",") if key.strip()]
+    parsed = [(key[1:], True) if key.startswith("-") else (key, False) for key in keys]
+    fields = {field for field, _ in parsed}
+    parsed += [(field, False) for field in TIE_BREAKS[tie_break] if field not in fields]
+    return parsed
+
+
+def _get(record, field):
+    if isinstance(record, dict):
+        return record[field]
+    return getattr(record, field)
+
+
+def make_key(keys, tie_break="stable"):
+    """레코드(딕셔너리 또는 Student 객체)에서 정렬용 튜플을 만드는 함수"""
+    parsed = parse_keys(keys, tie_break)
+
+    def key(record):
+        values = []
+        for field, descending in parsed:
+            value = _get(record, field)
+            if descending:
+                value = -value if isinstance(value, (int, float)) else _Descending(value)
+            values.append(value)
+        return tuple(values)
+
+    return key
+
+
+def sort_records(records, keys, tie_break="stable"):
+    """메모리 안에서 안정 정렬한 새 리스트 반환"""
+    return sorted(records, key=make_key(keys, tie_break))
+
+
+def _chunks(records, size):
+    iterator = iter(records)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _write_run(chunk, tmp_dir):
+    """정렬된 묶음을 임시 파일에 pickle 스트림으로 저장하고 경로 반환"""
+    fd, path = tempfile.mkstemp(prefix="sort-run-", suffix=".bin", dir=tmp_dir)
+    with os.fdopen(fd, "wb") as f:
+        pickler = pickle.Pickler(f, protocol=pickle.HIGHEST_PROTOCOL)
+        for record in chunk:
+            pickler.dump(record)
+    return path
+
+
+def _read_run(path):
+    try:
+        with open(path, "rb") as f:
+            unpickler = pickle.Unpickler(f)
+            while True:
+                try:
+                    yield unpickler.load()
+                except EOFError:
+                    return
+    finally:
+        os.remove(path)
+
+
+def external_sort(records, keys, tie_break="stable", run_size=100000, tmp_dir=None):
+    """
+    메모리보다 큰 데이터 정렬 (정렬된 레코드를 하나씩 생성)
+    run_size: 한 번에 메모리에서 정렬할 레코드 수
+    records는 한 번만 순회하므로 MongoDB 커서나 파일 읽기 생성기를 그대로 넘겨도 됨
+    """
+    key = make_key(keys, tie_break)
+    paths = []
+    try:
+        for chunk in _chunks(records, run_size):
+            chunk.sort(key=key)
+            paths.append(_write_run(chunk, tmp_dir))
+    except BaseException:
+        for path in paths:
+            os.remove(path)
+        raise
+
+    # 앞선 묶음이 먼저 나오므로 동점일 때 입력 순서가 유지됨
+    yield from heapq.merge(*(_read_run(path) for path in paths), key=key)
+
+
+def _sort_chunk(args):
+    chunk, keys, tie_break = args
+    chunk.sort(key=make_key(keys, tie_break))
+    return chunk
+
+
+def parallel_sort(records, keys, tie_break="stable", workers=None, chunk_size=50000):
+    """묶음을 프로세스 풀에서 나누어 정렬한 뒤 k-way 병합한 리스트 반환"""
+    jobs = [(chunk, keys, tie_break) for chunk in _chunks(records, chunk_size)]
+    if len(jobs) <= 1:
+        return _sort_chunk(jobs[0]) if jobs else []
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        runs = list(pool.map(_sort_chunk, jobs))
+    return list(heapq.merge(*runs, key=make_key(keys, tie_break)))
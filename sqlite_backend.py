@@ -0,0 +1,209 @@
+##############################
+# 프로그램명: 성적 저장소 (SQLite 버전)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 별도 서버 없이 파일 하나에 학생 성적을 영구 저장
+#   - WAL 모드, 고정 SQL 문(준비된 문장 재사용), 묶음 트랜잭션, 인덱스 사용
+#   - 등수는 저장하지 않고 RANK() OVER (ORDER BY total DESC) 또는 총점 인덱스로 계산
+##############################
+
+import sqlite3
+from datetime import datetime
+
+from main import Student
+from storage import StorageBackend
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    student_id TEXT PRIMARY KEY,
+    name       TEXT NOT NULL,
+    english    INTEGER NOT NULL,
+    c_language INTEGER NOT NULL,
+    python     INTEGER NOT NULL,
+    total      INTEGER NOT NULL,
+    average    REAL NOT NULL,
+    grade      TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_students_name ON students (name);
+CREATE INDEX IF NOT EXISTS idx_students_total ON students (total DESC, student_id);
+CREATE INDEX IF NOT EXISTS idx_students_average ON students (average);
+
+-- 총점별 학생 수 (서로 다른 총점은 많아야 수백 개이므로 등수 계산이 학생 수와 무관해짐)
+CREATE TABLE IF NOT EXISTS total_counts (
+    total INTEGER PRIMARY KEY,
+    n     INTEGER NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS students_count_insert AFTER INSERT ON students BEGIN
+    INSERT INTO total_counts (total, n) VALUES (NEW.total, 1)
+        ON CONFLICT (total) DO UPDATE SET n = n + 1;
+END;
+CREATE TRIGGER IF NOT EXISTS students_count_delete AFTER DELETE ON students BEGIN
+    UPDATE total_counts SET n = n - 1 WHERE total = OLD.total;
+    DELETE FROM total_counts WHERE total = OLD.total AND n = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS students_count_update AFTER UPDATE OF total ON students
+WHEN NEW.total <> OLD.total BEGIN
+    UPDATE total_counts SET n = n - 1 WHERE total = OLD.total;
+    DELETE FROM total_counts WHERE total = OLD.total AND n = 0;
+    INSERT INTO total_counts (total, n) VALUES (NEW.total, 1)
+        ON CONFLICT (total) DO UPDATE SET n = n + 1;
+END;
+"""
+
+COLUMNS = "student_id, name, english, c_language, python, total, average, grade"
+
+# 같은 SQL 문자열을 반복 사용하면 sqlite3가 컴파일된 문장을 캐시에서 재사용함
+INSERT_SQL = ("INSERT OR IGNORE INTO students (" + COLUMNS + ", created_at, updated_at) "
+              "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)")
+DELETE_SQL = "DELETE FROM students WHERE student_id = ?"
+UPDATE_SCORES_SQL = ("UPDATE students SET english = ?, c_language = ?, python = ?, total = ?, average = ?, "
+                     "grade = ?, updated_at = ? WHERE student_id = ?")
+GET_SQL = "SELECT " + COLUMNS + " FROM students WHERE student_id = ?"
+SEARCH_SQL = ("SELECT " + COLUMNS + " FROM students WHERE student_id = ? "
+              "UNION SELECT " + COLUMNS + " FROM students WHERE name = ?")
+RANK_OF_TOTAL_SQL = "SELECT COALESCE(SUM(n), 0) + 1 FROM total_counts WHERE total > ?"
+TOP_SQL = "SELECT " + COLUMNS + " FROM students ORDER BY total DESC, student_id LIMIT ?"
+RANKED_SQL = ("SELECT " + COLUMNS + ", RANK() OVER (ORDER BY total DESC) AS rank "
+              "FROM students ORDER BY total DESC, student_id")
+STATISTICS_SQL = ("SELECT COUNT(*), AVG(english), AVG(c_language), AVG(python), AVG(total), "
+                  "MAX(total), MIN(total), SUM(average >= 80) FROM students")
+
+FIELDS = tuple(column.strip() for column in COLUMNS.split(","))
+
+
+class SQLiteBackend(StorageBackend):
+    def __init__(self, path="grades.db", batch_size=1000):
+        """
+        path: 데이터베이스 파일 (":memory:"이면 메모리에만 보관)
+        batch_size: add_many가 한 트랜잭션에 넣을 학생 수
+        """
+        if sqlite3.sqlite_version_info < (3, 25, 0):
+            raise RuntimeError("RANK() 윈도 함수를 쓰려면 SQLite 3.25 이상이 필요합니다.")
+        self.batch_size = batch_size
+        self.conn = sqlite3.connect(path, cached_statements=64)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        with self.conn:
+            # 총점별 학생 수 표가 비어 있으면(이전 버전 파일) 한 번 채움
+            if self.conn.execute("SELECT NOT EXISTS (SELECT 1 FROM total_counts)").fetchone()[0]:
+                self.conn.execute("INSERT INTO total_counts SELECT total, COUNT(*) FROM students GROUP BY total")
+
+    @staticmethod
+    def _params(record):
+        student = Student(*record)
+        now = datetime.now().isoformat()
+        return (student.student_id, student.name, student.english, student.c_language, student.python,
+                student.total, student.average, student.grade, now, now)
+
+    def _row(self, values, rank=None):
+        row = dict(zip(FIELDS, values))
+        row["rank"] = rank if rank is not None else self._rank_of_total(row["total"])
+        return row
+
+    def _rank_of_total(self, total):
+        return self.conn.execute(RANK_OF_TOTAL_SQL, (total,)).fetchone()[0]
+
+    def add(self, student_id, name, english, c_language, python):
+        with self.conn:
+            cursor = self.conn.execute(INSERT_SQL, self._params((student_id, name, english, c_language, python)))
+        return cursor.rowcount == 1
+
+    def add_many(self, records):
+        """batch_size명씩 한 트랜잭션으로 저장 (이미 있는 학번은 건너뜀)"""
+        inserted = 0
+        batch = []
+        for record in records:
+            batch.append(self._params(record))
+            if len(batch) >= self.batch_size:
+                inserted += self._insert_batch(batch)
+                batch = []
+        if batch:
+            inserted += self._insert_batch(batch)
+        return inserted
+
+    def _insert_batch(self, batch):
+        with self.conn:
+            # rowcount는 트리거가 바꾼 행(total_counts)을 세지 않으므로 추가된 학생 수와 같음
+            return self.conn.executemany(INSERT_SQL, batch).rowcount
+
+    def delete(self, student_id):
+        with self.conn:
+            cursor = self.conn.execute(DELETE_SQL, (student_id,))
+        return cursor.rowcount == 1
+
+    @staticmethod
+    def _score_params(update):
+        student_id, english, c_language, python = update
+        student = Student(student_id, "", english, c_language, python)
+        return (english, c_language, python, student.total, student.average, student.grade,
+                datetime.now().isoformat(), student_id)
+
+    def update_scores(self, student_id, english, c_language, python):
+        """등수는 저장하지 않으므로 학생 한 행과 총점별 학생 수(트리거)만 바뀜"""
+        with self.conn:
+            cursor = self.conn.execute(UPDATE_SCORES_SQL,
+                                       self._score_params((student_id, english, c_language, python)))
+        return cursor.rowcount == 1
+
+    def update_scores_many(self, updates):
+        """batch_size건씩 한 트랜잭션으로 수정"""
+        updated = 0
+        batch = []
+        for update in updates:
+            batch.append(self._score_params(update))
+            if len(batch) >= self.batch_size:
+                updated += self._update_batch(batch)
+                batch = []
+        if batch:
+            updated += self._update_batch(batch)
+        return updated
+
+    def _update_batch(self, batch):
+        with self.conn:
+            return self.conn.executemany(UPDATE_SCORES_SQL, batch).rowcount
+
+    def get(self, student_id):
+        values = self.conn.execute(GET_SQL, (student_id,)).fetchone()
+        return self._row(values) if values else None
+
+    def search(self, key):
+        return [self._row(values) for values in self.conn.execute(SEARCH_SQL, (key, key)).fetchall()]
+
+    def rank_of(self, student_id):
+        row = self.conn.execute("SELECT total FROM students WHERE student_id = ?", (student_id,)).fetchone()
+        return self._rank_of_total(row[0]) if row else None
+
+    def top_students(self, k):
+        """총점 인덱스에서 k건만 읽고, 등수는 목록 안에서 바로 계산 (맨 위부터이므로 COUNT 불필요)"""
+        rows = []
+        for i, values in enumerate(self.conn.execute(TOP_SQL, (k,))):
+            row = dict(zip(FIELDS, values))
+            row["rank"] = rows[-1]["rank"] if rows and rows[-1]["total"] == row["total"] else i + 1
+            rows.append(row)
+        return rows
+
+    def ranked(self):
+        for values in self.conn.execute(RANKED_SQL):
+            yield self._row(values[:-1], values[-1])
+
+    def statistics(self):
+        count, avg_english, avg_c, avg_python, avg_total, max_total, min_total, above_80 = \
+            self.conn.execute(STATISTICS_SQL).fetchone()
+        if count == 0:
+            return {"count": 0}
+        return {
+            "count": count,
+            "avg_english": avg_english,
+            "avg_c_language": avg_c,
+            "avg_python": avg_python,
+            "avg_total": avg_total,
+            "max_total": max_total,
+            "min_total": min_total,
+            "above_80": above_80,
+        }
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,297 @@
+##############################
+# 프로그램명: 성적 저장소 공통 인터페이스
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 메모리(GradeManager), MongoDB(MongoGradeManager), SQLite 저장소가
+#     같은 함수(추가, 삭제, 점수 수정, 조회, 검색, 등수, 통계)로 동작하도록 하는 공통 인터페이스
+#   - 결과는 모두 Student.to_dict()와 같은 키를 가진 딕셔너리
+#   - open_backend()로 이름만 바꿔 저장소를 선택 (MongoDB는 선택했을 때만 pymongo를 불러옴)
+##############################
+
+from abc import ABC, abstractmethod
+
+from main import GradeManager, Student
+
+STUDENT_FIELDS = ("student_id", "name", "english", "c_language", "python",
+                  "total", "average", "grade", "rank")
+
+
+class StorageBackend(ABC):
+    """모든 저장소가 구현하는 함수 목록"""
+
+    @abstractmethod
+    def add(self, student_id, name, english, c_language, python):
+        """학생 추가 (이미 있는 학번이면 False)"""
+
+    def add_many(self, records):
+        """(학번, 이름, 영어, C-언어, 파이썬) 목록을 한꺼번에 추가하고 추가된 수 반환"""
+        return sum(1 for record in records if self.add(*record))
+
+    @abstractmethod
+    def delete(self, student_id):
+        """학생 삭제 (삭제되면 True)"""
+
+    def apply_writes(self, writes):
+        """
+        [("add", (학번, 이름, 영어, C-언어, 파이썬)) 또는 ("delete", 학번), ...] 을 순서대로 반영하고
+        항목마다 반영 여부(True/False) 목록 반환 (기본: 한 건씩 등수/통계를 증분 갱신)
+        """
+        return [self.add(*argument) if kind == "add" else self.delete(argument) for kind, argument in writes]
+
+    @abstractmethod
+    def update_scores(self, student_id, english, c_language, python):
+        """세 과목 점수 수정 (수정되면 True)"""
+
+    def update_scores_many(self, updates):
+        """(학번, 영어, C-언어, 파이썬) 목록을 한꺼번에 수정하고 수정된 수 반환"""
+        return sum(1 for update in updates if self.update_scores(*update))
+
+    @abstractmethod
+    def get(self, student_id):
+        """학번으로 학생 조회 (없으면 None)"""
+
+    @abstractmethod
+    def search(self, key):
+        """학번 또는 이름이 일치하는 학생 목록"""
+
+    @abstractmethod
+    def rank_of(self, student_id):
+        """학생의 등수 (없으면 None)"""
+
+    @abstractmethod
+    def top_students(self, k):
+        """총점 상위 k명"""
+
+    @abstractmethod
+    def ranked(self):
+        """등수 순서로 모든 학생을 하나씩 생성"""
+
+    @abstractmethod
+    def statistics(self):
+        """{count, avg_english, avg_c_language, avg_python, avg_total, max_total, min_total, above_80}"""
+
+    def close(self):
+        pass
+
+
+def _student_row(student, rank):
+    row = {field: getattr(student, field) for field in STUDENT_FIELDS[:-1]}
+    row["rank"] = rank
+    return row
+
+
+class MemoryBackend(StorageBackend):
+    def __init__(self, manager=None):
+        self.manager = manager or GradeManager()
+
+    def add(self, student_id, name, english, c_language, python):
+        return self.manager.insert(Student(student_id, name, english, c_language, python))
+
+    def delete(self, student_id):
+        return self.manager.remove(student_id) is not None
+
+    def update_scores(self, student_id, english, c_language, python):
+        return self.manager.update_scores(student_id, english, c_language, python) is not None
+
+    def update_scores_many(self, updates):
+        return self.manager.update_scores_many(updates)
+
+    def apply_writes(self, writes):
+        """반영한 뒤 저널을 커밋하여 결과를 알리기 전에 디스크에 남김"""
+        applied = super().apply_writes(writes)
+        if self.manager.store is not None:
+            self.manager.store.commit()
+        return applied
+
+    def _row(self, student):
+        return _student_row(student, self.manager.ranks.rank_of(student.total))
+
+    def get(self, student_id):
+        student = self.manager.students.get(student_id)
+        return self._row(student) if student is not None else None
+
+    def search(self, key):
+        return [self._row(student) for student in self.manager.find(key)]
+
+    def rank_of(self, student_id):
+        return self.manager.rank_of(student_id)
+
+    def top_students(self, k):
+        return [self._row(student) for student in self.manager.top_students(k)]
+
+    def ranked(self):
+        for total in sorted(self.manager.by_total, reverse=True):
+            rank = self.manager.ranks.rank_of(total)
+            for student in self.manager.by_total[total].values():
+                yield _student_row(student, rank)
+
+    def statistics(self):
+        students = self.manager.students.values()
+        count = len(self.manager.students)
+        if count == 0:
+            return {"count": 0}
+        by_total = self.manager.by_total
+        return {
+            "count": count,
+            "avg_english": sum(s.english for s in students) / count,
+            "avg_c_language": sum(s.c_language for s in students) / count,
+            "avg_python": sum(s.python for s in students) / count,
+            "avg_total": sum(total * len(group) for total, group in by_total.items()) / count,
+            "max_total": max(by_total),
+            "min_total": min(by_total),
+            "above_80": sum(len(group) for total, group in by_total.items() if total / 3 >= 80),
+        }
+
+    def close(self):
+        self.manager.close()
+
+
+class MongoBackend(StorageBackend):
+    def __init__(self, manager, bulk_threshold=100):
+        """
+        manager: database.MongoGradeManager
+        bulk_threshold: apply_writes가 이 건수 이상이면 한 번의 bulk_write 후 등수/통계를 전체 재계산
+                        (적으면 한 건씩 증분 갱신, 전체 재계산은 학생 수에 비례하므로)
+        """
+        self.manager = manager
+        self.bulk_threshold = bulk_threshold
+
+    def add(self, student_id, name, english, c_language, python):
+        from database import Student as MongoStudent
+
+        return self.manager.insert_student(MongoStudent(student_id, name, english, c_language, python))
+
+    def add_many(self, records):
+        """한 번의 순서 없는 bulk_write로 저장하고 등수/통계는 마지막에 한 번만 계산"""
+        from pymongo import InsertOne
+        from pymongo.errors import BulkWriteError
+
+        from database import Student as MongoStudent
+
+        requests = [InsertOne(MongoStudent(*record).to_dict()) for record in records]
+        if not requests:
+            return 0
+        try:
+            inserted = self.manager.collection.bulk_write(requests, ordered=False).inserted_count
+        except BulkWriteError as e:
+            inserted = e.details["nInserted"]
+        self.manager.calculate_ranks()
+        self.manager.rebuild_statistics()
+        if self.manager.cache is not None:
+            self.manager.cache.clear()
+        return inserted
+
+    def apply_writes(self, writes):
+        if len(writes) < self.bulk_threshold:
+            return super().apply_writes(writes)
+        from pymongo import DeleteOne, InsertOne
+        from pymongo.errors import BulkWriteError
+
+        from database import Student as MongoStudent
+
+        # 나온 학번의 존재 여부를 한 번에 조회한 뒤 순서대로 따라가며 중복/없는 학번을 걸러냄
+        ids = list({record[0] if kind == "add" else record for kind, record in writes})
+        present = {data["student_id"] for data in self.manager.collection.find(
+            {"student_id": {"$in": ids}}, {"_id": 0, "student_id": 1})}
+        applied = []
+        requests = []
+        positions = []
+        for kind, record in writes:
+            student_id = record[0] if kind == "add" else record
+            if (kind == "add") == (student_id in present):
+                applied.append(False)
+                continue
+            if kind == "add":
+                present.add(student_id)
+                requests.append(InsertOne(MongoStudent(*record).to_dict()))
+            else:
+                present.discard(student_id)
+                requests.append(DeleteOne({"student_id": student_id}))
+            positions.append(len(applied))
+            applied.append(True)
+
+        if requests:
+            try:
+                self.manager.collection.bulk_write(requests, ordered=True)
+            except BulkWriteError as e:
+                # 순서 있는 쓰기는 첫 오류에서 멈추므로 그 뒤는 모두 실패
+                for position in positions[e.details["writeErrors"][0]["index"]:]:
+                    applied[position] = False
+            self.manager.calculate_ranks()
+            self.manager.rebuild_statistics()
+            if self.manager.cache is not None:
+                self.manager.cache.clear()
+        return applied
+
+    def delete(self, student_id):
+        return self.manager.remove_student(student_id) is not None
+
+    def update_scores(self, student_id, english, c_language, python):
+        return self.manager.update_scores(student_id, english, c_language, python) is not None
+
+    def update_scores_many(self, updates):
+        return self.manager.update_scores_many(updates)
+
+    def get(self, student_id):
+        from database import DISPLAY_FIELDS
+
+        return self.manager.collection.find_one({"student_id": student_id}, DISPLAY_FIELDS)
+
+    def search(self, key):
+        return self.manager.find_students(key)
+
+    def rank_of(self, student_id):
+        return self.manager.rank_of(student_id)
+
+    def top_students(self, k):
+        return self.manager.top_students(k)
+
+    def ranked(self):
+        return self.manager.iter_students("rank")
+
+    def statistics(self):
+        summary = self.manager.fetch_statistics()
+        count = summary["count"]
+        if count == 0:
+            return {"count": 0}
+        return {
+            "count": count,
+            "avg_english": summary["sum_english"] / count,
+            "avg_c_language": summary["sum_c_language"] / count,
+            "avg_python": summary["sum_python"] / count,
+            "avg_total": summary["sum_total"] / count,
+            "max_total": summary["max_total"],
+            "min_total": summary["min_total"],
+            "above_80": summary["above"].get("80", 0),
+        }
+
+    def close(self):
+        self.manager.close_connection()
+
+
+def open_backend(kind, **options):
+    """
+    이름으로 저장소 열기
+    - "memory": data_dir를 주면 스냅샷/저널로 보존
+    - "sqlite": path (기본 grades.db)
+    - "mongo": connection_string, db_name
+    """
+    if kind == "memory":
+        data_dir = options.get("data_dir")
+        if data_dir:
+            from journal import GradeStore
+
+            return MemoryBackend(GradeManager(store=GradeStore(data_dir)))
+        return MemoryBackend()
+    if kind == "sqlite":
+        from sqlite_backend import SQLiteBackend
+
+        return SQLiteBackend(options.get("path", "grades.db"))
+    if kind == "mongo":
+        from database import MongoGradeManager
+
+        return MongoBackend(MongoGradeManager(
+            connection_string=options.get("connection_string", "mongodb://localhost:27017/"),
+            db_name=options.get("db_name", "grade_management"),
+        ))
+    raise ValueError(f"알 수 없는 저장소입니다: {kind}")
@@ -0,0 +1,211 @@
+##############################
+# 프로그램명: MongoGradeManager 동시 쓰기 시험
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 스레드 풀의 여러 작업자가 하나의 MongoGradeManager로 추가/삭제/이름 변경을 동시에 실행
+#     (좁은 학번 범위를 써서 같은 학번을 두고 일부러 충돌시킴)
+#   - 버전 확인 변경: 작업자들이 같은 학생의 이름(카운터)을 읽고-고치기를 반복하여 잃어버린 변경이 없는지 확인
+#   - 끝나면 학생 수, 학번 중복, 저장된 등수, 통계 요약 문서가 실제 데이터와 일치하는지 검사
+#   - MongoDB: 연결 문자열을 주면 실제 서버, 기본은 mongomock
+#
+# 사용 예:
+#   python stress_concurrency.py --workers 16 --operations 2000
+#   python stress_concurrency.py --mongo "mongodb://localhost:27017/?replicaSet=rs0" --transactions
+##############################
+
+import argparse
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+
+from database import SUMMARY_ID, MongoGradeManager, Student, VersionConflictError
+
+STRESS_DB = "grade_stress"
+
+
+class _AtomicCommands:
+    """
+    mongomock 컬렉션 감싸개: 명령 하나를 잠금 안에서 실행
+    mongomock은 find_one_and_update 같은 단일 문서 명령도 스레드 사이에서 원자적이지 않아
+    실제 서버와 같도록 명령 단위로만 맞춤 (여러 명령에 걸친 경쟁은 그대로 드러남)
+    """
+
+    def __init__(self, collection, lock):
+        self._collection = collection
+        self._lock = lock
+
+    def __getattr__(self, name):
+        attribute = getattr(self._collection, name)
+        if not callable(attribute):
+            return attribute
+        lock = self._lock
+
+        def command(*args, **kwargs):
+            with lock:
+                return attribute(*args, **kwargs)
+        return command
+
+
+def open_manager(target, transactions):
+    if target == "mock":
+        import mongomock
+
+        with redirect_stdout(sys.stderr):
+            manager = MongoGradeManager(db_name=STRESS_DB, client=mongomock.MongoClient())
+        lock = threading.RLock()
+        manager.collection = _AtomicCommands(manager.collection, lock)
+        manager.summary = _AtomicCommands(manager.summary, lock)
+        # mongomock은 $setWindowFields를 지원하지 않으므로 쓰기 잠금 안에서 일괄 쓰기 방식으로 등수 계산
+        bulk = manager._calculate_ranks_bulk
+
+        def calculate_ranks():
+            with manager._write_lock:
+                bulk()
+
+        manager.calculate_ranks = calculate_ranks
+        return manager
+    with redirect_stdout(sys.stderr):
+        manager = MongoGradeManager(connection_string=target, db_name=STRESS_DB, transactions=transactions)
+    manager.collection.delete_many({})
+    manager.summary.delete_many({})
+    return manager
+
+
+def writer(manager, seed, operations, id_space, counts, lock):
+    """추가 50% / 삭제 25% / 버전 확인 이름 변경 23% / 전체 등수 재계산 2%"""
+    rng = random.Random(seed)
+    local = Counter()
+    for _ in range(operations):
+        student_id = f"S{rng.randrange(id_space):05d}"
+        roll = rng.random()
+        if roll < 0.5:
+            student = Student(student_id, f"학생{seed}", rng.randint(0, 100), rng.randint(0, 100), rng.randint(0, 100))
+            local["added" if manager.insert_student(student) else "duplicate"] += 1
+        elif roll < 0.75:
+            local["deleted" if manager.remove_student(student_id) is not None else "missing"] += 1
+        elif roll < 0.77:
+            # 증분 갱신 도중에 전체 재계산이 끼어들어도 등수가 어긋나지 않아야 함
+            manager.calculate_ranks()
+            local["recalculated"] += 1
+        else:
+            data = manager.collection.find_one({"student_id": student_id}, {"version": 1})
+            if data is None:
+                local["missing"] += 1
+                continue
+            try:
+                if manager.update_student(student_id, f"변경{seed}", data.get("version", 0)) is None:
+                    local["missing"] += 1
+                else:
+                    local["renamed"] += 1
+            except VersionConflictError:
+                local["conflict"] += 1
+    with lock:
+        counts.update(local)
+
+
+def increment(manager, student_id, times, counts, lock):
+    """이름에 든 숫자를 읽고-1 더하기를 버전 확인으로 times번 성공할 때까지 반복"""
+    retries = 0
+    done = 0
+    while done < times:
+        data = manager.collection.find_one({"student_id": student_id}, {"name": 1, "version": 1})
+        value = int(data["name"].split("-")[1])
+        try:
+            manager.update_student(student_id, f"카운터-{value + 1}", data["version"])
+            done += 1
+        except VersionConflictError:
+            retries += 1
+    with lock:
+        counts["retries"] += retries
+
+
+def competition_ranks(totals):
+    """총점 목록의 경쟁 순위 (동점 같은 등수, 다음 등수 건너뜀)"""
+    ranks = {}
+    for i, total in enumerate(sorted(totals, reverse=True)):
+        ranks.setdefault(total, i + 1)
+    return ranks
+
+
+def verify(manager, counts):
+    """저장된 데이터가 실제 결과와 일치하는지 검사하고 문제 목록 반환"""
+    problems = []
+    documents = list(manager.collection.find({}, {"_id": 0}))
+    expected = counts["added"] - counts["deleted"] + 1     # +1: 버전 시험용 카운터 학생
+    if len(documents) != expected:
+        problems.append(f"학생 수 {len(documents)} != 추가 - 삭제 {expected}")
+
+    ids = Counter(d["student_id"] for d in documents)
+    duplicates = [student_id for student_id, n in ids.items() if n > 1]
+    if duplicates:
+        problems.append(f"중복 학번 {len(duplicates)}개: {duplicates[:5]}")
+
+    ranks = competition_ranks([d["total"] for d in documents])
+    wrong = [d["student_id"] for d in documents if d["rank"] != ranks[d["total"]]]
+    if wrong:
+        problems.append(f"등수가 틀린 학생 {len(wrong)}명: {wrong[:5]}")
+
+    stored = manager.summary.find_one({"_id": SUMMARY_ID}) or {}
+    with redirect_stdout(sys.stderr):
+        rebuilt = manager.rebuild_statistics()
+    for field in ("count", "sum_total", "sum_english", "sum_c_language", "sum_python", "min_total", "max_total"):
+        if stored.get(field) != rebuilt.get(field):
+            problems.append(f"통계 {field}: 요약 {stored.get(field)} != 재집계 {rebuilt.get(field)}")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="MongoGradeManager 동시 쓰기 시험")
+    parser.add_argument("--mongo", default="mock", help="mock(mongomock) 또는 MongoDB 연결 문자열")
+    parser.add_argument("--transactions", action="store_true", help="서버 트랜잭션 사용 (복제 세트 필요)")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--operations", type=int, default=2000, help="작업자 전체의 추가/삭제/변경 횟수")
+    parser.add_argument("--ids", type=int, default=300, help="학번 범위 (작을수록 충돌이 많음)")
+    parser.add_argument("--increments", type=int, default=50, help="버전 시험에서 작업자마다 성공할 변경 횟수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    manager = open_manager(args.mongo, args.transactions)
+    counts = Counter()
+    lock = threading.Lock()
+    counter_id = "COUNTER"
+    manager.insert_student(Student(counter_id, "카운터-0", 0, 0, 0))
+
+    per_worker = max(1, args.operations // args.workers)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        jobs = [pool.submit(writer, manager, args.seed + i, per_worker, args.ids, counts, lock)
+                for i in range(args.workers)]
+        jobs += [pool.submit(increment, manager, counter_id, args.increments, counts, lock)
+                 for _ in range(args.workers)]
+        for job in jobs:
+            job.result()
+    elapsed = time.perf_counter() - start
+
+    print(f"작업자 {args.workers}개, {elapsed:.2f}초")
+    print("결과: " + ", ".join(f"{key} {n}" for key, n in sorted(counts.items())))
+
+    problems = verify(manager, counts)
+    counter = manager.collection.find_one({"student_id": counter_id})
+    expected = args.workers * args.increments
+    if counter["name"] != f"카운터-{expected}" or counter["version"] != expected + 1:
+        problems.append(f"버전 시험: {counter['name']} (version {counter['version']}), 기대값 카운터-{expected}")
+
+    manager.client.drop_database(STRESS_DB)
+    with redirect_stdout(sys.stderr):
+        manager.close_connection()
+
+    if problems:
+        print("불일치 발견:")
+        for problem in problems:
+            print(f"  - {problem}")
+        sys.exit(1)
+    print("검사 통과: 학생 수, 학번 중복, 등수, 통계 요약, 버전 확인 변경 모두 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+##############################
+# 프로그램명: 고정 길이 바이너리 학생 파일
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - Student.to_dict()의 필드를 고정 길이(94바이트) 레코드로 저장
+#   - mmap으로 열어 복사 없이 읽기 (레코드 번호로 바로 접근, NumPy 구조체 배열로 보기)
+#   - 파일 끝에 학번 기준 정렬 색인을 두어 학번 검색은 이진 탐색
+#   - database.py의 MongoDB 문서, main.py의 GradeManager와 서로 변환
+#
+# 파일 구성:
+#   헤더(32바이트) | 레코드 × 학생 수 | 색인(학번 16바이트 + 레코드 번호 8바이트) × 학생 수
+##############################
+
+import mmap
+import struct
+from datetime import datetime, timedelta
+
+MAGIC = b"GRFX"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQQ8x")  # 매직, 버전, 레코드 크기, 학생 수, 색인 위치
+RECORD = struct.Struct("<16s32siiiid2siqq")
+INDEX_ENTRY = struct.Struct("<16sQ")
+
+FIELDS = ("student_id", "name", "english", "c_language", "python", "total",
+          "average", "grade", "rank", "created_at", "updated_at")
+
+EPOCH = datetime(1970, 1, 1)
+NO_TIME = -(2 ** 63)  # 시각 정보가 없을 때
+
+
+def _encode_text(text, size, field):
+    data = str(text).encode("utf-8")
+    if len(data) > size:
+        raise ValueError(f"{field}이(가) 너무 깁니다 (최대 {size}바이트): {text!r}")
+    return data
+
+
+def _decode_text(data):
+    return data.rstrip(b"\0").decode("utf-8")
+
+
+def _encode_time(value):
+    if value is None:
+        return NO_TIME
+    return (value - EPOCH) // timedelta(microseconds=1)
+
+
+def _decode_time(value):
+    if value == NO_TIME:
+        return None
+    return EPOCH + timedelta(microseconds=value)
+
+
+def _as_document(student):
+    """Student 객체 또는 딕셔너리를 to_dict() 형태의 딕셔너리로"""
+    if isinstance(student, dict):
+        return student
+    return {
+        "student_id": student.student_id, "name": student.name,
+        "english": student.english, "c_language": student.c_language, "python": student.python,
+        "total": student.total, "average": student.average, "grade": student.grade,
+        "rank": student.rank,
+        "created_at": getattr(student, "created_at", None),
+        "updated_at": getattr(student, "updated_at", None),
+    }
+
+
+def pack_record(student):
+    d = _as_document(student)
+    return RECORD.pack(
+        _encode_text(d["student_id"], 16, "학번"), _encode_text(d["name"], 32, "이름"),
+        d["english"], d["c_language"], d["python"], d["total"], d["average"],
+        _encode_text(d["grade"], 2, "학점"), d.get("rank", 0),
+        _encode_time(d.get("created_at")), _encode_time(d.get("updated_at")),
+    )
+
+
+def unpack_record(buffer, offset=0):
+    values = RECORD.unpack_from(buffer, offset)
+    document = dict(zip(FIELDS, values))
+    document["student_id"] = _decode_text(document["student_id"])
+    document["name"] = _decode_text(document["name"])
+    document["grade"] = _decode_text(document["grade"])
+    document["created_at"] = _decode_time(document["created_at"])
+    document["updated_at"] = _decode_time(document["updated_at"])
+    return document
+
+
+def write_students(path, students):
+    """
+    학생 목록(Student 객체 또는 MongoDB 문서)을 파일로 저장하고 저장한 학생 수 반환
+    학생 목록은 한 번만 순회하므로 MongoDB 커서를 그대로 넘겨도 됨
+    """
+    keys = []
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, 0, 0))
+        chunk = []
+        for student in students:
+            record = pack_record(student)
+            keys.append((record[:16], len(keys)))
+            chunk.append(record)
+            if len(chunk) >= 4096:
+                f.write(b"".join(chunk))
+                chunk.clear()
+        f.write(b"".join(chunk))
+
+        index_offset = HEADER.size + RECORD.size * len(keys)
+        keys.sort()
+        for i in range(1, len(keys)):
+            if keys[i][0] == keys[i - 1][0]:
+                raise ValueError(f"중복된 학번이 있습니다: {_decode_text(keys[i][0])}")
+        f.write(b"".join(INDEX_ENTRY.pack(key, record_no) for key, record_no in keys))
+
+        f.seek(0)
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, len(keys), index_offset))
+    return len(keys)
+
+
+class StudentFile:
+    def __init__(self, path):
+        """파일을 읽기 전용 mmap으로 열기"""
+        self._file = open(path, "rb")
+        try:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("빈 파일입니다.")
+        magic, version, record_size, count, index_offset = HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != VERSION or record_size != RECORD.size:
+            self.close()
+            raise ValueError("학생 파일 형식이 올바르지 않습니다.")
+        self.count = count
+        self.index_offset = index_offset
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, record_no):
+        """레코드 번호로 학생 문서 읽기"""
+        if record_no < 0:
+            record_no += self.count
+        if not 0 <= record_no < self.count:
+            raise IndexError("record number out of range")
+        return unpack_record(self._buffer, HEADER.size + record_no * RECORD.size)
+
+    def __iter__(self):
+        for record_no in range(self.count):
+            yield unpack_record(self._buffer, HEADER.size + record_no * RECORD.size)
+
+    def record_view(self, record_no):
+        """레코드 원본 바이트를 복사 없이 memoryview로 반환"""
+        start = HEADER.size + record_no * RECORD.size
+        return memoryview(self._buffer)[start:start + RECORD.size]
+
+    def find(self, student_id):
+        """학번 색인을 이진 탐색하여 학생 문서 반환 (없으면 None)"""
+        key = _encode_text(student_id, 16, "학번").ljust(16, b"\0")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            entry_key, record_no = INDEX_ENTRY.unpack_from(self._buffer, self.index_offset + mid * INDEX_ENTRY.size)
+            if entry_key < key:
+                lo = mid + 1
+            elif entry_key > key:
+                hi = mid
+            else:
+                return self[record_no]
+        return None
+
+    def as_array(self):
+        """레코드 영역을 NumPy 구조체 배열로 보기 (복사 없음, 읽기 전용)"""
+        import numpy as np
+
+        dtype = np.dtype([
+            ("student_id", "S16"), ("name", "S32"),
+            ("english", "<i4"), ("c_language", "<i4"), ("python", "<i4"), ("total", "<i4"),
+            ("average", "<f8"), ("grade", "S2"), ("rank", "<i4"),
+            ("created_at", "<i8"), ("updated_at", "<i8"),
+        ])
+        return np.frombuffer(self._buffer, dtype=dtype, count=self.count, offset=HEADER.size)
+
+    def close(self):
+        if getattr(self, "_buffer", None) is not None:
+            self._buffer.close()
+            self._buffer = None
+        self._file.close()
+
+
+def export_grade_manager(path, manager):
+    """main.py GradeManager의 학생을 (현재 등수와 함께) 파일로 저장"""
+    manager.calculate_ranks()
+    return write_students(path, manager.students.values())
+
+
+def import_grade_manager(path, manager):
+    """파일의 학생을 main.py GradeManager에 적재"""
+    from main import Student
+
+    students = []
+    with StudentFile(path) as student_file:
+        for document in student_file:
+            students.append(Student(document["student_id"], document["name"], document["english"],
+                                    document["c_language"], document["python"]))
+    manager.load_students(students)
+    return len(students)
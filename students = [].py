@@ -1,3 +1,5 @@
+import heapq
+
 students = []
 
 def calculate_grade(avg):
@@ -106,6 +108,33 @@ def count_above_80():
     count = sum(1 for student in students if student["평균"] >= 80)
     print(f"\n80점 이상 학생 수: {count}명")
 
+def top_students(k=10):
+    """총점 상위 k명 (전체를 정렬하지 않고 힙으로 k명만 고름)"""
+    return heapq.nlargest(k, students, key=lambda x: x["총점"])
+
+def rank_of(student_id):
+    """정렬 없이 등수 계산: 총점이 더 높은 학생 수 + 1"""
+    for student in students:
+        if student["학번"] == student_id:
+            return sum(1 for other in students if other["총점"] > student["총점"]) + 1
+    return None
+
+def print_top_students():
+    """총점 상위 학생 출력"""
+    try:
+        k = int(input("출력할 상위 학생 수: "))
+    except ValueError:
+        print("숫자를 입력하세요.")
+        return
+    # 총점 내림차순이므로 더 높은 총점의 학생은 모두 앞에 나옴: 등수 = 앞에 나온 더 높은 총점 학생 수 + 1
+    rank = 0
+    previous = None
+    for position, student in enumerate(top_students(k), start=1):
+        if student["총점"] != previous:
+            rank = position
+            previous = student["총점"]
+        print(f"{rank}등 {student['이름']}({student['학번']}): {student['총점']}점")
+
 def main():
     """메뉴 기반 실행"""
     while True:
@@ -117,6 +146,7 @@ def main():
         print("5. 학생 검색")
         print("6. 총점 기준 정렬")
         print("7. 80점 이상 학생 수 출력")
+        print("8. 총점 상위 학생 출력")
         print("0. 종료")
         choice = input("선택: ")
 
@@ -139,6 +169,8 @@ def main():
             sort_students()
         elif choice == "7":
             count_above_80()
+        elif choice == "8":
+            print_top_students()
         else:
             print("잘못된 입력입니다. 다시 선택하세요.")
 
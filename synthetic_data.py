@@ -0,0 +1,112 @@
+##############################
+# 프로그램명: 가상 학생 성적 데이터 생성기
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 벤치마크와 대량 등록 시험용 학생 데이터를 원하는 인원만큼 생성
+#   - 점수 분포 선택: uniform(고르게) / normal(정규) / bimodal(두 봉우리) / skewed(고득점 쏠림)
+#   - 학생별 실력 + 과목별 편차로 세 과목 점수가 서로 비슷하게 나오도록 생성
+#   - tie_pool을 주면 점수 조합을 그 개수 안에서만 골라 동점자가 많은 데이터를 만듦
+#   - 같은 seed면 항상 같은 데이터 (결과 비교용)
+#
+# 사용 예:
+#   python synthetic_data.py 100000 --distribution normal --output students.csv
+#   python synthetic_data.py 1000000 --tie-pool 50 --output ties.jsonl
+##############################
+
+import argparse
+import csv
+import json
+import random
+import sys
+
+FIELDS = ("student_id", "name", "english", "c_language", "python")
+DISTRIBUTIONS = ("uniform", "normal", "bimodal", "skewed")
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류전홍고문양손배백허유남심노하곽성차주우구민진나지엄채원천방공현함변염여추도소석선설마길연위표명기반왕금옥육인맹모탁국어은편용예경봉사부가복태목형피두감호"
+SYLLABLES = "민서지현수준우예하윤도은연진주영채성재유아건시온태린소희승동혜정원경호"
+
+
+def _clamp(score):
+    return max(0, min(100, int(round(score))))
+
+
+def _ability(rng, distribution, mean, spread):
+    """학생 한 명의 기본 실력 (0~100 부근)"""
+    if distribution == "uniform":
+        return rng.uniform(0, 100)
+    if distribution == "normal":
+        return rng.gauss(mean, spread)
+    if distribution == "bimodal":
+        # 하위권과 상위권 두 무리
+        return rng.gauss(mean - 20, spread * 0.7) if rng.random() < 0.5 else rng.gauss(mean + 15, spread * 0.7)
+    if distribution == "skewed":
+        # 대부분 고득점, 낮은 점수는 드물게
+        return 100 - rng.expovariate(1 / max(spread, 1))
+    raise ValueError(f"알 수 없는 분포입니다: {distribution}")
+
+
+def _scores(rng, distribution, mean, spread, subject_spread):
+    if distribution == "uniform":
+        return tuple(rng.randint(0, 100) for _ in range(3))
+    ability = _ability(rng, distribution, mean, spread)
+    return tuple(_clamp(rng.gauss(ability, subject_spread)) for _ in range(3))
+
+
+def make_name(rng):
+    return rng.choice(SURNAMES) + rng.choice(SYLLABLES) + rng.choice(SYLLABLES)
+
+
+def generate_students(count, distribution="normal", seed=0, tie_pool=None,
+                      mean=70.0, spread=15.0, subject_spread=8.0, start=0):
+    """
+    (학번, 이름, 영어, C-언어, 파이썬) 튜플을 count개 생성
+    distribution: DISTRIBUTIONS 중 하나
+    tie_pool: 정수면 그 개수의 점수 조합 중에서만 고름 (서로 다른 총점이 tie_pool개 이하)
+    mean / spread: 학생 실력의 평균과 표준편차, subject_spread: 과목별 편차
+    start: 학번 일련번호 시작값 (이미 만든 데이터에 이어 붙일 때)
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"알 수 없는 분포입니다: {distribution}")
+    rng = random.Random(seed)
+    pool = None
+    if tie_pool:
+        pool = [_scores(rng, distribution, mean, spread, subject_spread) for _ in range(tie_pool)]
+
+    for i in range(start, start + count):
+        scores = rng.choice(pool) if pool else _scores(rng, distribution, mean, spread, subject_spread)
+        # 입학 연도 5개에 나누어 학번 부여 (일련번호가 달라 중복 없음)
+        yield (f"{2020 + i % 5}{i:07d}", make_name(rng)) + scores
+
+
+def write_students(stream, students, output_format="csv"):
+    """생성한 학생을 bulk_import.py / batch_cli.py가 읽는 CSV 또는 JSONL로 기록"""
+    if output_format == "csv":
+        writer = csv.writer(stream)
+        writer.writerow(FIELDS)
+        writer.writerows(students)
+        return
+    for record in students:
+        stream.write(json.dumps(dict(zip(FIELDS, record)), ensure_ascii=False) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="가상 학생 성적 데이터 생성")
+    parser.add_argument("count", type=int)
+    parser.add_argument("--distribution", choices=DISTRIBUTIONS, default="normal")
+    parser.add_argument("--tie-pool", type=int, default=None, help="점수 조합 개수 (동점자 많은 데이터)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="-", help="출력 파일 (.csv / .jsonl, - 이면 표준출력 CSV)")
+    args = parser.parse_args(argv)
+
+    output_format = "jsonl" if args.output.endswith(".jsonl") else "csv"
+    stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        write_students(stream, generate_students(args.count, args.distribution, args.seed, args.tie_pool),
+                       output_format)
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+
+
+if __name__ == "__main__":
+    main()
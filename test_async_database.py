@@ -0,0 +1,117 @@
+##############################
+# 프로그램명: 성적관리 프로그램 (MongoDB 비동기 버전) 시험
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - async_database.py의 추가/삭제/등수 재계산을 asyncio.gather로 동시에 실행한 뒤
+#     모든 학생의 등수가 "총점이 더 높은 학생 수 + 1"과 같은지 확인
+#   - mongomock-motor(프로세스 안 대체 서버)가 있을 때만 실행
+#     대체 서버는 명령 중간에 이벤트 루프로 돌아가지 않으므로, 실제 서버 왕복처럼
+#     명령마다 몇 번씩 다른 코루틴에 차례를 넘기는 감싸개를 씌움
+#
+# 사용 예:
+#   python -m unittest test_async_database
+##############################
+
+import asyncio
+import random
+import unittest
+
+try:
+    from mongomock_motor import AsyncMongoMockClient
+    from pymongo.errors import OperationFailure
+
+    from async_database import AsyncMongoGradeManager
+except ImportError:
+    AsyncMongoMockClient = None
+
+
+class _YieldingCollection:
+    """명령을 실행하기 전에 이벤트 루프에 차례를 넘기는 컬렉션 감싸개"""
+
+    COMMANDS = ("count_documents", "insert_one", "update_one", "update_many", "replace_one",
+                "find_one", "find_one_and_delete", "find_one_and_update", "bulk_write")
+
+    def __init__(self, collection, rng):
+        self._collection = collection
+        self._rng = rng
+
+    def __getattr__(self, name):
+        attr = getattr(self._collection, name)
+        if name not in self.COMMANDS:
+            return attr
+
+        async def command(*args, **kwargs):
+            # 응답 시간이 명령마다 다른 것처럼 넘기는 횟수를 바꿔 코루틴 실행 순서를 섞음
+            for _ in range(self._rng.randint(1, 3)):
+                await asyncio.sleep(0)
+            return await attr(*args, **kwargs)
+        return command
+
+    def aggregate(self, pipeline, *args, **kwargs):
+        # mongomock은 $setWindowFields를 지원하지 않으므로 5.0 미만 서버처럼 실패시켜 일괄 쓰기로 계산하게 함
+        if any("$setWindowFields" in stage for stage in pipeline):
+            raise OperationFailure("$setWindowFields is not supported")
+        return self._collection.aggregate(pipeline, *args, **kwargs)
+
+
+@unittest.skipIf(AsyncMongoMockClient is None, "mongomock-motor가 설치되어 있지 않습니다.")
+class ConcurrentRankTest(unittest.TestCase):
+    def run_scenario(self, operations):
+        async def scenario():
+            manager = await AsyncMongoGradeManager(client=AsyncMongoMockClient(), db_name="test_async").connect()
+            rng = random.Random(1)
+            manager.collection = _YieldingCollection(manager.collection, rng)
+            manager.summary = _YieldingCollection(manager.summary, rng)
+            await operations(manager)
+            students = await manager.collection.find({}, {"_id": 0, "total": 1, "rank": 1}).to_list(length=None)
+            summary = await manager.summary.find_one({})
+            return students, summary
+
+        return asyncio.run(scenario())
+
+    def assert_ranks(self, students):
+        totals = [student["total"] for student in students]
+        for student in students:
+            self.assertEqual(student["rank"], sum(1 for total in totals if total > student["total"]) + 1)
+
+    def test_concurrent_adds_and_deletes(self):
+        rng = random.Random(5)
+        records = [(f"{i:04d}", f"학생{i}", rng.randint(0, 100), rng.randint(0, 100), rng.randint(0, 100))
+                   for i in range(120)]
+
+        async def operations(manager):
+            await asyncio.gather(*(manager.add_student(*record) for record in records[:80]))
+            await asyncio.gather(
+                *(manager.add_student(*record) for record in records[80:]),
+                *(manager.delete_student(record[0]) for record in records[:40:2]),
+                manager.calculate_ranks(),
+            )
+
+        students, summary = self.run_scenario(operations)
+        self.assertEqual(len(students), 100)
+        self.assert_ranks(students)
+        self.assertEqual(summary["count"], 100)
+
+    def test_duplicate_adds(self):
+        async def operations(manager):
+            results = await asyncio.gather(*(manager.add_student("0001", "a", 90, 90, 90) for _ in range(5)),
+                                           manager.add_student("0002", "b", 50, 50, 50))
+            self.assertEqual(sum(result is not None for result in results), 2)
+
+        students, summary = self.run_scenario(operations)
+        self.assert_ranks(students)
+        self.assertEqual(summary["count"], 2)
+
+    def test_add_without_summary(self):
+        async def operations(manager):
+            for i in range(5):
+                await manager.add_student(f"{i:04d}", "a", 10 * i, 50, 50)
+            await manager.summary.delete_many({})
+            await manager.add_student("0100", "b", 100, 100, 100)
+
+        _, summary = self.run_scenario(operations)
+        self.assertEqual((summary["count"], summary["min_total"], summary["max_total"]), (6, 100, 300))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+##############################
+# 프로그램명: 성적 대량 등록 프로그램 시험
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - bulk_import.py의 행 검증과 잘못된 행을 건너뛰고 계속 저장하는지 확인
+#   - 저장 시험은 mongomock(프로세스 안 대체 서버)이 있을 때만 실행
+#
+# 사용 예:
+#   python -m unittest test_bulk_import
+##############################
+
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from bulk_import import build_document, import_students
+
+try:
+    import mongomock
+except ImportError:
+    mongomock = None
+
+
+class BuildDocumentTest(unittest.TestCase):
+    def test_valid_record(self):
+        document = build_document({"student_id": "001", "name": "홍길동",
+                                   "english": "90", "c_language": 80, "python": 70})
+        self.assertEqual(document["student_id"], "001")
+        self.assertEqual(document["total"], 240)
+
+    def test_non_object_rows(self):
+        for record in ([1, 2], "001", 5, None):
+            with self.assertRaises(ValueError):
+                build_document(record)
+
+    def test_bad_scores(self):
+        with self.assertRaises(ValueError):
+            build_document({"student_id": "001", "name": "홍길동", "english": 90, "c_language": 80})
+        with self.assertRaises(ValueError):
+            build_document({"student_id": "001", "name": "홍길동",
+                            "english": "구십", "c_language": 80, "python": 70})
+
+
+@unittest.skipIf(mongomock is None, "mongomock이 설치되어 있지 않습니다.")
+class ImportStudentsTest(unittest.TestCase):
+    def setUp(self):
+        from database import MongoGradeManager
+
+        with redirect_stdout(StringIO()):
+            self.manager = MongoGradeManager(db_name="test_bulk_import", client=mongomock.MongoClient())
+        # mongomock은 $setWindowFields를 지원하지 않으므로 일괄 쓰기 방식으로 등수 계산
+        self.manager.calculate_ranks = self.manager._calculate_ranks_bulk
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_lines(self, lines):
+        path = os.path.join(self.temp_dir.name, "students.jsonl")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        return path
+
+    def test_non_object_row_is_reported(self):
+        path = self.write_lines([
+            json.dumps({"student_id": "001", "name": "a", "english": 90, "c_language": 80, "python": 70}),
+            "[1, 2]",
+            '"002"',
+            json.dumps({"student_id": "003", "name": "c", "english": 60, "c_language": 50, "python": 40}),
+        ])
+        error_path = os.path.join(self.temp_dir.name, "errors.jsonl")
+        with redirect_stdout(StringIO()):
+            summary = import_students(self.manager, path, batch_size=2, error_path=error_path)
+
+        self.assertEqual((summary["read"], summary["written"], summary["failed"]), (4, 2, 2))
+        self.assertEqual(self.manager.collection.count_documents({}), 2)
+        with open(error_path, encoding="utf-8") as f:
+            errors = [json.loads(line) for line in f]
+        self.assertEqual([error["line"] for error in errors], [2, 3])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+##############################
+# 프로그램명: 틱택토 게임 서버 시험
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - tictactoe_server.py의 MOVE 명령이 잘못된 칸 번호에 ERR로 답하고 세션을 유지하는지 확인
+#   - 컴퓨터 전략은 점수 표가 필요 없는 random 사용
+#
+# 사용 예:
+#   python -m unittest test_tictactoe_server
+##############################
+
+import asyncio
+import unittest
+
+from tictactoe_server import GameServer, Session
+
+BAD_MOVES = (["MOVE"], ["MOVE", "²"], ["MOVE", "abc"], ["MOVE", "0"], ["MOVE", "10"],
+             ["MOVE", "-1"], ["MOVE", "1.5"], ["MOVE", "1", "2"])
+
+
+class MoveCommandTest(unittest.TestCase):
+    def setUp(self):
+        self.server = GameServer(strategy="random", seed=0)
+        self.session = Session(1, None, self.server.strategy("random"))
+        self.server.execute(self.session, ["NEW", "random"])
+
+    def test_bad_move_arguments(self):
+        for words in BAD_MOVES:
+            self.assertEqual(self.server.execute(self.session, words), "ERR move must be an empty cell 1-9", words)
+        self.assertEqual(self.server.stats["moves"], 0)
+        self.assertEqual(self.server.execute(self.session, ["MOVE", "5"]).split()[0], "BOARD")
+
+    def test_occupied_cell(self):
+        self.server.execute(self.session, ["MOVE", "5"])
+        self.assertEqual(self.server.execute(self.session, ["MOVE", "5"]), "ERR move must be an empty cell 1-9")
+
+
+class ConnectionTest(unittest.TestCase):
+    def test_session_survives_bad_move(self):
+        async def scenario():
+            server = await GameServer("127.0.0.1", 0, "random", seed=0).start()
+            try:
+                reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+                replies = [await reader.readline()]
+                for line in ("NEW random", "MOVE ²", "MOVE 5", "QUIT"):
+                    writer.write(line.encode() + b"\n")
+                    replies.append(await reader.readline())
+                writer.close()
+                return [reply.decode().split()[0] for reply in replies]
+            finally:
+                await server.close()
+
+        self.assertEqual(asyncio.run(scenario()), ["HELLO", "BOARD", "ERR", "BOARD", "BYE"])
+
+
+if __name__ == "__main__":
+    unittest.main()
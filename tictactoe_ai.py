@@ -0,0 +1,246 @@
+##############################
+# 프로그램명: 틱택토 완벽한 수 컴퓨터 (알파-베타 탐색 + 대칭 변환 표)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 알파-베타 가지치기 네가맥스(negamax)로 지지 않는 수를 찾는 컴퓨터 상대
+#   - 회전 4가지 x 뒤집기 2가지 = 8가지 대칭 중 가장 작은 키를 대표 키로 써서
+#     모양만 돌린 같은 국면은 한 번만 계산하여 변환 표(transposition table)에 저장
+#   - solve()로 나올 수 있는 모든 국면을 한 번 풀어 두면 이후 수는 표 조회만으로 결정
+#   - 표는 국면마다 3바이트(3진수 국면 번호 2바이트 + 점수 1바이트)의 작은 파일로 저장/불러오기
+#   - 점수: 둘 차례인 쪽 기준, 이기면 양수(빨리 이길수록 큼), 지면 음수, 비기면 0
+#
+# 사용 예:
+#   player = PerfectPlayer.load_or_solve("tictactoe_table.bin")
+#   move = player.best_move(state)
+##############################
+
+import os
+import random
+import struct
+
+from tictactoe_engine import SIZE, WINNING, GameState
+
+WIN_SCORE = 10          # 이긴 쪽 점수 = WIN_SCORE - 둔 수 (빨리 이길수록 큼)
+INFINITY = WIN_SCORE + 1
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# 가운데, 모서리, 변 순서로 먼저 살펴보면 가지치기가 잘 됨
+MOVE_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+TABLE_MAGIC = b"TTT1"
+TABLE_HEADER = struct.Struct("<4sI")     # 표시, 국면 수
+TABLE_RECORD = struct.Struct("<Hb")      # 3진수 국면 번호, 점수
+
+
+def _symmetries():
+    """칸 번호 순열 8가지 (perm[i] = 변환 후 i번 칸으로 오는 원래 칸)"""
+    rotate = [6, 3, 0, 7, 4, 1, 8, 5, 2]        # 시계 방향 90도
+    mirror = [2, 1, 0, 5, 4, 3, 8, 7, 6]        # 좌우 뒤집기
+    perms = []
+    perm = list(range(SIZE))
+    for _ in range(4):
+        perms.append(tuple(perm))
+        perms.append(tuple(perm[mirror[i]] for i in range(SIZE)))
+        perm = [perm[rotate[i]] for i in range(SIZE)]
+    return perms
+
+
+def _permute(bits, perm):
+    return sum(1 << i for i, source in enumerate(perm) if bits >> source & 1)
+
+
+SYMMETRIES = _symmetries()
+# SYMMETRY_TABLES[s][bits]: 비트보드 bits에 s번째 대칭 변환을 적용한 결과 (8 x 512칸 표)
+SYMMETRY_TABLES = tuple(tuple(_permute(bits, perm) for bits in range(1 << SIZE)) for perm in SYMMETRIES)
+
+# 3진수 국면 번호: 칸마다 빈칸 0 / X 1 / O 2 (3^9 = 19683 < 65536 이므로 2바이트)
+BASE3 = tuple(sum(3 ** i for i in range(SIZE) if bits >> i & 1) for bits in range(1 << SIZE))
+
+
+def canonical_key(x, o):
+    """8가지 대칭 변환 중 가장 작은 국면 키 (GameState.key()와 같은 형식)"""
+    return min(table[x] | table[o] << SIZE for table in SYMMETRY_TABLES)
+
+
+def _key_to_base3(key):
+    mask = (1 << SIZE) - 1
+    return BASE3[key & mask] + 2 * BASE3[key >> SIZE]
+
+
+def _digits_to_key(number, count):
+    key = 0
+    for i in range(count):
+        number, digit = divmod(number, 3)
+        if digit:
+            key |= 1 << (i if digit == 1 else i + SIZE)
+    return key
+
+
+# 3진수 세 자리(0~26)씩 끊어 읽는 표 (불러오기 때 국면마다 자리 9개를 나누지 않도록)
+BASE3_CHUNKS = tuple(_digits_to_key(number, 3) for number in range(27))
+
+
+def _base3_to_key(number):
+    high, rest = divmod(number, 729)
+    middle, low = divmod(rest, 27)
+    return BASE3_CHUNKS[low] | BASE3_CHUNKS[middle] << 3 | BASE3_CHUNKS[high] << 6
+
+
+def terminal_score(state):
+    """끝난 국면의 점수 (둘 차례인 쪽 기준), 끝나지 않았으면 None"""
+    if WINNING[state.x] or WINNING[state.o]:
+        # 마지막에 둔 쪽이 이겼으므로 둘 차례인 쪽은 짐 (늦게 질수록 나음)
+        return state.moves - WIN_SCORE
+    if state.is_full():
+        return 0
+    return None
+
+
+class PerfectPlayer:
+    """
+    알파-베타 탐색 컴퓨터 상대
+    table: {대표 키: (점수, 종류)}, 종류는 EXACT(정확한 값) / LOWER(하한) / UPPER(상한)
+    rng: 점수가 같은 수가 여럿일 때 고를 난수 생성기 (None이면 MOVE_ORDER에서 먼저 나오는 수)
+    """
+
+    def __init__(self, table=None, rng=None):
+        self.table = {} if table is None else table
+        self.rng = rng
+        self.nodes = 0      # 표에서 찾지 못해 직접 살펴본 국면 수
+
+    def search(self, state, alpha=-INFINITY, beta=INFINITY):
+        """state의 점수 (alpha~beta 밖이면 그 경계 쪽의 값만 보장)"""
+        score = terminal_score(state)
+        if score is not None:
+            return score
+        key = canonical_key(state.x, state.o)
+        lower, upper = -INFINITY, INFINITY     # 표에 이미 알려진 점수 범위
+        entry = self.table.get(key)
+        if entry is not None:
+            value, kind = entry
+            if kind == EXACT:
+                return value
+            if kind == LOWER:
+                lower = value
+            else:
+                upper = value
+            alpha = max(alpha, lower)
+            beta = min(beta, upper)
+            if alpha >= beta:
+                return value
+
+        self.nodes += 1
+        original_alpha = alpha
+        best = -INFINITY
+        empty = state.empty()
+        for move in MOVE_ORDER:
+            if not empty >> move & 1:
+                continue
+            state.play(move)
+            value = -self.search(state, -beta, -alpha)
+            state.undo()
+            if value > best:
+                best = value
+                if value > alpha:
+                    alpha = value
+                    if alpha >= beta:
+                        break
+
+        # 이번 결과로 좁혀진 범위를 표의 범위와 합침 (상한과 하한이 만나면 정확한 값)
+        if best <= original_alpha:
+            upper = min(upper, best)
+        elif best >= beta:
+            lower = max(lower, best)
+        else:
+            lower = upper = best
+        if lower >= upper:
+            self.table[key] = (lower, EXACT)
+        elif best <= original_alpha:
+            self.table[key] = (upper, UPPER)
+        else:
+            self.table[key] = (lower, LOWER)
+        return best
+
+    def move_scores(self, state):
+        """{둘 수 있는 칸: 그 수를 둔 뒤의 점수 (둔 쪽 기준)}"""
+        scores = {}
+        for move in MOVE_ORDER:
+            if state.is_empty(move):
+                state.play(move)
+                scores[move] = -self.search(state)
+                state.undo()
+        return scores
+
+    def best_move(self, state):
+        """가장 좋은 수 (끝난 국면이면 None)"""
+        if state.is_over():
+            return None
+        scores = self.move_scores(state)
+        best = max(scores.values())
+        moves = [move for move, score in scores.items() if score == best]
+        return self.rng.choice(moves) if self.rng is not None and len(moves) > 1 else moves[0]
+
+    def solve(self):
+        """처음 국면에서 나올 수 있는 모든 국면의 정확한 점수를 표에 채우고, 끝나지 않은 대표 국면 수 반환"""
+        seen = set()
+        state = GameState()
+
+        def visit():
+            if state.is_over():
+                return
+            key = canonical_key(state.x, state.o)
+            if key in seen:
+                return
+            seen.add(key)
+            entry = self.table.get(key)
+            if entry is None or entry[1] != EXACT:
+                self.search(state)
+            for move in list(state.legal_moves()):
+                state.play(move)
+                visit()
+                state.undo()
+
+        visit()
+        return len(seen)
+
+    def save(self, path):
+        """정확한 점수만 3진수 국면 번호 순서로 저장 (임시 파일에 쓴 뒤 교체)"""
+        records = sorted((_key_to_base3(key), value) for key, (value, kind) in self.table.items() if kind == EXACT)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(TABLE_HEADER.pack(TABLE_MAGIC, len(records)))
+            for record in records:
+                f.write(TABLE_RECORD.pack(*record))
+        os.replace(tmp_path, path)
+        return len(records)
+
+    @classmethod
+    def load(cls, path, rng=None):
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, count = TABLE_HEADER.unpack_from(data)
+        if magic != TABLE_MAGIC or len(data) != TABLE_HEADER.size + count * TABLE_RECORD.size:
+            raise ValueError(f"틱택토 점수 표 파일이 아닙니다: {path}")
+        table = {_base3_to_key(number): (value, EXACT)
+                 for number, value in TABLE_RECORD.iter_unpack(data[TABLE_HEADER.size:])}
+        return cls(table, rng)
+
+    @classmethod
+    def load_or_solve(cls, path, rng=None):
+        """표 파일이 있으면 불러오고, 없거나 읽을 수 없으면 전부 풀어서 저장"""
+        try:
+            return cls.load(path, rng)
+        except (OSError, ValueError, struct.error):
+            pass
+        player = cls(rng=rng)
+        player.solve()
+        try:
+            player.save(path)
+        except OSError:
+            pass    # 저장하지 못해도 이번 실행에서는 풀어 둔 표를 그대로 씀
+        return player
+
+
+def random_move(state, rng=random):
+    """무작위 빈칸 (이전 컴퓨터 상대)"""
+    return rng.choice(list(state.legal_moves()))
@@ -0,0 +1,169 @@
+##############################
+# 프로그램명: 틱택토 게임 규칙 엔진 (비트보드)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 전역 변수 없이 게임 하나의 상태를 GameState 객체 하나로 보관 (여러 판을 동시에 진행 가능)
+#   - X와 O의 칸을 9비트 정수 두 개(비트보드)로 저장, 칸 번호 i(0~8)가 비트 i
+#   - 승리 판정: 512가지 비트 조합의 승리 여부를 미리 계산해 두고 표 한 번 조회로 확인 (O(1))
+#   - 빈칸 목록은 비트 연산(가장 낮은 1비트 꺼내기)으로 생성
+#   - 수 두기/무르기(undo)와 복사가 정수 몇 개만 바꾸므로 대량 시뮬레이션에 알맞음
+#   - key()는 (X 비트보드, O 비트보드)를 합친 정수로 딕셔너리 키로 사용 가능
+#
+# 사용 예:
+#   state = GameState()
+#   state.play(4)          # X가 가운데
+#   state.play(0)          # O가 왼쪽 위
+#   state.winner(), state.is_draw(), list(state.legal_moves())
+##############################
+
+SIZE = 9
+FULL = (1 << SIZE) - 1    # 9칸이 모두 찬 비트보드
+EMPTY = " "
+
+WIN_LINES = (
+    (0, 1, 2), (3, 4, 5), (6, 7, 8),  # 가로 줄
+    (0, 3, 6), (1, 4, 7), (2, 5, 8),  # 세로 줄
+    (0, 4, 8), (2, 4, 6)              # 대각선
+)
+WIN_MASKS = tuple(sum(1 << cell for cell in line) for line in WIN_LINES)
+
+# WINNING[bits]: 비트보드 bits에 한 줄이 완성되어 있으면 True (2^9 = 512칸 표)
+WINNING = tuple(any(bits & mask == mask for mask in WIN_MASKS) for bits in range(1 << SIZE))
+
+
+def iter_bits(bits):
+    """비트보드의 1인 칸 번호를 작은 번호부터 생성"""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+class GameState:
+    """
+    틱택토 한 판의 상태
+    - X가 먼저 두고 번갈아 둠 (둔 수가 짝수면 X 차례)
+    - history에 둔 칸을 순서대로 보관하여 undo()로 되돌림
+    """
+    __slots__ = ("x", "o", "history")
+
+    PLAYERS = ("X", "O")
+
+    def __init__(self, x=0, o=0, history=()):
+        self.x = x
+        self.o = o
+        self.history = list(history)
+
+    @classmethod
+    def from_cells(cls, cells):
+        """["X", " ", "O", ...] 9칸 목록으로 상태 생성 (둔 순서는 알 수 없어 무르기 불가)"""
+        x = o = 0
+        for i, value in enumerate(cells):
+            if value == "X":
+                x |= 1 << i
+            elif value == "O":
+                o |= 1 << i
+        state = cls(x, o)
+        state.history = [None] * (bin(x).count("1") + bin(o).count("1"))
+        return state
+
+    def copy(self):
+        return GameState(self.x, self.o, self.history)
+
+    def key(self):
+        """상태를 나타내는 정수 (X 비트보드 | O 비트보드 << 9), 같은 배치면 같은 값"""
+        return self.x | self.o << SIZE
+
+    def __eq__(self, other):
+        return isinstance(other, GameState) and self.x == other.x and self.o == other.o
+
+    def __hash__(self):
+        return self.key()
+
+    def __repr__(self):
+        return f"GameState({''.join(self.cells())!r})"
+
+    @property
+    def moves(self):
+        """지금까지 둔 수"""
+        return len(self.history)
+
+    @property
+    def player(self):
+        """이번에 둘 차례인 플레이어 ("X" 또는 "O")"""
+        return self.PLAYERS[len(self.history) & 1]
+
+    def occupied(self):
+        return self.x | self.o
+
+    def empty(self):
+        """빈칸 비트보드"""
+        return FULL ^ (self.x | self.o)
+
+    def legal_moves(self):
+        """둘 수 있는 칸 번호 (게임이 끝났으면 없음)"""
+        if WINNING[self.x] or WINNING[self.o]:
+            return iter(())
+        return iter_bits(FULL ^ (self.x | self.o))
+
+    def cell(self, i):
+        bit = 1 << i
+        if self.x & bit:
+            return "X"
+        if self.o & bit:
+            return "O"
+        return EMPTY
+
+    def cells(self):
+        """9칸 문자열 목록 (화면 출력용)"""
+        return [self.cell(i) for i in range(SIZE)]
+
+    def is_empty(self, i):
+        return 0 <= i < SIZE and not (self.x | self.o) >> i & 1
+
+    def play(self, i):
+        """차례인 플레이어가 i번 칸에 둠 (칸 번호가 틀렸거나 이미 찬 칸이면 ValueError)"""
+        if not self.is_empty(i):
+            raise ValueError(f"둘 수 없는 칸입니다: {i}")
+        if len(self.history) & 1:
+            self.o |= 1 << i
+        else:
+            self.x |= 1 << i
+        self.history.append(i)
+        return self
+
+    def undo(self):
+        """마지막 수를 되돌리고 그 칸 번호 반환"""
+        i = self.history.pop()
+        if i is None:
+            self.history.append(i)
+            raise ValueError("둔 순서를 모르는 상태는 되돌릴 수 없습니다.")
+        mask = ~(1 << i)
+        self.x &= mask
+        self.o &= mask
+        return i
+
+    def child(self, i):
+        """i번 칸에 둔 새 상태 (원래 상태는 그대로)"""
+        return self.copy().play(i)
+
+    def has_won(self, player):
+        return WINNING[self.x if player == "X" else self.o]
+
+    def winner(self):
+        """이긴 플레이어 ("X"/"O"), 아직 없으면 None"""
+        if WINNING[self.x]:
+            return "X"
+        if WINNING[self.o]:
+            return "O"
+        return None
+
+    def is_full(self):
+        return self.x | self.o == FULL
+
+    def is_draw(self):
+        """칸이 모두 찼고 승자가 없음"""
+        return self.x | self.o == FULL and not WINNING[self.x] and not WINNING[self.o]
+
+    def is_over(self):
+        return WINNING[self.x] or WINNING[self.o] or self.x | self.o == FULL
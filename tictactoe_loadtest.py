@@ -0,0 +1,129 @@
+##############################
+# 프로그램명: 틱택토 게임 서버 부하 시험
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - tictactoe_server.py에 가상 사용자 세션을 동시에 여러 개 연결하여 무작위로 두며 측정
+#   - 세션마다: 연결 -> games판 (NEW, MOVE ... 끝날 때까지) -> QUIT
+#   - 보고: 초당 완료 세션 수, 초당 수, 수 하나의 응답 시간 백분위(p50/p95/p99/최대), 승/무/패, 오류 수
+#   - --spawn: 같은 프로세스에 서버를 띄워 바로 시험 (서버 주소를 주지 않아도 됨)
+#
+# 사용 예:
+#   python tictactoe_loadtest.py --spawn --sessions 5000 --concurrency 1000
+#   python tictactoe_loadtest.py --port 8765 --sessions 20000 --concurrency 2000 --strategy random
+##############################
+
+import argparse
+import asyncio
+import random
+import resource
+import time
+from collections import Counter
+
+from bench_suite import percentile
+from tictactoe_server import GameServer
+from tictactoe_selfplay import STRATEGIES
+
+
+async def run_session(host, port, games, strategy, rng, latencies, outcomes):
+    """세션 하나: 연결해서 games판 두고 종료"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        hello = await reader.readline()
+        if not hello.startswith(b"HELLO"):
+            raise ConnectionError(hello.decode().strip() or "connection closed")
+        clock = time.perf_counter
+        for _ in range(games):
+            writer.write(f"NEW {strategy}\n".encode())
+            reply = (await reader.readline()).decode().split()
+            while reply and reply[0] == "BOARD" and reply[2] == "PLAY":
+                empty = [i + 1 for i, cell in enumerate(reply[1]) if cell == "."]
+                start = clock()
+                writer.write(f"MOVE {rng.choice(empty)}\n".encode())
+                reply = (await reader.readline()).decode().split()
+                latencies.append(clock() - start)
+            if not reply or reply[0] != "BOARD":
+                raise ConnectionError(" ".join(reply) or "connection closed")
+            outcomes[reply[2]] += 1
+        writer.write(b"QUIT\n")
+        await reader.readline()
+    finally:
+        writer.close()
+
+
+async def load_test(host, port, sessions, concurrency, games, strategy, seed):
+    latencies = []
+    outcomes = Counter()
+    errors = Counter()
+    limit = asyncio.Semaphore(concurrency)
+    rng = random.Random(seed)
+
+    async def one():
+        async with limit:
+            try:
+                await run_session(host, port, games, strategy, rng, latencies, outcomes)
+            except (OSError, ConnectionError) as e:
+                errors[type(e).__name__ + ": " + str(e)[:60]] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(sessions)))
+    elapsed = time.perf_counter() - start
+    return elapsed, sorted(latencies), outcomes, errors
+
+
+def raise_file_limit(needed):
+    """세션마다 소켓이 필요하므로 열 수 있는 파일 수 한도를 가능한 만큼 올림"""
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    target = hard if hard != resource.RLIM_INFINITY else max(soft, needed)
+    if soft < min(needed, target):
+        resource.setrlimit(resource.RLIMIT_NOFILE, (min(needed, target), hard))
+    return resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+
+
+async def main_async(args):
+    server = None
+    host, port = args.host, args.port
+    if args.spawn:
+        server = await GameServer(host, 0, args.strategy, max_sessions=args.concurrency * 2, seed=args.seed).start()
+        port = server.port
+    try:
+        elapsed, latencies, outcomes, errors = await load_test(
+            host, port, args.sessions, args.concurrency, args.games, args.strategy, args.seed)
+    finally:
+        if server is not None:
+            await server.close()
+
+    to_ms = lambda value: value * 1000 if value is not None else float("nan")
+    print(f"세션 {args.sessions:,}개 (동시 {args.concurrency:,}), 세션마다 {args.games}판, 컴퓨터 {args.strategy}")
+    print(f"  걸린 시간       {elapsed:10.2f}초")
+    print(f"  완료 세션       {(args.sessions - sum(errors.values())) / elapsed:10,.0f}/초")
+    print(f"  수              {len(latencies) / elapsed:10,.0f}/초  ({len(latencies):,}수)")
+    print(f"  응답 시간       p50 {to_ms(percentile(latencies, 50)):.2f}ms  p95 {to_ms(percentile(latencies, 95)):.2f}ms  "
+          f"p99 {to_ms(percentile(latencies, 99)):.2f}ms  최대 {to_ms(latencies[-1] if latencies else None):.2f}ms")
+    print(f"  결과 (사용자 기준) 승 {outcomes['WIN']:,} / 무 {outcomes['DRAW']:,} / 패 {outcomes['LOSE']:,}")
+    if server is not None:
+        print(f"  서버 통계       {server.stats}")
+    if errors:
+        print(f"  오류 {sum(errors.values()):,}건:")
+        for message, n in errors.most_common(5):
+            print(f"    {n:,} x {message}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="틱택토 게임 서버 부하 시험")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--spawn", action="store_true", help="같은 프로세스에 서버를 띄워 시험")
+    parser.add_argument("--sessions", type=int, default=5000, help="전체 세션 수")
+    parser.add_argument("--concurrency", type=int, default=1000, help="동시에 연결할 세션 수")
+    parser.add_argument("--games", type=int, default=3, help="세션마다 둘 판 수")
+    parser.add_argument("--strategy", choices=STRATEGIES, default="perfect", help="서버 컴퓨터 전략")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # 같은 프로세스에 서버를 띄우면 연결마다 소켓이 두 개 필요
+    raise_file_limit(args.concurrency * (2 if args.spawn else 1) + 64)
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+##############################
+# 프로그램명: 틱택토 자동 대국 시뮬레이터
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 화면 입력/출력 없이 두 전략끼리 수백만 판을 자동으로 두어 승/무/패 비율 비교
+#   - 전략: random(무작위, 기존 computer_move와 같음) / heuristic(이기는 수 > 막는 수 > 가운데 > 모서리)
+#           / perfect(tictactoe_ai.PerfectPlayer, 같은 점수의 수 중 무작위)
+#   - 대국을 묶음(batch)으로 나누어 프로세스 풀에서 동시에 실행
+#     묶음마다 (seed, 묶음 번호)로 난수 생성기를 따로 만들어 작업자 수와 관계없이 같은 결과
+#   - 결과: X 기준 승/무/패 비율, 대국 길이(둔 수) 분포, 초당 대국 수
+#
+# 사용 예:
+#   python tictactoe_selfplay.py --x perfect --o random --games 1000000
+#   python tictactoe_selfplay.py --x heuristic --o heuristic --games 200000 --workers 4 --seed 7
+##############################
+
+import argparse
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+from tictactoe_ai import PerfectPlayer
+from tictactoe_engine import FULL, SIZE, WIN_MASKS, WINNING, GameState, iter_bits
+
+# EMPTY_MOVES[빈칸 비트보드]: 빈칸 번호 튜플 (무작위 선택 때 목록을 매번 만들지 않도록)
+EMPTY_MOVES = tuple(tuple(iter_bits(bits)) for bits in range(1 << SIZE))
+CORNERS = (0, 2, 6, 8)
+DEFAULT_TABLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tictactoe_table.bin")
+
+
+def random_strategy(rng, table_path=None):
+    """빈칸 중 무작위 (틱택톡 게임.py의 computer_move와 같은 전략)"""
+    choice = rng.choice
+
+    def move(state):
+        return choice(EMPTY_MOVES[FULL ^ (state.x | state.o)])
+    return move
+
+
+def _completing_moves(mine, empty):
+    """mine에 더하면 한 줄이 완성되는 빈칸 비트 모음"""
+    result = 0
+    for mask in WIN_MASKS:
+        missing = mask & ~mine
+        if missing & empty == missing and missing & (missing - 1) == 0:
+            result |= missing
+    return result
+
+
+def heuristic_strategy(rng, table_path=None):
+    """이길 수 있으면 이기고, 상대가 이길 칸은 막고, 아니면 가운데 > 모서리 > 나머지 중 무작위"""
+    choice = rng.choice
+
+    def move(state):
+        empty = FULL ^ (state.x | state.o)
+        mine, theirs = (state.o, state.x) if len(state.history) & 1 else (state.x, state.o)
+        for candidates in (_completing_moves(mine, empty), _completing_moves(theirs, empty)):
+            if candidates:
+                return choice(EMPTY_MOVES[candidates])
+        if empty >> 4 & 1:
+            return 4
+        corners = [cell for cell in CORNERS if empty >> cell & 1]
+        return choice(corners) if corners else choice(EMPTY_MOVES[empty])
+    return move
+
+
+def perfect_strategy(rng, table_path=None):
+    """
+    점수 표로 가장 좋은 수 중 무작위
+    국면(대칭 변환 전 키)별 가장 좋은 수 목록을 한 번 구해 두고 이후에는 사전 조회만 함
+    """
+    player = PerfectPlayer.load_or_solve(table_path or DEFAULT_TABLE)
+    best_moves = {}
+    choice = rng.choice
+
+    def move(state):
+        key = state.x | state.o << SIZE
+        moves = best_moves.get(key)
+        if moves is None:
+            scores = player.move_scores(state)
+            best = max(scores.values())
+            moves = best_moves[key] = tuple(cell for cell, score in scores.items() if score == best)
+        return choice(moves)
+    return move
+
+
+STRATEGIES = {
+    "random": random_strategy,
+    "heuristic": heuristic_strategy,
+    "perfect": perfect_strategy,
+}
+
+
+def play_batch(x_name, o_name, games, seed, batch, table_path=None):
+    """
+    한 묶음 대국 (프로세스 풀 작업자에서 실행)
+    반환: ({"X": 승, "O": 승, "draw": 무}, {둔 수: 판 수})
+    """
+    rng = random.Random(f"{seed}:{batch}")
+    players = (STRATEGIES[x_name](rng, table_path), STRATEGIES[o_name](rng, table_path))
+    results = {"X": 0, "O": 0, "draw": 0}
+    lengths = [0] * (SIZE + 1)
+    state = GameState()
+    history = state.history
+    for _ in range(games):
+        while True:
+            state.play(players[len(history) & 1](state))
+            if WINNING[state.x]:
+                outcome = "X"
+                break
+            if WINNING[state.o]:
+                outcome = "O"
+                break
+            if state.x | state.o == FULL:
+                outcome = "draw"
+                break
+        results[outcome] += 1
+        lengths[len(history)] += 1
+        state.x = state.o = 0
+        history.clear()
+    return results, {length: n for length, n in enumerate(lengths) if n}
+
+
+def simulate(x_name, o_name, games, workers=None, batch_size=10000, seed=0, table_path=None):
+    """
+    games판을 batch_size판씩 나누어 실행하고 합친 결과 반환
+    workers: 프로세스 수 (1이면 현재 프로세스에서 차례로 실행, None이면 CPU 수)
+    """
+    for name in (x_name, o_name):
+        if name not in STRATEGIES:
+            raise ValueError(f"알 수 없는 전략입니다: {name}")
+    if games <= 0 or batch_size <= 0:
+        raise ValueError("대국 수와 묶음 크기는 1 이상이어야 합니다.")
+    if "perfect" in (x_name, o_name):
+        # 작업자마다 표를 푸는 대신 표 파일을 한 번 만들어 두고 모두 불러오게 함
+        PerfectPlayer.load_or_solve(table_path or DEFAULT_TABLE)
+    sizes = [min(batch_size, games - start) for start in range(0, games, batch_size)]
+    jobs = [(x_name, o_name, size, seed, batch, table_path) for batch, size in enumerate(sizes)]
+
+    start = time.perf_counter()
+    if workers == 1:
+        batches = [play_batch(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            batches = list(pool.map(play_batch, *zip(*jobs)))
+    elapsed = time.perf_counter() - start
+
+    results = Counter()
+    lengths = Counter()
+    for batch_results, batch_lengths in batches:
+        results.update(batch_results)
+        lengths.update(batch_lengths)
+    return {
+        "x": x_name,
+        "o": o_name,
+        "games": games,
+        "x_win": results["X"],
+        "draw": results["draw"],
+        "x_loss": results["O"],
+        "lengths": dict(sorted(lengths.items())),
+        "seconds": elapsed,
+        "games_per_second": games / elapsed if elapsed else None,
+    }
+
+
+def print_report(report):
+    games = report["games"]
+    print(f"X: {report['x']}  vs  O: {report['o']}  ({games:,}판, {report['seconds']:.2f}초, "
+          f"{report['games_per_second']:,.0f}판/초)")
+    for label, key in (("X 승", "x_win"), ("무승부", "draw"), ("X 패", "x_loss")):
+        print(f"  {label:<5}{report[key]:>12,}  {report[key] / games:7.2%}")
+    print("  대국 길이 (둔 수):")
+    widest = max(report["lengths"].values())
+    for length, n in report["lengths"].items():
+        print(f"    {length}수 {n:>12,}  {'#' * max(1, round(n / widest * 40))}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="틱택토 전략끼리 자동 대국")
+    parser.add_argument("--x", choices=STRATEGIES, default="perfect", help="먼저 두는 쪽 전략")
+    parser.add_argument("--o", choices=STRATEGIES, default="random", help="나중에 두는 쪽 전략")
+    parser.add_argument("--games", type=int, default=1000000)
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--table", default=None, help="완벽한 수 점수 표 파일")
+    args = parser.parse_args(argv)
+    if args.games <= 0:
+        parser.error("--games는 1 이상이어야 합니다.")
+    if args.batch_size <= 0:
+        parser.error("--batch-size는 1 이상이어야 합니다.")
+
+    print_report(simulate(args.x, args.o, args.games, args.workers, args.batch_size, args.seed, args.table))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,229 @@
+##############################
+# 프로그램명: 틱택토 게임 서버 (asyncio)
+# 작성일: 2026-10-18
+# 프로그램 설명:
+#   - 프로세스 하나에서 여러 사용자의 틱택토 게임을 동시에 진행하는 TCP 서버
+#   - 연결 하나가 세션 하나이며 세션마다 자기 GameState를 가짐 (전역 보드 없음)
+#   - 컴퓨터의 수는 모든 세션이 같은 전략 객체를 공유 (완벽한 수 점수 표는 서버 시작 때 한 번 불러옴)
+#   - 한 줄 명령 프로토콜 (UTF-8, 줄바꿈으로 구분):
+#       NEW [random|heuristic|perfect]  -> BOARD <9칸> PLAY     (새 게임, 사용자가 X로 먼저 둠)
+#       MOVE <1~9>                      -> BOARD <9칸> PLAY|WIN|LOSE|DRAW  (컴퓨터 수까지 둔 뒤)
+#       QUIT                            -> BYE
+#       잘못된 명령                       -> ERR <이유>
+#     9칸은 왼쪽 위부터 X / O / . (빈칸)
+#   - 세션 시간 제한: 명령을 idle_timeout초 동안 보내지 않으면 TIMEOUT 후 연결 종료
+#     정리 작업이 session_timeout초를 넘긴 세션도 주기적으로 끊음 (조금씩 보내며 오래 붙잡는 연결 방지)
+#   - 동시 세션이 max_sessions를 넘으면 ERR busy로 거절
+#
+# 사용 예:
+#   python tictactoe_server.py --port 8765 --strategy perfect
+#   (다른 터미널) nc localhost 8765  ->  NEW perfect / MOVE 5 ...
+##############################
+
+import argparse
+import asyncio
+import itertools
+import logging
+import random
+import time
+
+from tictactoe_engine import WINNING, GameState
+from tictactoe_selfplay import STRATEGIES
+
+logger = logging.getLogger("tictactoe.server")
+
+MAX_LINE = 64       # 명령 한 줄 최대 길이 (바이트)
+
+
+def board_text(state):
+    return "".join("." if cell == " " else cell for cell in state.cells())
+
+
+class Session:
+    __slots__ = ("session_id", "writer", "state", "strategy", "started", "last_active", "games")
+
+    def __init__(self, session_id, writer, strategy):
+        self.session_id = session_id
+        self.writer = writer
+        self.state = GameState()
+        self.strategy = strategy
+        self.started = time.monotonic()
+        self.last_active = self.started
+        self.games = 0
+
+
+class GameServer:
+    def __init__(self, host="127.0.0.1", port=8765, strategy="perfect", max_sessions=10000,
+                 idle_timeout=30.0, session_timeout=600.0, seed=None, table_path=None):
+        """
+        strategy: NEW에서 전략을 고르지 않았을 때 쓸 컴퓨터 전략 (tictactoe_selfplay.STRATEGIES)
+        idle_timeout: 명령 사이 최대 대기 시간 (초), session_timeout: 세션 최대 유지 시간 (초)
+        """
+        if strategy not in STRATEGIES:
+            raise ValueError(f"알 수 없는 전략입니다: {strategy}")
+        self.host = host
+        self.port = port
+        self.default_strategy = strategy
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.session_timeout = session_timeout
+        self.table_path = table_path
+        # 이벤트 루프 하나에서만 쓰므로 난수 생성기와 전략 객체를 세션끼리 공유해도 안전
+        self.rng = random.Random(seed)
+        self.strategies = {}
+        self.sessions = {}
+        self.stats = {"sessions": 0, "rejected": 0, "timed_out": 0, "evicted": 0, "games": 0, "moves": 0}
+        self._ids = itertools.count(1)
+        self._server = None
+        self._reaper = None
+
+    def strategy(self, name):
+        """전략 객체는 이름마다 한 번만 만듦 (perfect는 점수 표를 이때 불러옴)"""
+        strategy = self.strategies.get(name)
+        if strategy is None:
+            strategy = self.strategies[name] = STRATEGIES[name](self.rng, self.table_path)
+        return strategy
+
+    async def start(self):
+        self.strategy(self.default_strategy)
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_LINE * 4,
+                                                  backlog=1024)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._reaper = asyncio.create_task(self._reap())
+        logger.info(f"Listening on {self.host}:{self.port}")
+        return self
+
+    async def close(self):
+        if self._reaper is not None:
+            self._reaper.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for session in list(self.sessions.values()):
+            session.writer.close()
+
+    async def serve_forever(self):
+        await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def _reap(self):
+        """세션 최대 유지 시간을 넘긴 세션을 주기적으로 끊음"""
+        interval = min(1.0, self.session_timeout / 4)
+        while True:
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            for session in list(self.sessions.values()):
+                if now - session.started > self.session_timeout:
+                    self.stats["evicted"] += 1
+                    self.sessions.pop(session.session_id, None)
+                    session.writer.close()
+
+    async def _handle(self, reader, writer):
+        if len(self.sessions) >= self.max_sessions:
+            self.stats["rejected"] += 1
+            writer.write(b"ERR busy\n")
+            writer.close()
+            return
+        session = Session(next(self._ids), writer, self.strategy(self.default_strategy))
+        self.sessions[session.session_id] = session
+        self.stats["sessions"] += 1
+        try:
+            writer.write(f"HELLO {session.session_id}\n".encode())
+            while True:
+                try:
+                    line = await asyncio.wait_for(reader.readline(), self.idle_timeout)
+                except asyncio.TimeoutError:
+                    self.stats["timed_out"] += 1
+                    writer.write(b"TIMEOUT\n")
+                    break
+                except (ValueError, asyncio.LimitOverrunError):
+                    writer.write(b"ERR line too long\n")
+                    break
+                if not line:
+                    break
+                session.last_active = time.monotonic()
+                reply = self.execute(session, line.decode("utf-8", "replace").split())
+                writer.write(reply.encode() + b"\n")
+                if reply == "BYE":
+                    break
+                # 보낼 내용이 쌓여 있을 때만 기다림 (느린 클라이언트가 서버 메모리를 채우지 않도록)
+                if writer.transport.get_write_buffer_size() > 65536:
+                    await writer.drain()
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.sessions.pop(session.session_id, None)
+            writer.close()
+
+    def execute(self, session, words):
+        """명령 한 줄 처리 후 응답 문자열 반환 (입출력 없음)"""
+        if not words:
+            return "ERR empty command"
+        command = words[0].upper()
+        if command == "NEW":
+            name = words[1].lower() if len(words) > 1 else self.default_strategy
+            if name not in STRATEGIES:
+                return f"ERR unknown strategy {name}"
+            session.strategy = self.strategy(name)
+            session.state = GameState()
+            session.games += 1
+            self.stats["games"] += 1
+            return f"BOARD {board_text(session.state)} PLAY"
+        if command == "MOVE":
+            return self._move(session, words)
+        if command == "QUIT":
+            return "BYE"
+        return f"ERR unknown command {words[0]}"
+
+    def _move(self, session, words):
+        state = session.state
+        if state.is_over():
+            return "ERR game over, send NEW"
+        # isdigit()은 "²" 같은 유니코드 숫자도 통과시키므로 int()로 직접 바꿔 봄
+        try:
+            cell = int(words[1]) - 1 if len(words) == 2 else -1
+        except ValueError:
+            cell = -1
+        if not state.is_empty(cell):
+            return "ERR move must be an empty cell 1-9"
+        state.play(cell)
+        self.stats["moves"] += 1
+        if not state.is_over():
+            state.play(session.strategy(state))
+        return f"BOARD {board_text(state)} {self._status(state)}"
+
+    @staticmethod
+    def _status(state):
+        # 사용자가 X, 컴퓨터가 O
+        if WINNING[state.x]:
+            return "WIN"
+        if WINNING[state.o]:
+            return "LOSE"
+        if state.is_full():
+            return "DRAW"
+        return "PLAY"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="틱택토 게임 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--strategy", choices=STRATEGIES, default="perfect", help="기본 컴퓨터 전략")
+    parser.add_argument("--max-sessions", type=int, default=10000)
+    parser.add_argument("--idle-timeout", type=float, default=30.0, help="명령 사이 최대 대기 시간 (초)")
+    parser.add_argument("--session-timeout", type=float, default=600.0, help="세션 최대 유지 시간 (초)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    server = GameServer(args.host, args.port, args.strategy, args.max_sessions, args.idle_timeout,
+                        args.session_timeout)
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        logger.info(f"Stopped: {server.stats}")
+
+
+if __name__ == "__main__":
+    main()
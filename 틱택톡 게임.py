@@ -1,71 +1,87 @@
+import os  # 점수 표 파일 경로를 만들기 위해
 import random  # 랜덤한 수를 생성하기 위해
 
-board = [" " for _ in range(9)]  # 3x3 틱택토 보드를 리스트로 초기화 (총 9칸, 빈칸 " "으로 설정)
+from tictactoe_ai import PerfectPlayer  # 지지 않는 수를 두는 컴퓨터 (알파-베타 탐색 + 점수 표)
+from tictactoe_engine import GameState  # 보드 상태와 승리/무승부 판정 (비트보드)
 
-def print_board():  
+TABLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "tictactoe_table.bin")  # 미리 풀어 둔 점수 표
+
+def print_board(state):
     """현재 보드 상태를 출력하는 함수"""
+    board = state.cells()  # 9칸 문자열 목록
     for i in range(0, 9, 3):  # 3칸씩 출력하여 3x3 형태 유지
         print(f"{board[i]} | {board[i+1]} | {board[i+2]}")  # 가로줄 출력
         if i < 6:  # 마지막 줄을 제외하고 구분선 출력
             print("--+---+--")
 
-def check_winner(player):
+def check_winner(state, player):
     """승리 조건을 확인하는 함수"""
-    win_cases = [  
-        (0, 1, 2), (3, 4, 5), (6, 7, 8),  # 가로 줄 승리 조건
-        (0, 3, 6), (1, 4, 7), (2, 5, 8),  # 세로 줄 승리 조건
-        (0, 4, 8), (2, 4, 6)              # 대각선 승리 조건
-    ]
-    return any(board[a] == board[b] == board[c] == player for a, b, c in win_cases)  
-    # 주어진 플레이어가 위의 조건 중 하나를 만족하면 승리 
+    return state.has_won(player)  # 가로/세로/대각선 8줄 중 하나를 완성했으면 승리 (미리 계산한 표 조회)
 
-def is_draw():
+def is_draw(state):
     """무승부(보드가 꽉 찼는지) 확인하는 함수"""
-    return " " not in board  # 빈칸이 없으면 무승부
+    return state.is_full()  # 빈칸이 없으면 무승부
 
-def player_move():
+def player_move(state):
     """플레이어가 위치를 입력하고 보드를 업데이트하는 함수"""
     while True:  # 올바른 입력이 들어올 때까지 반복
         try:
             move = int(input("원하는 위치 (1~9) 입력: ")) - 1  # 1~9 입력을 받아 0~8 인덱스로 변환
-            if board[move] == " ":  # 빈칸이면
-                board[move] = "X"  # "X"를 해당 위치에 배치
+            if not 0 <= move < 9:  # 범위 초과 입력
+                raise IndexError
+            if state.is_empty(move):  # 빈칸이면
+                state.play(move)  # "X"를 해당 위치에 배치
                 break  # 입력 성공 시 반복 종료
             else:
                 print("이미 선택된 자리입니다. 다시 입력하세요.")  # 이미 채워진 경우 재입력 요청
         except (ValueError, IndexError):  # 숫자가 아닌 값 입력 또는 범위 초과 입력 방지
             print("1~9 사이의 숫자를 입력하세요.")
 
-def computer_move():
-    """컴퓨터가 무작위로 빈칸을 선택하는 함수"""
-    empty_positions = [i for i in range(9) if board[i] == " "]  # 빈칸 리스트 생성
+def computer_move(state, opponent=None):
+    """컴퓨터가 빈칸을 선택하는 함수 (opponent가 없으면 무작위, 있으면 그 컴퓨터가 고른 수)"""
+    if opponent is not None:
+        state.play(opponent.best_move(state))  # 점수 표에서 가장 좋은 수를 찾아 배치
+        return
+    empty_positions = list(state.legal_moves())  # 빈칸 리스트 생성
     move = random.choice(empty_positions)  # 무작위로 하나 선택
-    board[move] = "O"  # "O"를 해당 위치에 배치
+    state.play(move)  # "O"를 해당 위치에 배치
+
+def choose_opponent():
+    """컴퓨터 상대를 고르는 함수 (완벽한 수를 고르면 점수 표를 불러옴, 없으면 한 번 풀어서 저장)"""
+    while True:
+        choice = input("컴퓨터 상대 선택 (1: 무작위, 2: 완벽한 수): ").strip()
+        if choice == "1":
+            return None
+        if choice == "2":
+            return PerfectPlayer.load_or_solve(TABLE_FILE, random.Random())  # 같은 점수의 수 중에서는 무작위
+        print("1 또는 2를 입력하세요.")
 
 def main():
     """게임을 실행하는 함수"""
+    state = GameState()  # 새 게임 (플레이어 X가 먼저 둠)
     print("틱택토 게임을 시작합니다!")  # 시작 메시지 출력
-    print_board()  # 초기 보드 출력
+    opponent = choose_opponent()  # 컴퓨터 상대 선택
+    print_board(state)  # 초기 보드 출력
 
     while True:  # 게임 루프 (승리 또는 무승부가 발생할 때까지 반복)
-        player_move()  # 플레이어 차례
-        print_board()  # 보드 출력
-        if check_winner("X"):  # 플레이어 승리 확인
-            print("플레이어 승리!")  
+        player_move(state)  # 플레이어 차례
+        print_board(state)  # 보드 출력
+        if check_winner(state, "X"):  # 플레이어 승리 확인
+            print("플레이어 승리!")
             break  # 승리 시 종료
-        if is_draw():  # 무승부 확인
-            print("무승부!")  
+        if is_draw(state):  # 무승부 확인
+            print("무승부!")
             break  # 무승부 시 종료
 
-        print("\n컴퓨터 차례...")  
-        computer_move()  # 컴퓨터 차례
-        print_board()  # 보드 출력
-        if check_winner("O"):  # 컴퓨터 승리 확인
-            print("컴퓨터 승리!")  
+        print("\n컴퓨터 차례...")
+        computer_move(state, opponent)  # 컴퓨터 차례
+        print_board(state)  # 보드 출력
+        if check_winner(state, "O"):  # 컴퓨터 승리 확인
+            print("컴퓨터 승리!")
             break  # 승리 시 종료
-        if is_draw():  # 무승부 확인
-            print("무승부!")  
+        if is_draw(state):  # 무승부 확인
+            print("무승부!")
             break  # 무승부 시 종료
 
-if __name__ == "__main__":  
-    main()  # 스크립트가 직접 실행될 때만 main() 호출 
+if __name__ == "__main__":
+    main()  # 스크립트가 직접 실행될 때만 main() 호출